@@ -0,0 +1,58 @@
+import argparse
+import asyncio
+import json
+import time
+
+import httpx
+
+from benchmarks.common import seed_advertisements
+from main import app
+from src.db.base import AsyncSessionLocal
+from src.db.models import Category
+
+
+async def main(args):
+    token = await seed_advertisements(0)
+    async with AsyncSessionLocal() as session:
+        category_id = (await session.execute(Category.__table__.select())).first().id
+
+    items = [
+        {
+            "name": f"Feed item {i}",
+            "descriptions": "Created by benchmarks.adv_batch",
+            "price": i,
+            "category_id": category_id,
+        }
+        for i in range(args.size)
+    ]
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app),
+        base_url="http://bench",
+        headers={"Authorization": f"Bearer {token}"},
+        timeout=None,
+    ) as client:
+        timings = []
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            response = await client.post("/adv/batch", json=items)
+            timings.append(time.perf_counter() - started)
+            response.raise_for_status()
+
+    best = min(timings)
+    print(
+        json.dumps(
+            {
+                "name": "POST /adv/batch",
+                "batch_size": args.size,
+                "best_seconds": round(best, 3),
+                "rows_per_second": round(args.size / best, 1),
+            }
+        )
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Пакетное создание объявлений")
+    parser.add_argument("--size", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=3)
+    asyncio.run(main(parser.parse_args()))
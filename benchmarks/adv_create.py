@@ -0,0 +1,43 @@
+import argparse
+import asyncio
+import json
+
+import httpx
+
+from benchmarks.common import run_load, seed_advertisements
+from main import app
+from src.db.base import AsyncSessionLocal
+from src.db.models import Category
+
+
+async def main(args):
+    token = await seed_advertisements(0)
+    async with AsyncSessionLocal() as session:
+        category_id = (await session.execute(Category.__table__.select())).first().id
+
+    payload = {
+        "name": "Benchmark advertisement",
+        "descriptions": "Created by benchmarks.adv_create",
+        "price": 100,
+        "category_id": category_id,
+    }
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app),
+        base_url="http://bench",
+        headers={"Authorization": f"Bearer {token}"},
+    ) as client:
+        result = await run_load(
+            "POST /adv/",
+            client,
+            lambda c: c.post("/adv/", json=payload),
+            args.concurrency,
+            args.duration,
+        )
+    print(json.dumps(result, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Пропускная способность POST /adv/")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=15)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,86 @@
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+
+import httpx
+
+from benchmarks.common import seed_advertisements
+
+
+def rss_mb(pid: int) -> float:
+    with open(f"/proc/{pid}/status") as status:
+        for line in status:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+
+async def main(args):
+    token = await seed_advertisements(args.seed)
+
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--port", str(args.port)],
+        env=os.environ.copy(),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        async with httpx.AsyncClient(
+            base_url=f"http://127.0.0.1:{args.port}",
+            headers={"Authorization": f"Bearer {token}"},
+            timeout=None,
+        ) as client:
+            for _ in range(50):
+                try:
+                    await client.get("/docs")
+                    break
+                except httpx.ConnectError:
+                    await asyncio.sleep(0.2)
+
+            idle_rss = rss_mb(server.pid)
+            peak_rss = idle_rss
+            rows = 0
+            started = time.perf_counter()
+            async with client.stream(
+                "GET", "/adv/export", params={"format": args.format}
+            ) as response:
+                response.raise_for_status()
+                async for line in response.aiter_lines():
+                    rows += 1
+                    if rows % 10000 == 0:
+                        peak_rss = max(peak_rss, rss_mb(server.pid))
+            elapsed = time.perf_counter() - started
+    finally:
+        server.terminate()
+        server.wait()
+
+    if args.format == "csv":
+        rows -= 1
+    print(
+        json.dumps(
+            {
+                "name": f"GET /adv/export?format={args.format}",
+                "rows": rows,
+                "seconds": round(elapsed, 2),
+                "rows_per_second": round(rows / elapsed, 1),
+                "idle_rss_mb": round(idle_rss, 1),
+                "peak_rss_mb": round(peak_rss, 1),
+                "rss_ceiling_mb": args.max_rss_mb,
+            }
+        )
+    )
+    if peak_rss > args.max_rss_mb:
+        sys.exit(f"Peak RSS {peak_rss:.1f} MB exceeds {args.max_rss_mb} MB")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Потоковая выгрузка объявлений")
+    parser.add_argument("--seed", type=int, default=1_000_000)
+    parser.add_argument("--format", choices=["ndjson", "csv"], default="ndjson")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--max-rss-mb", type=float, default=150)
+    asyncio.run(main(parser.parse_args()))
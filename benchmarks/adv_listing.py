@@ -0,0 +1,35 @@
+import argparse
+import asyncio
+import json
+
+import httpx
+
+from benchmarks.common import run_load, seed_advertisements
+
+
+async def main(args):
+    token = await seed_advertisements(args.seed)
+    headers = {"Authorization": f"Bearer {token}"}
+
+    async with httpx.AsyncClient(
+        base_url=args.url,
+        headers=headers,
+        limits=httpx.Limits(max_connections=args.concurrency),
+    ) as client:
+        result = await run_load(
+            "GET /adv/",
+            client,
+            lambda c: c.get("/adv/", params={"size": 20, "sort_by_create": True}),
+            args.concurrency,
+            args.duration,
+        )
+    print(json.dumps(result, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Нагрузочный тест GET /adv/")
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument("--seed", type=int, default=10000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=20)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,81 @@
+import argparse
+import asyncio
+import json
+import time
+
+import httpx
+from sqlalchemy import text
+
+from benchmarks.common import percentile, run_load
+from main import app
+from src.db.base import dispose_engine, get_engine
+from src.utils.security import create_access_token
+
+# Первая страница по рейтингу: по сводке в объявлении и по агрегату отзывов
+PAGE_QUERIES = {
+    "rating_avg": (
+        "SELECT id FROM advertisements "
+        "WHERE deleted_at IS NULL AND NOT hidden "
+        "ORDER BY rating_avg DESC NULLS LAST, id DESC LIMIT 20"
+    ),
+    "avg(reviews.rating)": (
+        "SELECT a.id FROM advertisements AS a "
+        "LEFT JOIN (SELECT adv_id, avg(rating) AS rating FROM reviews "
+        "WHERE deleted_at IS NULL AND NOT hidden GROUP BY adv_id) AS r "
+        "ON r.adv_id = a.id "
+        "WHERE a.deleted_at IS NULL AND NOT a.hidden "
+        "ORDER BY r.rating DESC NULLS LAST, a.id DESC LIMIT 20"
+    ),
+}
+
+
+async def time_query(sql: str, repeat: int) -> dict:
+    latencies = []
+    async with get_engine().connect() as conn:
+        for _ in range(repeat):
+            started = time.perf_counter()
+            await conn.execute(text(sql))
+            latencies.append(time.perf_counter() - started)
+    return {
+        "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+    }
+
+
+async def main(args):
+    get_engine()
+    for name, sql in PAGE_QUERIES.items():
+        result = await time_query(sql, args.repeat)
+        print(json.dumps({"name": f"ORDER BY {name}", **result}, ensure_ascii=False))
+
+    token = create_access_token({"id": args.user_id})
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app),
+        base_url="http://bench",
+        headers={"Authorization": f"Bearer {token}"},
+        timeout=None,
+    ) as client:
+        result = await run_load(
+            "GET /adv/?sort_by_rating=true",
+            client,
+            lambda client: client.get(
+                "/adv/", params={"sort_by_rating": True, "size": 20}
+            ),
+            args.concurrency,
+            args.duration,
+        )
+        print(json.dumps(result, ensure_ascii=False))
+    await dispose_engine()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Сортировка объявлений по средней оценке"
+    )
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--duration", type=float, default=10)
+    parser.add_argument(
+        "--user-id", type=int, default=2, help="Пользователь из benchmarks.datagen"
+    )
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,52 @@
+import argparse
+import asyncio
+import json
+
+import httpx
+
+from benchmarks.common import run_load
+from benchmarks.datagen import DATASET_PASSWORD, user_email
+from main import app
+from src.db.base import dispose_engine
+
+
+async def main(args):
+    form = {"username": user_email(2), "password": DATASET_PASSWORD}
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://bench"
+    ) as client:
+        login = await run_load(
+            "POST /auth/login",
+            client,
+            lambda c: c.post("/auth/login", data=form),
+            args.concurrency,
+            args.duration,
+        )
+        print(json.dumps(login, ensure_ascii=False))
+
+        tokens = []
+        for _ in range(args.concurrency):
+            response = await client.post("/auth/login", data=form)
+            tokens.append(response.json()["refresh_token"])
+
+        async def rotate(c):
+            token = tokens.pop()
+            response = await c.post("/auth/refresh", json={"refresh_token": token})
+            tokens.append(response.json().get("refresh_token", token))
+            return response
+
+        refresh = await run_load(
+            "POST /auth/refresh", client, rotate, args.concurrency, args.duration
+        )
+        print(json.dumps(refresh, ensure_ascii=False))
+    await dispose_engine()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Вход по паролю против обновления по refresh-токену, "
+        "данные из benchmarks.datagen"
+    )
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=10)
+    asyncio.run(main(parser.parse_args()))
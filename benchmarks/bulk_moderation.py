@@ -0,0 +1,164 @@
+import argparse
+import asyncio
+import json
+import time
+from typing import List, Tuple
+
+import httpx
+from sqlalchemy import select, text
+
+from main import app
+from src.db.base import AsyncSessionLocal, dispose_engine, get_engine
+from src.db.complaint_stats import refresh_complaint_stats
+from src.db.models import Category, Complaint, Review, User
+from src.utils.security import create_access_token
+
+
+async def seed(rows: int) -> Tuple[int, int]:
+    """Создает rows объявлений и по одному отзыву и одной жалобе спамера на
+    каждое. Возвращает id спамера и администратора."""
+    async with AsyncSessionLocal() as session:
+        owner = User(
+            name="Owner",
+            surname="User",
+            email=f"owner-{time.time()}@bench.example.com",
+            hashed_password="not-a-hash",
+            is_admin=True,
+        )
+        spammer = User(
+            name="Spammer",
+            surname="User",
+            email=f"spammer-{time.time()}@bench.example.com",
+            hashed_password="not-a-hash",
+        )
+        category = Category(name=f"Bulk Bench {time.time()}")
+        session.add_all([owner, spammer, category])
+        await session.flush()
+
+        params = {"owner": owner.id, "spammer": spammer.id, "category": category.id}
+        await session.execute(
+            text(
+                "INSERT INTO advertisements "
+                "(user_id, category_id, name, descriptions, price) "
+                "SELECT :owner, :category, 'Advertisement ' || g, 'Bench', g "
+                "FROM generate_series(1, CAST(:rows AS integer)) AS g"
+            ),
+            {**params, "rows": rows},
+        )
+        for table in ("reviews", "complaints"):
+            await session.execute(
+                text(
+                    f"INSERT INTO {table} (description, adv_id, user_id) "
+                    "SELECT 'Spam', id, :spammer FROM advertisements "
+                    "WHERE user_id = :owner"
+                ),
+                params,
+            )
+        await refresh_complaint_stats(session)
+        await session.commit()
+        await session.execute(text("ANALYZE"))
+        await session.commit()
+        return spammer.id, owner.id
+
+
+async def spam_ids(model, spammer_id: int) -> List[int]:
+    async with AsyncSessionLocal() as session:
+        result = await session.execute(
+            select(model.id).where(model.user_id == spammer_id)
+        )
+        return result.scalars().all()
+
+
+async def timed(coro) -> Tuple[float, httpx.Response]:
+    started = time.perf_counter()
+    response = await coro
+    response.raise_for_status()
+    return time.perf_counter() - started, response
+
+
+async def main(args):
+    get_engine()
+    spammer_id, admin_id = await seed(args.rows)
+    token = create_access_token({"id": admin_id, "is_admin": True})
+    headers = {"Authorization": f"Bearer {token}"}
+    results = []
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app),
+        base_url="http://bench",
+        timeout=None,
+    ) as client:
+        for path, model in (("/complaint", Complaint), ("/review", Review)):
+            ids = await spam_ids(model, spammer_id)
+            for action in ("delete", "restore"):
+                elapsed, response = await timed(
+                    client.post(
+                        f"{path}/bulk",
+                        json={"action": action, "ids": ids},
+                        headers=headers,
+                    )
+                )
+                results.append(
+                    {
+                        "name": f"POST {path}/bulk ids",
+                        "action": action,
+                        "affected": response.json()["affected"],
+                        "seconds": round(elapsed, 2),
+                    }
+                )
+            elapsed, response = await timed(
+                client.post(
+                    f"{path}/bulk",
+                    json={"action": "delete", "user_id": spammer_id},
+                    headers=headers,
+                )
+            )
+            results.append(
+                {
+                    "name": f"POST {path}/bulk user_id",
+                    "action": "delete",
+                    "affected": response.json()["affected"],
+                    "seconds": round(elapsed, 2),
+                }
+            )
+
+            if args.compare_single:
+                await client.post(
+                    f"{path}/bulk",
+                    json={"action": "restore", "user_id": spammer_id},
+                    headers=headers,
+                )
+                started = time.perf_counter()
+                for row_id in ids[: args.compare_single]:
+                    response = await client.delete(f"{path}/{row_id}", headers=headers)
+                    response.raise_for_status()
+                elapsed = time.perf_counter() - started
+                results.append(
+                    {
+                        "name": f"DELETE {path}/{{id}}",
+                        "action": "delete",
+                        "affected": args.compare_single,
+                        "seconds": round(elapsed, 2),
+                        "seconds_for_all_rows": round(
+                            elapsed / args.compare_single * len(ids), 1
+                        ),
+                    }
+                )
+    await dispose_engine()
+
+    for result in results:
+        print(json.dumps(result))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Массовое удаление и восстановление жалоб и отзывов"
+    )
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument(
+        "--compare-single",
+        type=int,
+        default=0,
+        help="Удалить столько строк по одной через DELETE для сравнения",
+    )
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,78 @@
+import argparse
+import asyncio
+import json
+import time
+from typing import Tuple
+
+import httpx
+from sqlalchemy import select
+
+from benchmarks.common import seed_advertisements
+from main import app
+from src.config import settings
+from src.db.base import AsyncSessionLocal, dispose_engine
+from src.db.models import Category, User
+from src.utils.security import create_access_token
+
+
+async def prepare() -> Tuple[int, int, int]:
+    async with AsyncSessionLocal() as session:
+        source_id = await session.scalar(
+            select(Category.id).where(Category.name == "Bench Category")
+        )
+        target = Category(name=f"Bench Target {time.time()}")
+        admin = User(
+            name="Bench",
+            surname="Admin",
+            email=f"admin-{time.time()}@bench.example.com",
+            hashed_password="not-a-hash",
+            is_admin=True,
+        )
+        session.add_all([target, admin])
+        await session.commit()
+        return source_id, target.id, admin.id
+
+
+async def main(args):
+    settings.category_reassign_batch_size = args.batch_size
+    await seed_advertisements(args.ads)
+    source_id, target_id, admin_id = await prepare()
+
+    token = create_access_token({"id": admin_id, "is_admin": True})
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app),
+        base_url="http://bench",
+        timeout=None,
+    ) as client:
+        started = time.perf_counter()
+        response = await client.delete(
+            f"/category/{source_id}",
+            params={"reassign_to": target_id},
+            headers={"Authorization": f"Bearer {token}"},
+        )
+        elapsed = time.perf_counter() - started
+    response.raise_for_status()
+    await dispose_engine()
+
+    print(
+        json.dumps(
+            {
+                "name": "DELETE /category/{cat_id}?reassign_to=",
+                "moved": response.json()["moved"],
+                "batch_size": args.batch_size,
+                "seconds": round(elapsed, 2),
+                "seconds_per_batch": round(
+                    elapsed / max(response.json()["moved"] / args.batch_size, 1), 3
+                ),
+            }
+        )
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Удаление категории с переносом объявлений в другую"
+    )
+    parser.add_argument("--ads", type=int, default=200000)
+    parser.add_argument("--batch-size", type=int, default=5000)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,88 @@
+import asyncio
+import time
+from typing import Awaitable, Callable, List
+
+import httpx
+from sqlalchemy import select, text
+
+from src.db.base import AsyncSessionLocal, get_engine
+from src.db.models import Category, User
+from src.utils.security import create_access_token
+
+BENCH_EMAIL = "bench@example.com"
+
+
+def percentile(values: List[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(int(round(q / 100 * (len(ordered) - 1))), len(ordered) - 1)
+    return ordered[index]
+
+
+def summarize(name: str, latencies: List[float], errors: int, elapsed: float) -> dict:
+    return {
+        "name": name,
+        "requests": len(latencies),
+        "errors": errors,
+        "seconds": round(elapsed, 3),
+        "rps": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+    }
+
+
+async def run_load(
+    name: str,
+    client: httpx.AsyncClient,
+    send: Callable[[httpx.AsyncClient], Awaitable[httpx.Response]],
+    concurrency: int,
+    duration: float,
+) -> dict:
+    latencies: List[float] = []
+    errors = 0
+    stop_at = time.perf_counter() + duration
+
+    async def worker():
+        nonlocal errors
+        while time.perf_counter() < stop_at:
+            started = time.perf_counter()
+            response = await send(client)
+            latencies.append(time.perf_counter() - started)
+            if response.status_code >= 400:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return summarize(name, latencies, errors, time.perf_counter() - started)
+
+
+async def seed_advertisements(count: int) -> str:
+    get_engine()
+    async with AsyncSessionLocal() as session:
+        user = await session.scalar(select(User).where(User.email == BENCH_EMAIL))
+        if user is None:
+            user = User(
+                name="Bench",
+                surname="User",
+                email=BENCH_EMAIL,
+                hashed_password="not-a-hash",
+            )
+            category = Category(name="Bench Category")
+            session.add_all([user, category])
+            await session.flush()
+
+            await session.execute(
+                text(
+                    "INSERT INTO advertisements "
+                    "(user_id, category_id, name, descriptions, price) "
+                    "SELECT :user_id, :category_id, 'Advertisement ' || g, "
+                    "'Benchmark advertisement', g % 10000 "
+                    "FROM generate_series(1, :count) AS g"
+                ),
+                {"user_id": user.id, "category_id": category.id, "count": count},
+            )
+            await session.commit()
+
+    return create_access_token({"id": user.id, "is_admin": False})
@@ -0,0 +1,82 @@
+import argparse
+import asyncio
+import json
+
+import httpx
+from sqlalchemy import select
+
+from benchmarks.common import run_load
+from main import app
+from src.db.base import AsyncSessionLocal, dispose_engine, get_engine
+from src.db.models import ComplaintStats, User
+from src.schemas.paginate import encode_cursor
+from src.utils.security import create_access_token
+
+ADMIN_EMAIL = "queue-admin@bench.example.com"
+
+
+async def admin_token() -> str:
+    async with AsyncSessionLocal() as session:
+        admin = await session.scalar(select(User).where(User.email == ADMIN_EMAIL))
+        if admin is None:
+            admin = User(
+                name="Bench",
+                surname="Admin",
+                email=ADMIN_EMAIL,
+                hashed_password="not-a-hash",
+                is_admin=True,
+            )
+            session.add(admin)
+            await session.commit()
+        return create_access_token({"id": admin.id, "is_admin": True})
+
+
+async def cursor_at(offset: int) -> str:
+    async with AsyncSessionLocal() as session:
+        row = (
+            await session.execute(
+                select(ComplaintStats.rank, ComplaintStats.adv_id)
+                .order_by(ComplaintStats.rank.desc(), ComplaintStats.adv_id.desc())
+                .offset(offset)
+                .limit(1)
+            )
+        ).one()
+        return encode_cursor(row)
+
+
+async def main(args):
+    get_engine()
+    token = await admin_token()
+    deep_cursor = await cursor_at(args.deep_offset)
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app),
+        base_url="http://bench",
+        headers={"Authorization": f"Bearer {token}"},
+    ) as client:
+        for name, params in (
+            ("GET /complaint/queue", {"size": 50}),
+            (
+                f"GET /complaint/queue (после {args.deep_offset} строк)",
+                {"size": 50, "cursor": deep_cursor},
+            ),
+        ):
+            result = await run_load(
+                name,
+                client,
+                lambda c, params=params: c.get("/complaint/queue", params=params),
+                args.concurrency,
+                args.duration,
+            )
+            print(json.dumps(result, ensure_ascii=False))
+    await dispose_engine()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Очередь модерации по данным benchmarks.datagen"
+    )
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--duration", type=float, default=10)
+    parser.add_argument("--deep-offset", type=int, default=500000)
+    asyncio.run(main(parser.parse_args()))
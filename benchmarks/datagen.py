@@ -0,0 +1,171 @@
+import argparse
+import asyncio
+import json
+import time
+
+from sqlalchemy import text
+
+from src.db.base import AsyncSessionLocal, create_tables, dispose_engine, get_engine
+from src.db.complaint_stats import refresh_complaint_stats
+from src.db.ratings import refresh_ratings
+from src.db.models import Advertisement, Category, Complaint, Review, User
+from src.utils.security import get_password_hash
+
+DATASET_PASSWORD = "bench-password"
+DATASET_EPOCH = "2025-01-01 00:00:00+00"
+EMAIL_DOMAIN = "bench.example.com"
+
+TABLES = (Complaint, Review, Advertisement, Category, User)
+
+
+def mix(value, salt: int, modulo: int):
+    """Детерминированно отображает номер строки в диапазон [0, modulo).
+
+    Принимает как int, так и SQL-выражение в виде строки, чтобы сценарии
+    могли вычислить те же значения, что и генератор, не обращаясь к базе.
+    """
+    if isinstance(value, int):
+        return (value * 2654435761 + salt * 40503) % modulo
+    return f"(({value}::bigint * 2654435761 + {salt * 40503}) % {modulo})"
+
+
+def owner_of(adv_id: int, users: int, seed: int) -> int:
+    return 1 + mix(adv_id, seed + 1, users)
+
+
+def timestamp(salt: int) -> str:
+    return (
+        f"TIMESTAMPTZ '{DATASET_EPOCH}' "
+        f"- {mix('g', salt, 365 * 24 * 3600)} * INTERVAL '1 second'"
+    )
+
+
+def user_email(user_id: int) -> str:
+    return f"user{user_id}@{EMAIL_DOMAIN}"
+
+
+def statements(scale: dict, seed: int):
+    users = scale[User.__tablename__]
+    categories = scale[Category.__tablename__]
+    ads = scale[Advertisement.__tablename__]
+    yield User.__tablename__, (
+        f"INSERT INTO {User.__tablename__} "
+        "(name, surname, email, hashed_password, is_admin, is_banned, created_at) "
+        "SELECT 'User ' || g, 'Bench', "
+        f"'user' || g || '@{EMAIL_DOMAIN}', "
+        f":hashed_password, g = 1, false, {timestamp(seed)} "
+        "FROM generate_series(CAST(:start AS integer), CAST(:stop AS integer)) AS g"
+    )
+    yield Category.__tablename__, (
+        f"INSERT INTO {Category.__tablename__} (name) "
+        "SELECT 'Category ' || g FROM generate_series(CAST(:start AS integer), CAST(:stop AS integer)) AS g"
+    )
+    yield Advertisement.__tablename__, (
+        f"INSERT INTO {Advertisement.__tablename__} "
+        "(user_id, category_id, name, descriptions, price, created_at, updated_at) "
+        f"SELECT 1 + {mix('g', seed + 1, users)}, "
+        f"1 + {mix('g', seed + 2, categories)}, "
+        "'Advertisement ' || g, 'Generated advertisement ' || g, "
+        f"{mix('g', seed + 3, 100000)}, {timestamp(seed + 4)}, "
+        f"{timestamp(seed + 4)} + {mix('g', seed + 5, 3600)} * INTERVAL '1 second' "
+        "FROM generate_series(CAST(:start AS integer), CAST(:stop AS integer)) AS g"
+    )
+    # Оценка 1-5, у каждого шестого отзыва ее нет
+    rating = f"NULLIF({mix('g', seed + 10, 6)}, 0)"
+    # Повторная пара пользователь-объявление для отзыва пропускается
+    for model, salt, extra, conflict in (
+        (Review, 6, {"rating": rating}, " ON CONFLICT DO NOTHING"),
+        (Complaint, 8, {}, ""),
+    ):
+        yield model.__tablename__, (
+            f"INSERT INTO {model.__tablename__} "
+            "(description, adv_id, user_id, created_at, updated_at"
+            + "".join(f", {column}" for column in extra)
+            + ") "
+            f"SELECT 'Generated {model.__tablename__} ' || g, "
+            f"1 + {mix('g', seed + salt, ads)}, "
+            f"1 + {mix('g', seed + salt + 1, users)}, "
+            f"{timestamp(seed + salt)}, {timestamp(seed + salt)}"
+            + "".join(f", {value}" for value in extra.values())
+            + " FROM generate_series(CAST(:start AS integer), CAST(:stop AS integer)) AS g"
+            + conflict
+        )
+
+
+async def generate(scale: dict, seed: int, chunk_size: int = 1_000_000) -> dict:
+    """Пересоздает данные бенчмарка; одинаковые scale и seed дают одинаковые строки"""
+    await create_tables()
+    hashed_password = get_password_hash(DATASET_PASSWORD)
+
+    async with get_engine().begin() as conn:
+        await conn.execute(
+            text(
+                "TRUNCATE "
+                + ", ".join(model.__tablename__ for model in TABLES)
+                + " RESTART IDENTITY CASCADE"
+            )
+        )
+
+    for table, statement in statements(scale, seed):
+        count = scale[table]
+        started = time.perf_counter()
+        for start in range(1, count + 1, chunk_size):
+            stop = min(start + chunk_size - 1, count)
+            async with get_engine().begin() as conn:
+                await conn.execute(
+                    text(statement),
+                    {
+                        "start": start,
+                        "stop": stop,
+                        "hashed_password": hashed_password,
+                    },
+                )
+            print(
+                f"{table}: {stop}/{count}, "
+                f"{stop / (time.perf_counter() - started):.0f} rows/s",
+                flush=True,
+            )
+
+    started = time.perf_counter()
+    async with AsyncSessionLocal() as session:
+        await refresh_complaint_stats(session)
+        await session.commit()
+    print(f"complaint_stats: {time.perf_counter() - started:.1f}s", flush=True)
+
+    started = time.perf_counter()
+    async with AsyncSessionLocal() as session:
+        await refresh_ratings(session)
+        await session.commit()
+    print(f"ratings: {time.perf_counter() - started:.1f}s", flush=True)
+
+    async with get_engine().begin() as conn:
+        await conn.execute(text("ANALYZE"))
+
+    return {**scale, "seed": seed}
+
+
+async def main(args):
+    scale = {
+        User.__tablename__: args.users,
+        Category.__tablename__: args.categories,
+        Advertisement.__tablename__: args.ads,
+        Review.__tablename__: args.reviews,
+        Complaint.__tablename__: args.complaints,
+    }
+    try:
+        dataset = await generate(scale, args.seed, args.chunk_size)
+    finally:
+        await dispose_engine()
+    print(json.dumps(dataset))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Генератор данных для бенчмарков")
+    parser.add_argument("--users", type=int, default=10_000)
+    parser.add_argument("--categories", type=int, default=50)
+    parser.add_argument("--ads", type=int, default=100_000)
+    parser.add_argument("--reviews", type=int, default=200_000)
+    parser.add_argument("--complaints", type=int, default=20_000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--chunk-size", type=int, default=1_000_000)
+    asyncio.run(main(parser.parse_args()))
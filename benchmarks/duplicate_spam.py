@@ -0,0 +1,104 @@
+import argparse
+import asyncio
+import json
+import time
+
+import httpx
+from sqlalchemy import text
+
+from benchmarks.common import run_load
+from main import app
+from src.config import settings
+from src.db.base import AsyncSessionLocal, dispose_engine, get_engine
+from src.db.models import Advertisement, Category, User
+from src.utils.security import create_access_token
+
+
+async def seed() -> tuple:
+    """Объявление владельца и пользователь, который его спамит. Возвращает id
+    объявления и спамера."""
+    async with AsyncSessionLocal() as session:
+        owner = User(
+            name="Owner",
+            surname="User",
+            email=f"owner-{time.time()}@bench.example.com",
+            hashed_password="not-a-hash",
+        )
+        spammer = User(
+            name="Spammer",
+            surname="User",
+            email=f"spammer-{time.time()}@bench.example.com",
+            hashed_password="not-a-hash",
+        )
+        category = Category(name=f"Spam Bench {time.time()}")
+        adv = Advertisement(
+            name="Advertisement",
+            descriptions="Bench",
+            price=1,
+            user=owner,
+            categories=category,
+        )
+        session.add_all([owner, spammer, category, adv])
+        await session.commit()
+        return adv.id, spammer.id
+
+
+async def table_state(table: str, adv_id: int) -> dict:
+    async with AsyncSessionLocal() as session:
+        rows = await session.scalar(
+            text(f"SELECT count(*) FROM {table} WHERE adv_id = :adv_id"),
+            {"adv_id": adv_id},
+        )
+        wal = await session.scalar(
+            text("SELECT pg_wal_lsn_diff(pg_current_wal_lsn(), '0/0')")
+        )
+        return {"rows": rows, "wal": wal}
+
+
+async def main(args):
+    get_engine()
+    scenarios = (
+        ("POST /review/{id}", "reviews", args.window),
+        ("POST /complaint/{id}", "complaints", args.window),
+        ("POST /complaint/{id} без окна", "complaints", 0),
+    )
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app),
+        base_url="http://bench",
+        timeout=None,
+    ) as client:
+        for name, table, window in scenarios:
+            settings.complaint_dedup_window = window
+            adv_id, spammer_id = await seed()
+            token = create_access_token({"id": spammer_id})
+            path = f"/{table[:-1]}/{adv_id}"
+            before = await table_state(table, adv_id)
+            result = await run_load(
+                name,
+                client,
+                lambda client, path=path, token=token: client.post(
+                    path,
+                    json={"description": "Buy cheap followers"},
+                    headers={"Authorization": f"Bearer {token}"},
+                ),
+                args.concurrency,
+                args.duration,
+            )
+            after = await table_state(table, adv_id)
+            result["rows_added"] = after["rows"] - before["rows"]
+            result["wal_kb"] = round((after["wal"] - before["wal"]) / 1024)
+            print(json.dumps(result, ensure_ascii=False))
+    await dispose_engine()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Повторные отзывы и жалобы одного пользователя на объявление"
+    )
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=10)
+    parser.add_argument(
+        "--window", type=int, default=86400, help="complaint_dedup_window, с"
+    )
+    asyncio.run(main(parser.parse_args()))
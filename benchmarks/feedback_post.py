@@ -0,0 +1,94 @@
+import argparse
+import asyncio
+import itertools
+import json
+import time
+
+import httpx
+from sqlalchemy import event, text
+
+from benchmarks.common import run_load
+from main import app
+from src.db.base import AsyncSessionLocal, dispose_engine, get_engine
+from src.db.models import Category, User
+from src.utils.security import create_access_token
+
+
+async def seed(ads: int) -> tuple:
+    """ads объявлений владельца и автор, который оставляет на каждое по
+    одному отзыву и одной жалобе. Возвращает id объявлений и автора."""
+    async with AsyncSessionLocal() as session:
+        owner = User(
+            name="Owner",
+            surname="User",
+            email=f"owner-{time.time()}@bench.example.com",
+            hashed_password="not-a-hash",
+        )
+        author = User(
+            name="Author",
+            surname="User",
+            email=f"author-{time.time()}@bench.example.com",
+            hashed_password="not-a-hash",
+        )
+        category = Category(name=f"Feedback Bench {time.time()}")
+        session.add_all([owner, author, category])
+        await session.flush()
+
+        result = await session.execute(
+            text(
+                "INSERT INTO advertisements "
+                "(user_id, category_id, name, descriptions, price) "
+                "SELECT :owner, :category, 'Advertisement ' || g, 'Bench', g "
+                "FROM generate_series(1, CAST(:ads AS integer)) AS g "
+                "RETURNING id"
+            ),
+            {"owner": owner.id, "category": category.id, "ads": ads},
+        )
+        adv_ids = result.scalars().all()
+        await session.commit()
+        await session.execute(text("ANALYZE"))
+        await session.commit()
+        return adv_ids, author.id
+
+
+async def main(args):
+    statements = 0
+
+    def count_statement(*_):
+        nonlocal statements
+        statements += 1
+
+    event.listen(get_engine().sync_engine, "before_cursor_execute", count_statement)
+    adv_ids, author_id = await seed(args.ads)
+    headers = {"Authorization": f"Bearer {create_access_token({'id': author_id})}"}
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app),
+        base_url="http://bench",
+        headers=headers,
+    ) as client:
+        for path in ("/review", "/complaint"):
+            targets = itertools.cycle(adv_ids)
+            statements = 0
+            result = await run_load(
+                f"POST {path}/{{adv_id}}",
+                client,
+                lambda client, path=path, targets=targets: client.post(
+                    f"{path}/{next(targets)}", json={"description": "Bench"}
+                ),
+                args.concurrency,
+                args.duration,
+            )
+            result["statements_per_request"] = round(statements / result["requests"], 1)
+            print(json.dumps(result, ensure_ascii=False))
+    await dispose_engine()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Создание отзывов и жалоб на разные объявления"
+    )
+    parser.add_argument("--ads", type=int, default=100000)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=10)
+    asyncio.run(main(parser.parse_args()))
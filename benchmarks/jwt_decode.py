@@ -0,0 +1,76 @@
+import argparse
+import json
+import timeit
+from datetime import datetime, timedelta
+
+import jwt
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519, rsa
+
+ALGORITHMS = {
+    "ES256": lambda: ec.generate_private_key(ec.SECP256R1()),
+    "EdDSA": ed25519.Ed25519PrivateKey.generate,
+    "RS256": lambda: rsa.generate_private_key(public_exponent=65537, key_size=2048),
+}
+
+
+def public_pem(private_key) -> bytes:
+    return private_key.public_key().public_bytes(
+        serialization.Encoding.PEM,
+        serialization.PublicFormat.SubjectPublicKeyInfo,
+    )
+
+
+def measure(token: str, key, algorithm: str, number: int) -> float:
+    seconds = min(
+        timeit.repeat(
+            lambda: jwt.decode(token, key, algorithms=[algorithm]),
+            number=number,
+            repeat=5,
+        )
+    )
+    return round(seconds / number * 1_000_000, 1)
+
+
+def main(args):
+    payload = {
+        "sub": "1",
+        "id": 1,
+        "is_admin": 0,
+        "is_banned": 0,
+        "exp": datetime.utcnow() + timedelta(hours=1),
+    }
+    secret = "s" * 64
+    token = jwt.encode(payload, secret, algorithm="HS256")
+    print(
+        json.dumps(
+            {
+                "algorithm": "HS256",
+                "key": "secret",
+                "us": measure(token, secret, "HS256", args.number),
+            }
+        )
+    )
+
+    for algorithm, generate in ALGORITHMS.items():
+        private_key = generate()
+        token = jwt.encode(payload, private_key, algorithm=algorithm)
+        for name, key in (
+            ("object", private_key.public_key()),
+            ("pem", public_pem(private_key)),
+        ):
+            result = {
+                "algorithm": algorithm,
+                "key": name,
+                "us": measure(token, key, algorithm, args.number),
+            }
+            print(json.dumps(result))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Стоимость проверки токена по алгоритмам: готовый объект "
+        "ключа против PEM, разбираемого при каждом вызове"
+    )
+    parser.add_argument("--number", type=int, default=2000)
+    main(parser.parse_args())
@@ -0,0 +1,116 @@
+import argparse
+import asyncio
+import json
+import time
+
+import httpx
+from sqlalchemy import select, text
+
+from benchmarks.common import run_load
+from main import app
+from src.db.base import AsyncSessionLocal, dispose_engine, get_engine
+from src.db.models import Category, User
+from src.routers.me.me_paging import created_at_key
+from src.schemas.paginate import encode_cursor
+from src.utils.security import create_access_token
+
+SECTIONS = (
+    ("/me/adv", "advertisements"),
+    ("/me/reviews", "reviews"),
+    ("/me/complaints", "complaints"),
+)
+
+
+async def seed(rows: int) -> int:
+    """Пользователь с rows объявлениями и rows отзывами и жалобами на них,
+    созданными с интервалом в минуту. Возвращает id пользователя."""
+    async with AsyncSessionLocal() as session:
+        user = User(
+            name="Me",
+            surname="User",
+            email=f"me-{time.time()}@bench.example.com",
+            hashed_password="not-a-hash",
+        )
+        category = Category(name=f"Me Bench {time.time()}")
+        session.add_all([user, category])
+        await session.flush()
+
+        params = {"user": user.id, "category": category.id, "rows": rows}
+        await session.execute(
+            text(
+                "INSERT INTO advertisements "
+                "(user_id, category_id, name, descriptions, price, created_at) "
+                "SELECT :user, :category, 'Advertisement ' || g, 'Bench', g, "
+                "now() - g * interval '1 minute' "
+                "FROM generate_series(1, CAST(:rows AS integer)) AS g"
+            ),
+            params,
+        )
+        for table in ("reviews", "complaints"):
+            await session.execute(
+                text(
+                    f"INSERT INTO {table} (description, adv_id, user_id, created_at) "
+                    "SELECT 'Bench', id, :user, created_at FROM advertisements "
+                    "WHERE user_id = :user"
+                ),
+                params,
+            )
+        await session.commit()
+        await session.execute(text("ANALYZE"))
+        await session.commit()
+        return user.id
+
+
+async def cursor_at(table: str, user_id: int, offset: int) -> str:
+    async with AsyncSessionLocal() as session:
+        row = (
+            await session.execute(
+                text(
+                    f"SELECT created_at, id FROM {table} WHERE user_id = :user "
+                    "ORDER BY created_at DESC, id DESC OFFSET :offset LIMIT 1"
+                ),
+                {"user": user_id, "offset": offset},
+            )
+        ).one()
+        return encode_cursor(created_at_key(row))
+
+
+async def main(args):
+    get_engine()
+    user_id = await seed(args.rows)
+    token = create_access_token({"id": user_id})
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app),
+        base_url="http://bench",
+        headers={"Authorization": f"Bearer {token}"},
+    ) as client:
+        for path, table in SECTIONS:
+            deep_cursor = await cursor_at(table, user_id, args.deep_offset)
+            for name, params in (
+                (f"GET {path}", {"size": 50}),
+                (
+                    f"GET {path} (после {args.deep_offset} строк)",
+                    {"size": 50, "cursor": deep_cursor},
+                ),
+            ):
+                result = await run_load(
+                    name,
+                    client,
+                    lambda client, params=params: client.get(path, params=params),
+                    args.concurrency,
+                    args.duration,
+                )
+                print(json.dumps(result, ensure_ascii=False))
+    await dispose_engine()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Списки своих объявлений, отзывов и жалоб по курсору"
+    )
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--duration", type=float, default=5)
+    parser.add_argument("--deep-offset", type=int, default=150000)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,263 @@
+import argparse
+import asyncio
+import itertools
+import json
+import random
+import subprocess
+from datetime import datetime, timezone
+from typing import List
+
+import httpx
+from sqlalchemy import func, select
+
+from benchmarks.common import run_load
+from benchmarks.datagen import DATASET_PASSWORD, owner_of, user_email
+from src.db.base import dispose_engine, get_engine
+from src.db.models import Advertisement, Category, User
+from src.utils.security import create_access_token
+
+FILTERS = {
+    "min_price": 25000,
+    "max_price": 75000,
+    "category": "Category 1",
+}
+SORTS = (
+    None,
+    "sort_by_create",
+    "sort_by_update",
+    "price_ascending",
+    "price_descending",
+)
+
+
+def listing_params() -> List[dict]:
+    """Все сочетания фильтров и сортировок GET /adv/"""
+    combinations = []
+    for size in range(len(FILTERS) + 1):
+        for names in itertools.combinations(FILTERS, size):
+            for sort in SORTS:
+                params = {name: FILTERS[name] for name in names}
+                if sort:
+                    params[sort] = True
+                combinations.append(params)
+    return combinations
+
+
+def describe(params: dict) -> str:
+    return "+".join(params) or "no filters"
+
+
+class Dataset:
+    def __init__(
+        self, users: int, ads: int, category_id: int, seed: int, rng: random.Random
+    ):
+        self.users = users
+        self.ads = ads
+        self.category_id = category_id
+        self.seed = seed
+        self.rng = rng
+        self.tokens = {}
+
+    def token(self, user_id: int) -> str:
+        if user_id not in self.tokens:
+            self.tokens[user_id] = create_access_token(
+                {"id": user_id, "is_admin": user_id == 1}
+            )
+        return self.tokens[user_id]
+
+    def headers(self, user_id: int = None) -> dict:
+        user_id = user_id or self.rng.randint(2, self.users)
+        return {"Authorization": f"Bearer {self.token(user_id)}"}
+
+    def random_ad(self) -> int:
+        return self.rng.randint(1, self.ads)
+
+    def reviewer_of(self, adv_id: int) -> int:
+        owner = owner_of(adv_id, self.users, self.seed)
+        return owner % self.users + 1
+
+
+async def load_dataset(seed: int) -> Dataset:
+    async with get_engine().connect() as conn:
+        users = await conn.scalar(select(func.max(User.id)))
+        ads = await conn.scalar(select(func.max(Advertisement.id)))
+        category_id = await conn.scalar(select(func.min(Category.id)))
+    if not users or not ads:
+        raise SystemExit("Dataset is empty, run python -m benchmarks.datagen first")
+    return Dataset(users, ads, category_id, seed, random.Random(seed))
+
+
+async def listing(client, dataset: Dataset, args) -> List[dict]:
+    results = []
+    for params in listing_params():
+        query = {**params, "size": 20}
+        results.append(
+            await run_load(
+                f"GET /adv/ [{describe(params)}]",
+                client,
+                lambda c, query=query: c.get(
+                    "/adv/", params=query, headers=dataset.headers()
+                ),
+                args.concurrency,
+                args.listing_duration,
+            )
+        )
+    return results
+
+
+async def detail(client, dataset: Dataset, args) -> List[dict]:
+    return [
+        await run_load(
+            "GET /adv/{id}",
+            client,
+            lambda c: c.get(f"/adv/{dataset.random_ad()}", headers=dataset.headers()),
+            args.concurrency,
+            args.duration,
+        )
+    ]
+
+
+async def login(client, dataset: Dataset, args) -> List[dict]:
+    def send(c):
+        user_id = dataset.rng.randint(1, dataset.users)
+        return c.post(
+            "/auth/login",
+            data={"username": user_email(user_id), "password": DATASET_PASSWORD},
+        )
+
+    return [
+        await run_load(
+            "POST /auth/login", client, send, args.concurrency, args.duration
+        )
+    ]
+
+
+async def mixed(client, dataset: Dataset, args) -> List[dict]:
+    listings = listing_params()
+
+    def send(c):
+        choice = dataset.rng.random()
+        if choice < 0.6:
+            query = {**dataset.rng.choice(listings), "size": 20}
+            return c.get("/adv/", params=query, headers=dataset.headers())
+        if choice < 0.85:
+            return c.get(f"/adv/{dataset.random_ad()}", headers=dataset.headers())
+        if choice < 0.95:
+            return c.post(
+                "/adv/",
+                json={
+                    "name": "Benchmark advertisement",
+                    "descriptions": "Created by benchmarks.suite",
+                    "price": dataset.rng.randint(0, 100000),
+                    "category_id": dataset.category_id,
+                },
+                headers=dataset.headers(),
+            )
+        adv_id = dataset.random_ad()
+        return c.post(
+            f"/review/{adv_id}",
+            json={"description": "Benchmark review"},
+            headers=dataset.headers(dataset.reviewer_of(adv_id)),
+        )
+
+    return [
+        await run_load(
+            "mixed 85% read / 15% write", client, send, args.concurrency, args.duration
+        )
+    ]
+
+
+SCENARIOS = {
+    "listing": listing,
+    "detail": detail,
+    "login": login,
+    "mixed": mixed,
+}
+
+
+def current_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(baseline: dict, report: dict):
+    previous = {result["name"]: result for result in baseline["scenarios"]}
+    for result in report["scenarios"]:
+        before = previous.get(result["name"])
+        if before is None or not before["rps"]:
+            continue
+        change = (result["rps"] - before["rps"]) / before["rps"] * 100
+        print(
+            f"{result['name']}: {before['rps']} -> {result['rps']} rps "
+            f"({change:+.1f}%), p95 {before['p95_ms']} -> {result['p95_ms']} ms"
+        )
+
+
+async def main(args):
+    try:
+        dataset = await load_dataset(args.seed)
+        if args.url:
+            client = httpx.AsyncClient(
+                base_url=args.url,
+                limits=httpx.Limits(max_connections=args.concurrency),
+                timeout=None,
+            )
+        else:
+            from main import app
+
+            client = httpx.AsyncClient(
+                transport=httpx.ASGITransport(app=app),
+                base_url="http://bench",
+                timeout=None,
+            )
+
+        results = []
+        async with client:
+            for name in args.scenarios:
+                for result in await SCENARIOS[name](client, dataset, args):
+                    print(json.dumps(result, ensure_ascii=False), flush=True)
+                    results.append(result)
+    finally:
+        await dispose_engine()
+
+    report = {
+        "commit": current_commit(),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "target": args.url or "asgi",
+        "concurrency": args.concurrency,
+        "dataset": {"users": dataset.users, "ads": dataset.ads, "seed": args.seed},
+        "scenarios": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as output:
+        json.dump(report, output, ensure_ascii=False, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as baseline:
+            compare(json.load(baseline), report)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Набор нагрузочных сценариев")
+    parser.add_argument(
+        "--url", help="Адрес запущенного сервера, по умолчанию ASGITransport"
+    )
+    parser.add_argument(
+        "--scenarios",
+        nargs="+",
+        choices=list(SCENARIOS),
+        default=list(SCENARIOS),
+    )
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=10)
+    parser.add_argument("--listing-duration", type=float, default=2)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", default="benchmark-results.json")
+    parser.add_argument("--baseline", help="Отчет предыдущего запуска для сравнения")
+    asyncio.run(main(parser.parse_args()))
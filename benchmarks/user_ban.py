@@ -0,0 +1,107 @@
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+from typing import Tuple
+
+import httpx
+from sqlalchemy import false, func, select
+
+from benchmarks.common import BENCH_EMAIL, seed_advertisements
+from src.db.base import AsyncSessionLocal, dispose_engine
+from src.db.models import Advertisement, User
+from src.utils.security import create_access_token
+
+ADMIN_EMAIL = "bench-admin@example.com"
+
+
+async def prepare() -> Tuple[int, str]:
+    async with AsyncSessionLocal() as session:
+        target_id = await session.scalar(
+            select(User.id).where(User.email == BENCH_EMAIL)
+        )
+        admin = await session.scalar(select(User).where(User.email == ADMIN_EMAIL))
+        if admin is None:
+            admin = User(
+                name="Bench",
+                surname="Admin",
+                email=ADMIN_EMAIL,
+                hashed_password="not-a-hash",
+                is_admin=True,
+            )
+            session.add(admin)
+            await session.commit()
+        return target_id, create_access_token({"id": admin.id, "is_admin": True})
+
+
+async def visible_ads(user_id: int) -> int:
+    async with AsyncSessionLocal() as session:
+        return await session.scalar(
+            select(func.count()).where(
+                Advertisement.user_id == user_id, Advertisement.hidden == false()
+            )
+        )
+
+
+async def measure(client: httpx.AsyncClient, path: str, user_id: int, done) -> dict:
+    started = time.perf_counter()
+    response = await client.patch(path)
+    response.raise_for_status()
+    responded = time.perf_counter() - started
+    while not done(await visible_ads(user_id)):
+        await asyncio.sleep(0.05)
+    return {
+        "name": f"PATCH {path.rsplit('/', 1)[0]}",
+        "response_ms": round(responded * 1000, 1),
+        "propagation_seconds": round(time.perf_counter() - started, 2),
+    }
+
+
+async def main(args):
+    await seed_advertisements(args.ads)
+    target_id, token = await prepare()
+
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--port", str(args.port)],
+        env=os.environ.copy(),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        async with httpx.AsyncClient(
+            base_url=f"http://127.0.0.1:{args.port}",
+            headers={"Authorization": f"Bearer {token}"},
+            timeout=None,
+        ) as client:
+            for _ in range(50):
+                try:
+                    await client.get("/docs")
+                    break
+                except httpx.ConnectError:
+                    await asyncio.sleep(0.2)
+
+            ban = await measure(
+                client, f"/user/ban/{target_id}", target_id, lambda n: n == 0
+            )
+            unban = await measure(
+                client, f"/user/unban/{target_id}", target_id, lambda n: n == args.ads
+            )
+    finally:
+        server.terminate()
+        server.wait()
+        await dispose_engine()
+
+    for result in (ban, unban):
+        print(json.dumps({**result, "ads": args.ads}, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Время ответа бана и время скрытия контента пользователя"
+    )
+    parser.add_argument("--ads", type=int, default=100000)
+    parser.add_argument("--port", type=int, default=8765)
+    asyncio.run(main(parser.parse_args()))
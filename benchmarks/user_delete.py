@@ -0,0 +1,138 @@
+import argparse
+import asyncio
+import json
+import time
+import tracemalloc
+from typing import Tuple
+
+import httpx
+from sqlalchemy import delete, select, text
+
+from main import app
+from src.db.base import AsyncSessionLocal, dispose_engine, get_engine
+from src.db.models import Category, User
+from src.utils.security import create_access_token
+
+
+async def seed(ads: int, with_feedback: bool) -> Tuple[int, int]:
+    """Создает пользователя с ads объявлениями; при with_feedback на каждое
+    объявление приходится по отзыву и жалобе администратора. Возвращает id
+    владельца и администратора."""
+    async with AsyncSessionLocal() as session:
+        owner = User(
+            name="Owner",
+            surname="User",
+            email="owner@bench.example.com",
+            hashed_password="not-a-hash",
+        )
+        author = User(
+            name="Author",
+            surname="User",
+            email="author@bench.example.com",
+            hashed_password="not-a-hash",
+            is_admin=True,
+        )
+        category = Category(name="Delete Bench")
+        session.add_all([owner, author, category])
+        await session.flush()
+
+        params = {"owner": owner.id, "author": author.id, "category": category.id}
+        await session.execute(
+            text(
+                "INSERT INTO advertisements "
+                "(user_id, category_id, name, descriptions, price) "
+                "SELECT :owner, :category, 'Advertisement ' || g, 'Bench', g "
+                "FROM generate_series(1, CAST(:ads AS integer)) AS g"
+            ),
+            {**params, "ads": ads},
+        )
+        if with_feedback:
+            for table in ("reviews", "complaints"):
+                await session.execute(
+                    text(
+                        f"INSERT INTO {table} (description, adv_id, user_id) "
+                        "SELECT 'Bench', id, :author FROM advertisements "
+                        "WHERE user_id = :owner"
+                    ),
+                    params,
+                )
+        await session.commit()
+        await session.execute(text("ANALYZE"))
+        await session.commit()
+        return owner.id, author.id
+
+
+async def cleanup():
+    async with AsyncSessionLocal() as session:
+        for table in ("reviews", "complaints", "advertisements"):
+            await session.execute(text(f"DELETE FROM {table}"))
+        await session.execute(delete(Category).where(Category.name == "Delete Bench"))
+        await session.execute(
+            delete(User).where(User.email.like("%@bench.example.com"))
+        )
+        await session.commit()
+
+
+async def delete_via_endpoint(user_id: int, admin_id: int):
+    token = create_access_token({"id": admin_id, "is_admin": True})
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://bench"
+    ) as client:
+        response = await client.delete(
+            f"/user/{user_id}", headers={"Authorization": f"Bearer {token}"}
+        )
+        assert response.status_code == 204, response.text
+
+
+async def delete_via_orm(user_id: int, admin_id: int):
+    """Прежний способ: загрузка пользователя и session.delete с каскадом ORM"""
+    async with AsyncSessionLocal() as session:
+        user = await session.scalar(select(User).where(User.id == user_id))
+        await session.delete(user)
+        await session.commit()
+
+
+async def measure(name: str, ads: int, with_feedback: bool, remove) -> dict:
+    await cleanup()
+    user_id, admin_id = await seed(ads, with_feedback)
+    tracemalloc.start()
+    started = time.perf_counter()
+    await remove(user_id, admin_id)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "name": name,
+        "ads": ads,
+        "feedback": with_feedback,
+        "seconds": round(elapsed, 2),
+        "peak_mb": round(peak / 1024 / 1024, 1),
+    }
+
+
+async def main(args):
+    get_engine()
+    results = [
+        await measure("set-based", args.ads, True, delete_via_endpoint),
+        await measure("set-based", args.ads, False, delete_via_endpoint),
+    ]
+    if args.compare_orm:
+        results.append(await measure("orm", args.ads, False, delete_via_orm))
+    await cleanup()
+    for result in results:
+        print(json.dumps(result, ensure_ascii=False))
+    await dispose_engine()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Удаление пользователя с большим числом объявлений"
+    )
+    parser.add_argument("--ads", type=int, default=50000)
+    parser.add_argument(
+        "--compare-orm",
+        action="store_true",
+        help="Дополнительно замерить session.delete с каскадом ORM "
+        "(без отзывов и жалоб, иначе он падает на внешнем ключе)",
+    )
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,9 @@
+from src.config import settings
+
+bind = f"{settings.web_host}:{settings.web_port}"
+workers = settings.web_workers
+worker_class = "uvicorn_worker.UvicornWorker"
+keepalive = settings.web_keepalive
+backlog = settings.web_backlog
+graceful_timeout = int(settings.shutdown_timeout) + 5
+preload_app = True
@@ -1,9 +1,10 @@
 from fastapi.responses import JSONResponse
-import uvicorn
 from fastapi import FastAPI, Request
 
 from src.config import settings
-from src.utils.tg import bot
+from src.utils.lifespan import in_flight, lifespan
+from src.utils.rate_limit import rate_limiter
+from src.utils.tg import get_bot
 
 from src.routers.user import router as user_router
 from src.routers.advertisement import router as adv_router
@@ -11,15 +12,16 @@ from src.routers.category import router as cat_router
 from src.routers.auth import router as auth_router
 from src.routers.complaint import router as comp_router
 from src.routers.review import router as review_router
+from src.routers.me import router as me_router
 from src.utils.logg import logger, log_request_middleware
 
 
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 
 
 @app.exception_handler(Exception)
 async def global_handler(request: Request, exc: Exception):
-    await bot.send_message(
+    await get_bot().send_message(
         chat_id=settings.telegram_chat_id,
         text=f"🔥 Ошибка в {request.url}:\n{str(exc)}",
     )
@@ -28,6 +30,8 @@ async def global_handler(request: Request, exc: Exception):
 
 
 app.middleware("http")(log_request_middleware)
+app.middleware("http")(in_flight.middleware)
+app.middleware("http")(rate_limiter.middleware)
 
 app.include_router(user_router)
 app.include_router(adv_router)
@@ -35,6 +39,9 @@ app.include_router(cat_router)
 app.include_router(auth_router)
 app.include_router(comp_router)
 app.include_router(review_router)
+app.include_router(me_router)
 
 if __name__ == "__main__":
+    import uvicorn
+
     uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
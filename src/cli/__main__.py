@@ -0,0 +1,121 @@
+import argparse
+import asyncio
+import sys
+import time
+from typing import Optional
+
+from src.cli.calibrate import argon2_candidates, bcrypt_candidates, calibrate
+from src.cli.importer import ImportFailed, import_advertisements, import_users
+from src.db.base import dispose_engine
+from src.sevices.purge import purge_deleted
+
+IMPORTERS = {
+    "import-ads": import_advertisements,
+    "import-users": import_users,
+}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m src.cli")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    for name, help_text in (
+        ("import-ads", "Загрузить объявления из NDJSON-файла"),
+        ("import-users", "Загрузить пользователей из NDJSON-файла"),
+    ):
+        command = commands.add_parser(name, help=help_text)
+        command.add_argument("file")
+        command.add_argument("--chunk-size", type=int, default=10000)
+        command.add_argument(
+            "--restart",
+            action="store_true",
+            help="Игнорировать сохраненную контрольную точку",
+        )
+
+    calibrate_command = commands.add_parser(
+        "calibrate-password",
+        help="Подобрать стоимость хеширования паролей под целевое время",
+    )
+    calibrate_command.add_argument(
+        "--scheme", choices=["bcrypt", "argon2"], default="bcrypt"
+    )
+    calibrate_command.add_argument("--target-ms", type=float, default=250)
+    calibrate_command.add_argument(
+        "--memory-cost", type=int, default=65536, help="argon2, КиБ"
+    )
+    calibrate_command.add_argument("--parallelism", type=int, default=4, help="argon2")
+
+    purge_command = commands.add_parser(
+        "purge-deleted",
+        help="Стереть объявления, отзывы и жалобы, удаленные давно",
+    )
+    purge_command.add_argument(
+        "--retention-days", type=int, default=None, help="по умолчанию из настроек"
+    )
+    purge_command.add_argument("--batch-size", type=int, default=None)
+
+    return parser
+
+
+def calibrate_password(args) -> int:
+    if args.scheme == "argon2":
+        candidates = argon2_candidates(args.memory_cost, args.parallelism)
+    else:
+        candidates = bcrypt_candidates()
+
+    params, elapsed = calibrate(candidates, args.target_ms)
+    print(f"Hash takes {elapsed:.1f} ms with:")
+    print(f"password_schemes={args.scheme}")
+    for name, value in params.items():
+        print(f"{name}={value}")
+    return 0
+
+
+async def run_purge(args) -> Optional[int]:
+    try:
+        return await purge_deleted(args.retention_days, args.batch_size)
+    finally:
+        await dispose_engine()
+
+
+def purge(args) -> int:
+    started = time.perf_counter()
+    purged = asyncio.run(run_purge(args))
+    if purged is None:
+        print("Another purge is already running", file=sys.stderr)
+        return 1
+    print(f"Purged {purged} rows in {time.perf_counter() - started:.1f}s")
+    return 0
+
+
+async def run_importer(args) -> int:
+    try:
+        return await IMPORTERS[args.command](
+            args.file, chunk_size=args.chunk_size, restart=args.restart
+        )
+    finally:
+        await dispose_engine()
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.command == "calibrate-password":
+        return calibrate_password(args)
+    if args.command == "purge-deleted":
+        return purge(args)
+
+    started = time.perf_counter()
+    try:
+        imported = asyncio.run(run_importer(args))
+    except ImportFailed as exp:
+        print(
+            f"Import failed at {exp}. Fix the input and re-run to resume",
+            file=sys.stderr,
+        )
+        return 1
+    print(f"Imported {imported} rows in {time.perf_counter() - started:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,50 @@
+import statistics
+import time
+from typing import Dict, Iterator, Tuple
+
+from passlib.hash import argon2, bcrypt
+
+SAMPLE_PASSWORD = "calibration-password"
+
+
+def measure_ms(handler, samples: int = 3) -> float:
+    timings = []
+    for _ in range(samples):
+        started = time.perf_counter()
+        handler.hash(SAMPLE_PASSWORD)
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def bcrypt_candidates() -> Iterator[Tuple[Dict[str, int], object]]:
+    for rounds in range(4, 32):
+        yield {"bcrypt_rounds": rounds}, bcrypt.using(rounds=rounds)
+
+
+def argon2_candidates(
+    memory_cost: int, parallelism: int
+) -> Iterator[Tuple[Dict[str, int], object]]:
+    for time_cost in range(1, 33):
+        yield {
+            "argon2_time_cost": time_cost,
+            "argon2_memory_cost": memory_cost,
+            "argon2_parallelism": parallelism,
+        }, argon2.using(
+            time_cost=time_cost, memory_cost=memory_cost, parallelism=parallelism
+        )
+
+
+def calibrate(candidates, target_ms: float, report=print) -> Tuple[dict, float]:
+    """Возвращает самые дорогие параметры, хеш с которыми укладывается в target_ms.
+
+    Кандидаты перебираются по возрастанию стоимости; если даже самый дешевый
+    дольше цели, возвращается он.
+    """
+    chosen = None
+    for params, handler in candidates:
+        elapsed = measure_ms(handler)
+        report(f"{params}: {elapsed:.1f} ms")
+        if elapsed > target_ms:
+            return chosen or (params, elapsed)
+        chosen = params, elapsed
+    return chosen
@@ -0,0 +1,218 @@
+import json
+import os
+import sys
+import time
+from typing import Awaitable, Callable, Dict, Iterator, List, Tuple, Type
+
+from pydantic import BaseModel, ValidationError
+
+from src.db.base import get_engine
+from src.db.models import Advertisement, Category, User
+from src.dto.adv_dto import AdvertisementImportDTO
+from src.dto.user_dto import UserImportDTO
+from src.utils.security import get_password_hash
+
+ADVERTISEMENT_COLUMNS = tuple(
+    column.name
+    for column in (
+        Advertisement.user_id,
+        Advertisement.category_id,
+        Advertisement.name,
+        Advertisement.descriptions,
+        Advertisement.price,
+    )
+)
+USER_COLUMNS = tuple(
+    column.name
+    for column in (
+        User.name,
+        User.surname,
+        User.email,
+        User.hashed_password,
+        User.is_admin,
+        User.is_banned,
+    )
+)
+
+Chunk = List[Tuple[int, BaseModel]]
+
+
+class ImportFailed(Exception):
+    pass
+
+
+def checkpoint_path(path: str) -> str:
+    return f"{path}.checkpoint"
+
+
+def read_checkpoint(path: str) -> int:
+    try:
+        with open(checkpoint_path(path)) as checkpoint:
+            return json.load(checkpoint)["line"]
+    except FileNotFoundError:
+        return 0
+
+
+def write_checkpoint(path: str, line: int):
+    tmp_path = f"{checkpoint_path(path)}.tmp"
+    with open(tmp_path, "w") as checkpoint:
+        json.dump({"line": line}, checkpoint)
+    os.replace(tmp_path, checkpoint_path(path))
+
+
+def read_chunks(
+    path: str, dto: Type[BaseModel], start_line: int, chunk_size: int
+) -> Iterator[Tuple[int, Chunk]]:
+    chunk = []
+    with open(path, encoding="utf-8") as source:
+        for line_no, line in enumerate(source, start=1):
+            if line_no <= start_line or not line.strip():
+                continue
+            try:
+                chunk.append((line_no, dto.model_validate_json(line)))
+            except ValidationError as exp:
+                detail = "; ".join(
+                    f"{'.'.join(map(str, error['loc']))}: {error['msg']}"
+                    for error in exp.errors()
+                )
+                raise ImportFailed(f"line {line_no}: {detail}")
+            if len(chunk) >= chunk_size:
+                yield line_no, chunk
+                chunk = []
+    if chunk:
+        yield line_no, chunk
+
+
+def print_progress(imported: int, elapsed: float):
+    rate = imported / elapsed if elapsed else 0
+    print(f"{imported} rows, {rate:.0f} rows/s", file=sys.stderr)
+
+
+class AdvertisementLoader:
+    def __init__(self):
+        self.categories: Dict[str, int] = {}
+        self.users: Dict[str, int] = {}
+
+    async def resolve_categories(self, connection, chunk: Chunk):
+        names = list({row.category for _, row in chunk} - self.categories.keys())
+        if not names:
+            return
+        await connection.execute(
+            f"INSERT INTO {Category.__tablename__} (name) "
+            "SELECT unnest($1::text[]) ON CONFLICT (name) DO NOTHING",
+            names,
+        )
+        rows = await connection.fetch(
+            f"SELECT name, id FROM {Category.__tablename__} "
+            "WHERE name = ANY($1::text[])",
+            names,
+        )
+        self.categories.update((row["name"], row["id"]) for row in rows)
+
+    async def resolve_users(self, connection, chunk: Chunk):
+        emails = list(
+            {row.user_email for _, row in chunk if row.user_id is None}
+            - self.users.keys()
+        )
+        if not emails:
+            return
+        rows = await connection.fetch(
+            f"SELECT email, id FROM {User.__tablename__} "
+            "WHERE email = ANY($1::text[])",
+            emails,
+        )
+        self.users.update((row["email"], row["id"]) for row in rows)
+
+    async def __call__(self, connection, chunk: Chunk):
+        await self.resolve_categories(connection, chunk)
+        await self.resolve_users(connection, chunk)
+
+        records = []
+        for line_no, row in chunk:
+            user_id = row.user_id
+            if user_id is None:
+                user_id = self.users.get(row.user_email)
+                if user_id is None:
+                    raise ImportFailed(f"line {line_no}: User not found")
+            records.append(
+                (
+                    user_id,
+                    self.categories[row.category],
+                    row.name,
+                    row.descriptions,
+                    row.price,
+                )
+            )
+
+        await connection.copy_records_to_table(
+            Advertisement.__tablename__,
+            records=records,
+            columns=ADVERTISEMENT_COLUMNS,
+        )
+
+
+async def load_users(connection, chunk: Chunk):
+    records = [
+        (
+            row.name,
+            row.surname,
+            row.email,
+            row.hashed_password or get_password_hash(row.password.get_secret_value()),
+            row.is_admin,
+            row.is_banned,
+        )
+        for _, row in chunk
+    ]
+    await connection.copy_records_to_table(
+        User.__tablename__, records=records, columns=USER_COLUMNS
+    )
+
+
+async def run_import(
+    path: str,
+    dto: Type[BaseModel],
+    load_chunk: Callable[..., Awaitable[None]],
+    chunk_size: int,
+    restart: bool = False,
+    progress: Callable[[int, float], None] = print_progress,
+) -> int:
+    """Загружает NDJSON-файл через COPY, фиксируя каждые chunk_size строк.
+
+    После каждой фиксации номер последней загруженной строки сохраняется в
+    <file>.checkpoint, и повторный запуск продолжает с него.
+    """
+    from asyncpg import PostgresError
+
+    if restart and os.path.exists(checkpoint_path(path)):
+        os.remove(checkpoint_path(path))
+
+    start_line = read_checkpoint(path)
+    imported = 0
+    started = time.perf_counter()
+
+    async with get_engine().connect() as conn:
+        raw = await conn.get_raw_connection()
+        connection = raw.driver_connection
+        for line_no, chunk in read_chunks(path, dto, start_line, chunk_size):
+            try:
+                async with connection.transaction():
+                    await load_chunk(connection, chunk)
+            except PostgresError as exp:
+                raise ImportFailed(f"lines {chunk[0][0]}-{line_no}: {exp}")
+            write_checkpoint(path, line_no)
+            imported += len(chunk)
+            progress(imported, time.perf_counter() - started)
+
+    if os.path.exists(checkpoint_path(path)):
+        os.remove(checkpoint_path(path))
+    return imported
+
+
+async def import_advertisements(path: str, **kwargs) -> int:
+    return await run_import(
+        path, AdvertisementImportDTO, AdvertisementLoader(), **kwargs
+    )
+
+
+async def import_users(path: str, **kwargs) -> int:
+    return await run_import(path, UserImportDTO, load_users, **kwargs)
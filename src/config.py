@@ -13,6 +13,9 @@ class Settings:
             raise ValueError(f"Необходимо указать переменную окружения {var_name}")
         return value
 
+    def _get_optional_env(self, var_name: str, default: str) -> str:
+        return os.getenv(var_name) or default
+
     def override_with_env_vars(self):
 
         self.db_url = self._get_required_env("db_url")
@@ -22,5 +25,72 @@ class Settings:
         self.telegram_bot_token = self._get_required_env("telegram_bot_token")
         self.telegram_chat_id = int(self._get_required_env("telegram_chat_id"))
 
+        self.db_pool_size = int(self._get_optional_env("db_pool_size", "5"))
+        self.db_max_overflow = int(self._get_optional_env("db_max_overflow", "10"))
+        self.db_pool_warmup = int(self._get_optional_env("db_pool_warmup", "2"))
+        self.shutdown_timeout = float(self._get_optional_env("shutdown_timeout", "10"))
+
+        self.web_host = self._get_optional_env("web_host", "0.0.0.0")
+        self.web_port = int(self._get_optional_env("web_port", "8000"))
+        self.web_workers = int(
+            self._get_optional_env("web_workers", str(os.cpu_count() or 1))
+        )
+        self.web_keepalive = int(self._get_optional_env("web_keepalive", "5"))
+        self.web_backlog = int(self._get_optional_env("web_backlog", "2048"))
+
+        self.adv_batch_limit = int(self._get_optional_env("adv_batch_limit", "10000"))
+        self.hide_batch_size = int(self._get_optional_env("hide_batch_size", "1000"))
+        self.purge_window = self._get_optional_env("purge_window", "03:00-05:00")
+        self.purge_retention_days = int(
+            self._get_optional_env("purge_retention_days", "30")
+        )
+        self.purge_batch_size = int(self._get_optional_env("purge_batch_size", "1000"))
+        self.category_reassign_batch_size = int(
+            self._get_optional_env("category_reassign_batch_size", "5000")
+        )
+        self.bulk_moderation_limit = int(
+            self._get_optional_env("bulk_moderation_limit", "100000")
+        )
+        self.complaint_dedup_window = int(
+            self._get_optional_env("complaint_dedup_window", "86400")
+        )
+
+        self.jwt_keys_dir = self._get_optional_env("jwt_keys_dir", "")
+        self.jwt_active_kid = self._get_optional_env("jwt_active_kid", "")
+        self.access_token_expires = int(
+            self._get_optional_env("access_token_expires", str(self.token_expires))
+        )
+        self.refresh_token_expires = int(
+            self._get_optional_env("refresh_token_expires", "30")
+        )
+        self.refresh_reuse_grace = int(
+            self._get_optional_env("refresh_reuse_grace", "10")
+        )
+        self.stateless_auth = self._get_optional_env(
+            "stateless_auth", "false"
+        ).lower() in ("1", "true", "yes")
+
+        self.password_schemes = self._get_optional_env("password_schemes", "bcrypt")
+        self.bcrypt_rounds = int(self._get_optional_env("bcrypt_rounds", "12"))
+        self.argon2_time_cost = int(self._get_optional_env("argon2_time_cost", "3"))
+        self.argon2_memory_cost = int(
+            self._get_optional_env("argon2_memory_cost", "65536")
+        )
+        self.argon2_parallelism = int(self._get_optional_env("argon2_parallelism", "4"))
+
+        self.rate_limit_backend = self._get_optional_env("rate_limit_backend", "memory")
+        self.rate_limit_redis_url = self._get_optional_env(
+            "rate_limit_redis_url", "redis://localhost:6379/0"
+        )
+        self.rate_limit_login_ip = self._get_optional_env(
+            "rate_limit_login_ip", "20/60"
+        )
+        self.rate_limit_write_ip = self._get_optional_env(
+            "rate_limit_write_ip", "600/60"
+        )
+        self.rate_limit_write_user = self._get_optional_env(
+            "rate_limit_write_user", "120/60"
+        )
+
 
 settings = Settings()
@@ -1,12 +1,10 @@
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import declarative_base, sessionmaker
 from src.config import settings
 
-engine = create_async_engine(settings.db_url, echo=False)
+engine = None
 
 AsyncSessionLocal = sessionmaker(
-    bind=engine,
     class_=AsyncSession,
     expire_on_commit=False,
 )
@@ -14,11 +12,32 @@ AsyncSessionLocal = sessionmaker(
 Base = declarative_base()
 
 
+def get_engine():
+    global engine
+    if engine is None:
+        engine = create_async_engine(
+            settings.db_url,
+            echo=False,
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+        )
+        AsyncSessionLocal.configure(bind=engine)
+    return engine
+
+
+async def dispose_engine():
+    global engine
+    if engine is not None:
+        await engine.dispose()
+        engine = None
+
+
 async def get_async_db():
+    get_engine()
     async with AsyncSessionLocal() as db:
         yield db
 
 
 async def create_tables():
-    async with engine.begin() as conn:
+    async with get_engine().begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
@@ -0,0 +1,108 @@
+from typing import Iterable, Optional
+from sqlalchemy import (
+    Float,
+    Integer,
+    any_,
+    bindparam,
+    cast,
+    delete,
+    false,
+    func,
+    literal,
+    over,
+    select,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, insert
+from src.db.base import AsyncSession
+from src.db.models import Complaint, ComplaintStats
+from src.db.precompile import precompile
+
+COMPLAINT_EPOCH = 1735689600  # 2025-01-01T00:00:00Z
+COMPLAINT_HALF_LIFE = 86400
+
+
+def complaint_rank(timestamp):
+    """log2 веса жалобы, поданной в timestamp"""
+    return (
+        cast(func.extract("epoch", timestamp), Float) - COMPLAINT_EPOCH
+    ) / COMPLAINT_HALF_LIFE
+
+
+def log2_add(a, b):
+    """log2(2^a + 2^b) без переполнения"""
+    high = func.greatest(a, b)
+    return high + func.ln(1 + func.power(2.0, func.least(a, b) - high)) / func.ln(2.0)
+
+
+def current_score(rank):
+    """Число жалоб с затуханием на текущий момент"""
+    return func.power(2.0, rank - complaint_rank(func.now()))
+
+
+def record_complaint_statement():
+    stmt = insert(ComplaintStats).values(
+        adv_id=bindparam("adv_id"),
+        complaints=1,
+        rank=complaint_rank(func.now()),
+        last_complaint_at=func.now(),
+    )
+    return precompile(
+        stmt.on_conflict_do_update(
+            index_elements=[ComplaintStats.adv_id],
+            set_={
+                "complaints": ComplaintStats.complaints + 1,
+                "rank": log2_add(ComplaintStats.rank, stmt.excluded.rank),
+                "last_complaint_at": stmt.excluded.last_complaint_at,
+            },
+        )
+    )
+
+
+RECORD_COMPLAINT = record_complaint_statement()
+
+
+async def record_complaint(session: AsyncSession, adv_id: int):
+    """Учитывает новую жалобу одним upsert в транзакции ее создания"""
+    await session.execute(RECORD_COMPLAINT, {"adv_id": adv_id})
+
+
+async def refresh_complaint_stats(
+    session: AsyncSession, adv_ids: Optional[Iterable[int]] = None
+):
+    """Пересчитывает сводку по видимым жалобам объявлений adv_ids (всех, если
+    None). Нужен после удаления или скрытия жалоб: вычесть вес из rank
+    точно нельзя."""
+    weights = select(
+        Complaint.adv_id,
+        Complaint.created_at,
+        complaint_rank(Complaint.created_at).label("rank"),
+    ).where(Complaint.deleted_at.is_(None), Complaint.hidden == false())
+    stale = delete(ComplaintStats)
+    if adv_ids is not None:
+        adv_ids = list(set(adv_ids))
+        if not adv_ids:
+            return
+        adv_ids = literal(adv_ids, ARRAY(Integer))
+        weights = weights.where(Complaint.adv_id == any_(adv_ids))
+        stale = stale.where(ComplaintStats.adv_id == any_(adv_ids))
+    weights = weights.add_columns(
+        over(
+            func.max(complaint_rank(Complaint.created_at)),
+            partition_by=Complaint.adv_id,
+        ).label("high")
+    ).subquery()
+
+    await session.execute(stale)
+    await session.execute(
+        insert(ComplaintStats).from_select(
+            ["adv_id", "complaints", "rank", "last_complaint_at"],
+            select(
+                weights.c.adv_id,
+                func.count(),
+                func.max(weights.c.high)
+                + func.ln(func.sum(func.power(2.0, weights.c.rank - weights.c.high)))
+                / func.ln(2.0),
+                func.max(weights.c.created_at),
+            ).group_by(weights.c.adv_id),
+        )
+    )
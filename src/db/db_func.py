@@ -1,11 +1,244 @@
-from sqlalchemy import select
-from src.db.base import AsyncSessionLocal
+import hashlib
+import secrets
+import time
+from functools import lru_cache
+from typing import Any, Iterable, List, NamedTuple, Optional, Tuple
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import (
+    Integer,
+    any_,
+    bindparam,
+    cast,
+    delete,
+    false,
+    func,
+    insert,
+    literal,
+    or_,
+    select,
+    true,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, insert as pg_insert
+from sqlalchemy.exc import IntegrityError
+from src.config import settings
+from src.db.base import AsyncSession, AsyncSessionLocal, get_engine
+from src.db.complaint_stats import refresh_complaint_stats
+from src.db.precompile import precompile
+from src.db.ratings import refresh_ratings
+from src.db.models.advertisement import Advertisement
+from src.db.models.complaint import Complaint
+from src.db.models.refresh_token import RefreshToken
+from src.db.models.review import Review
 from src.db.models.user import User
 
+FOREIGN_KEY_VIOLATION = "23503"
+UNIQUE_VIOLATION = "23505"
+
 
 async def get_user_from_db(user_id: int):
+    get_engine()
     async with AsyncSessionLocal() as db:
         result = await db.execute(select(User).where(User.id == user_id))
         user = result.scalar_one_or_none()
 
     return user
+
+
+def hash_refresh_token(token: str) -> str:
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+def new_refresh_token() -> Tuple[str, str]:
+    token = secrets.token_urlsafe(32)
+    return token, hash_refresh_token(token)
+
+
+def refresh_token_expiry() -> datetime:
+    return datetime.now(timezone.utc) + timedelta(days=settings.refresh_token_expires)
+
+
+async def issue_refresh_token(session: AsyncSession, user_id: int) -> str:
+    token, token_hash = new_refresh_token()
+    await session.execute(
+        insert(RefreshToken).values(
+            user_id=user_id, token_hash=token_hash, expires_at=refresh_token_expiry()
+        )
+    )
+    return token
+
+
+async def revoke_refresh_tokens(session: AsyncSession, user_id: int):
+    await session.execute(
+        update(RefreshToken)
+        .where(RefreshToken.user_id == user_id, RefreshToken.revoked_at.is_(None))
+        .values(revoked_at=func.now())
+    )
+
+
+async def delete_user_cascade(session: AsyncSession, user_id: int) -> bool:
+    """Удаляет пользователя вместе с его объявлениями, отзывами и жалобами,
+    включая отзывы и жалобы других пользователей на его объявления.
+
+    Каждая таблица чистится одним DELETE в порядке зависимостей, объекты в
+    сессию не загружаются. Строка пользователя блокируется первой, чтобы
+    параллельно не появились новые объявления. Возвращает False, если
+    пользователя нет.
+    """
+    locked = await session.execute(
+        select(User.id).where(User.id == user_id).with_for_update()
+    )
+    if locked.scalar_one_or_none() is None:
+        return False
+
+    user_ads = select(Advertisement.id).where(Advertisement.user_id == user_id)
+    result = await session.execute(
+        delete(Review)
+        .where(or_(Review.user_id == user_id, Review.adv_id.in_(user_ads)))
+        .returning(Review.adv_id, Review.user_id)
+    )
+    reviewed_ads = [adv_id for adv_id, author_id in result if author_id == user_id]
+    result = await session.execute(
+        delete(Complaint)
+        .where(or_(Complaint.user_id == user_id, Complaint.adv_id.in_(user_ads)))
+        .returning(Complaint.adv_id, Complaint.user_id)
+    )
+    # Сводки по объявлениям пользователя удаляются вместе с ними, пересчитать
+    # нужно только чужие объявления, на которые он жаловался или оставлял отзывы
+    complained_ads = [adv_id for adv_id, author_id in result if author_id == user_id]
+    await session.execute(delete(Advertisement).where(Advertisement.user_id == user_id))
+    await session.execute(delete(User).where(User.id == user_id))
+    await refresh_complaint_stats(session, complained_ads)
+    await refresh_ratings(session, reviewed_ads)
+    return True
+
+
+def is_foreign_key_violation(exc: IntegrityError) -> bool:
+    return getattr(exc.orig, "sqlstate", None) == FOREIGN_KEY_VIOLATION
+
+
+def is_unique_violation(exc: IntegrityError) -> bool:
+    return getattr(exc.orig, "sqlstate", None) == UNIQUE_VIOLATION
+
+
+def complaint_content_hash(description: str) -> str:
+    """Хэш текста жалобы без учета регистра и повторяющихся пробелов"""
+    normalized = " ".join(description.lower().split())
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def complaint_dedup_bucket() -> Optional[int]:
+    """Номер окна дедупликации жалоб. При нулевом окне - None: NULL в
+    уникальном индексе ни с чем не совпадает, и повторы не склеиваются."""
+    if settings.complaint_dedup_window <= 0:
+        return None
+    return int(time.time()) // settings.complaint_dedup_window
+
+
+class FeedbackInsert(NamedTuple):
+    owner_id: Optional[int]
+    row: Any
+    created: bool
+
+
+@lru_cache(maxsize=None)
+def feedback_insert_statement(model, columns: Tuple[str, ...], keys: Tuple[str, ...]):
+    adv = Advertisement.__table__
+    table = model.__table__
+    target = (
+        select(adv.c.id, adv.c.user_id)
+        .where(
+            adv.c.id == bindparam("adv_id"),
+            adv.c.deleted_at.is_(None),
+            adv.c.hidden == false(),
+        )
+        .cte("adv")
+    )
+    # Значения по умолчанию на стороне Python (hidden) передаются явно, а
+    # параметры приводятся к типу колонки: в списке SELECT тип не выводится
+    defaults = {
+        column.name: column.default.arg
+        for column in table.c
+        if column.default is not None
+        and column.default.is_scalar
+        and column.name not in columns
+    }
+    source = select(
+        *(
+            cast(bindparam(column, defaults.get(column)), table.c[column].type)
+            for column in (*columns, *defaults)
+        ),
+        target.c.id,
+    ).where(target.c.user_id != bindparam("user_id"))
+    inserted = (
+        pg_insert(table)
+        .from_select([*columns, *defaults, "adv_id"], source)
+        .on_conflict_do_nothing(
+            index_elements=keys, index_where=table.c.deleted_at.is_(None)
+        )
+        .returning(*table.c)
+        .cte("inserted")
+    )
+    return precompile(
+        select(target.c.user_id.label("owner_id"), inserted).outerjoin_from(
+            target, inserted, true()
+        )
+    )
+
+
+async def insert_feedback(
+    session: AsyncSession, model, values: dict, keys: Iterable[str]
+) -> FeedbackInsert:
+    """Создает отзыв или жалобу values на объявление values["adv_id"] одним
+    INSERT ... SELECT: строка вставляется, только если объявление есть, не
+    скрыто и принадлежит не автору, а повтор по частичному уникальному индексу на keys
+    пропускается через ON CONFLICT DO NOTHING.
+
+    Итог различается по форме результата: owner_id None - объявления нет,
+    owner_id равен автору - объявление его собственное, иначе row - новая
+    строка (created) или уже существующая. Конкурентная вставка того же
+    ключа ждет завершения первой транзакции, поэтому строку создает ровно
+    один запрос. Если найденную строку успели удалить, вставка повторяется."""
+    keys = tuple(keys)
+    columns = tuple(column for column in values if column != "adv_id")
+    statement = feedback_insert_statement(model, columns, keys)
+    existing = select(model).where(
+        *(getattr(model, key) == values[key] for key in keys)
+    )
+    while True:
+        result = (await session.execute(statement, values)).one_or_none()
+        if result is None:
+            return FeedbackInsert(None, None, False)
+        if result.owner_id == values["user_id"]:
+            return FeedbackInsert(result.owner_id, None, False)
+        if result.id is not None:
+            return FeedbackInsert(result.owner_id, result, True)
+        obj = (await session.execute(existing)).scalar_one_or_none()
+        if obj is not None:
+            return FeedbackInsert(result.owner_id, obj, False)
+
+
+def bulk_conditions(
+    model,
+    ids: Optional[List[int]] = None,
+    adv_id: Optional[int] = None,
+    user_id: Optional[int] = None,
+) -> list:
+    """Условия массовой операции над отзывами или жалобами. Условия
+    объединяются через AND; без них операция задела бы всю таблицу, поэтому
+    пустой набор - ошибка. Список id передается одним массивом, а не
+    параметром на каждый id."""
+    conditions = []
+    if ids is not None:
+        if len(ids) > settings.bulk_moderation_limit:
+            raise ValueError(
+                f"No more than {settings.bulk_moderation_limit} ids per request"
+            )
+        conditions.append(model.id == any_(literal(ids, ARRAY(Integer))))
+    if adv_id is not None:
+        conditions.append(model.adv_id == adv_id)
+    if user_id is not None:
+        conditions.append(model.user_id == user_id)
+    if not conditions:
+        raise ValueError("Specify ids, adv_id or user_id")
+    return conditions
@@ -3,5 +3,18 @@ from .advertisement import Advertisement
 from .category import Category
 from .review import Review
 from .complaint import Complaint
+from .token_revocation import TokenRevocation
+from .refresh_token import RefreshToken
+from .complaint_stats import ComplaintStats
+from src.db import soft_delete  # noqa: F401
 
-__all__ = ["User", "Advertisement", "Category", "Review", "Complaint"]
+__all__ = [
+    "User",
+    "Advertisement",
+    "Category",
+    "Review",
+    "Complaint",
+    "TokenRevocation",
+    "RefreshToken",
+    "ComplaintStats",
+]
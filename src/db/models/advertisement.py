@@ -1,10 +1,38 @@
 from src.db.base import Base
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, func
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    false,
+    func,
+    text,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import relationship
 
+RATING_VALUES = range(1, 6)
+
 
 class Advertisement(Base):
     __tablename__ = "advertisements"
+    __table_args__ = (
+        Index(
+            "ix_advertisements_visible_created_at",
+            "created_at",
+            postgresql_where=text("deleted_at IS NULL AND NOT hidden"),
+        ),
+        Index("ix_advertisements_user_created_at", "user_id", "created_at", "id"),
+        Index(
+            "ix_advertisements_deleted_at",
+            "deleted_at",
+            postgresql_where=text("deleted_at IS NOT NULL"),
+        ),
+    )
     id = Column(Integer, primary_key=True)
     user_id = Column(ForeignKey("users.id"), nullable=False)
     name = Column(String(length=150), nullable=False)
@@ -15,8 +43,28 @@ class Advertisement(Base):
     updated_at = Column(
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
+    version = Column(Integer, nullable=False, default=1, server_default="1")
+    hidden = Column(Boolean, nullable=False, default=False, server_default=false())
+    deleted_at = Column(DateTime(timezone=True), nullable=True)
+    rating_count = Column(Integer, nullable=False, default=0, server_default="0")
+    rating_sum = Column(Integer, nullable=False, default=0, server_default="0")
+    rating_histogram = Column(
+        ARRAY(Integer),
+        nullable=False,
+        default=lambda: [0] * len(RATING_VALUES),
+        server_default="{0,0,0,0,0}",
+    )
+    rating_avg = Column(Float, nullable=True)
 
     categories = relationship("Category", back_populates="advertisements")
     user = relationship("User", back_populates="advertisements")
     reviews = relationship("Review", back_populates="advertisement")
     complaints = relationship("Complaint", back_populates="advertisement")
+
+
+Index(
+    "ix_advertisements_visible_rating",
+    Advertisement.rating_avg.desc().nullslast(),
+    Advertisement.id.desc(),
+    postgresql_where=text("deleted_at IS NULL AND NOT hidden"),
+)
@@ -1,5 +1,5 @@
 from src.db.base import Base
-from sqlalchemy import Column, Integer, String, ForeignKey, Boolean
+from sqlalchemy import Column, Integer, String
 from sqlalchemy.orm import relationship
 
 
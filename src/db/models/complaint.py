@@ -1,18 +1,56 @@
 from src.db.base import Base
-from sqlalchemy import Column, DateTime, Integer, String, ForeignKey, func
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    false,
+    func,
+    text,
+)
 from sqlalchemy.orm import relationship
 
 
 class Complaint(Base):
     __tablename__ = "complaints"
+    __table_args__ = (
+        Index(
+            "ix_complaints_visible_created_at",
+            "created_at",
+            postgresql_where=text("deleted_at IS NULL AND NOT hidden"),
+        ),
+        Index("ix_complaints_user_created_at", "user_id", "created_at", "id"),
+        # Повтор жалобы с тем же текстом в пределах окна не создает новую строку
+        Index(
+            "ix_complaints_live_dedup",
+            "user_id",
+            "adv_id",
+            "content_hash",
+            "dedup_bucket",
+            unique=True,
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        Index(
+            "ix_complaints_deleted_at",
+            "deleted_at",
+            postgresql_where=text("deleted_at IS NOT NULL"),
+        ),
+    )
     id = Column(Integer, primary_key=True)
     description = Column(String(length=1000), nullable=False)
-    adv_id = Column(ForeignKey("advertisements.id"), nullable=False)
+    adv_id = Column(ForeignKey("advertisements.id"), nullable=False, index=True)
     user_id = Column(ForeignKey("users.id"), nullable=False)
+    content_hash = Column(String(length=64), nullable=True)
+    dedup_bucket = Column(Integer, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
+    hidden = Column(Boolean, nullable=False, default=False, server_default=false())
+    deleted_at = Column(DateTime(timezone=True), nullable=True)
 
     advertisement = relationship("Advertisement", back_populates="complaints")
     user = relationship("User", back_populates="complaints")
@@ -0,0 +1,21 @@
+from src.db.base import Base
+from sqlalchemy import Column, DateTime, Float, ForeignKey, Index, Integer
+
+
+class ComplaintStats(Base):
+    """Сводка жалоб по объявлению для очереди модерации.
+
+    rank - log2 суммы весов жалоб, где вес жалобы удваивается каждые
+    COMPLAINT_HALF_LIFE секунд от COMPLAINT_EPOCH. Порядок по rank совпадает
+    с порядком по числу недавних жалоб с затуханием, но не меняется со
+    временем, поэтому хранится в индексе и обновляется только новыми жалобами.
+    """
+
+    __tablename__ = "complaint_stats"
+    __table_args__ = (Index("ix_complaint_stats_rank", "rank", "adv_id"),)
+    adv_id = Column(
+        ForeignKey("advertisements.id", ondelete="CASCADE"), primary_key=True
+    )
+    complaints = Column(Integer, nullable=False)
+    rank = Column(Float, nullable=False)
+    last_complaint_at = Column(DateTime(timezone=True), nullable=False)
@@ -1,18 +1,56 @@
 from src.db.base import Base
-from sqlalchemy import Column, DateTime, Integer, String, ForeignKey, func
+from sqlalchemy import (
+    Boolean,
+    CheckConstraint,
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    SmallInteger,
+    String,
+    false,
+    func,
+    text,
+)
 from sqlalchemy.orm import relationship
 
 
 class Review(Base):
     __tablename__ = "reviews"
+    __table_args__ = (
+        CheckConstraint("rating BETWEEN 1 AND 5", name="ck_reviews_rating"),
+        Index(
+            "ix_reviews_visible_created_at",
+            "created_at",
+            postgresql_where=text("deleted_at IS NULL AND NOT hidden"),
+        ),
+        Index("ix_reviews_user_created_at", "user_id", "created_at", "id"),
+        # Один действующий отзыв пользователя на объявление
+        Index(
+            "ix_reviews_live_user_adv",
+            "user_id",
+            "adv_id",
+            unique=True,
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        Index(
+            "ix_reviews_deleted_at",
+            "deleted_at",
+            postgresql_where=text("deleted_at IS NOT NULL"),
+        ),
+    )
     id = Column(Integer, primary_key=True)
     description = Column(String(length=1000), nullable=False)
-    adv_id = Column(ForeignKey("advertisements.id"), nullable=False)
+    rating = Column(SmallInteger, nullable=True)
+    adv_id = Column(ForeignKey("advertisements.id"), nullable=False, index=True)
     user_id = Column(ForeignKey("users.id"), nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
+    hidden = Column(Boolean, nullable=False, default=False, server_default=false())
+    deleted_at = Column(DateTime(timezone=True), nullable=True)
 
     advertisement = relationship("Advertisement", back_populates="reviews")
     user = relationship("User", back_populates="reviews")
@@ -0,0 +1,10 @@
+from src.db.base import Base
+from sqlalchemy import Column, DateTime, Integer, func
+
+
+class TokenRevocation(Base):
+    __tablename__ = "token_revocations"
+    user_id = Column(Integer, primary_key=True)
+    revoked_after = Column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
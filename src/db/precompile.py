@@ -0,0 +1,17 @@
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.sql.elements import TextClause
+
+
+def precompile(statement) -> TextClause:
+    """Компилирует выражение один раз в text с именованными параметрами.
+
+    Диалектный insert() PostgreSQL (ON CONFLICT) в SQLAlchemy 2.0 не попадает
+    в кэш компиляции и собирается заново при каждом выполнении, что на горячих
+    запросах дороже самого запроса. Значения по умолчанию, которые SQLAlchemy
+    передает параметрами (например, hidden=False), сохраняются в text."""
+    compiled = statement.compile(dialect=postgresql.dialect(paramstyle="named"))
+    defaults = {
+        name: value for name, value in compiled.params.items() if value is not None
+    }
+    return text(compiled.string).bindparams(**defaults)
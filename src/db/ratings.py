@@ -0,0 +1,94 @@
+from typing import Iterable, Optional
+from sqlalchemy import Float, Integer, any_, cast, false, func, literal, select, update
+from sqlalchemy.dialects.postgresql import ARRAY, array
+from src.db.base import AsyncSession
+from src.db.models import Advertisement, Review
+from src.db.models.advertisement import RATING_VALUES
+
+
+def rating_average(total, count):
+    return cast(total, Float) / func.nullif(count, 0)
+
+
+async def record_rating(
+    session: AsyncSession,
+    adv_id: int,
+    old: Optional[int] = None,
+    new: Optional[int] = None,
+):
+    """Учитывает смену оценки видимого отзыва old -> new (None - без оценки)
+    одним UPDATE объявления в транзакции изменения отзыва"""
+    if old == new:
+        return
+    count = Advertisement.rating_count + int(new is not None) - int(old is not None)
+    total = Advertisement.rating_sum + (new or 0) - (old or 0)
+    values = {
+        Advertisement.rating_count: count,
+        Advertisement.rating_sum: total,
+        Advertisement.rating_avg: rating_average(total, count),
+        Advertisement.updated_at: Advertisement.updated_at,
+    }
+    if old is not None:
+        bucket = Advertisement.rating_histogram[old]
+        values[bucket] = bucket - 1
+    if new is not None:
+        bucket = Advertisement.rating_histogram[new]
+        values[bucket] = bucket + 1
+    await session.execute(
+        update(Advertisement)
+        .where(Advertisement.id == adv_id)
+        .values(values)
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def refresh_ratings(
+    session: AsyncSession, adv_ids: Optional[Iterable[int]] = None
+):
+    """Пересчитывает сводку оценок объявлений adv_ids (всех, если None) по
+    видимым отзывам. Нужен после массового удаления, восстановления или
+    скрытия отзывов."""
+    targets = select(Advertisement.id.label("adv_id"))
+    ratings = select(Review.adv_id, Review.rating).where(
+        Review.deleted_at.is_(None),
+        Review.hidden == false(),
+        Review.rating.is_not(None),
+    )
+    if adv_ids is not None:
+        adv_ids = list(set(adv_ids))
+        if not adv_ids:
+            return
+        adv_ids = literal(adv_ids, ARRAY(Integer))
+        targets = select(func.unnest(adv_ids).label("adv_id"))
+        ratings = ratings.where(Review.adv_id == any_(adv_ids))
+    targets = targets.subquery()
+    ratings = ratings.subquery()
+
+    summary = (
+        select(
+            targets.c.adv_id,
+            func.count(ratings.c.rating).label("count"),
+            func.coalesce(func.sum(ratings.c.rating), 0).label("total"),
+            array(
+                [
+                    func.count(ratings.c.rating).filter(ratings.c.rating == value)
+                    for value in RATING_VALUES
+                ]
+            ).label("histogram"),
+        )
+        .select_from(targets.outerjoin(ratings, ratings.c.adv_id == targets.c.adv_id))
+        .group_by(targets.c.adv_id)
+        .subquery()
+    )
+    await session.execute(
+        update(Advertisement)
+        .where(Advertisement.id == summary.c.adv_id)
+        .values(
+            rating_count=summary.c.count,
+            rating_sum=summary.c.total,
+            rating_histogram=summary.c.histogram,
+            rating_avg=rating_average(summary.c.total, summary.c.count),
+            updated_at=Advertisement.updated_at,
+        )
+        .execution_options(synchronize_session=False)
+    )
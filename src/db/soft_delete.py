@@ -0,0 +1,67 @@
+from sqlalchemy import event, func, select, update
+from sqlalchemy.orm import Session, with_loader_criteria
+from src.db.base import AsyncSession
+from src.db.models.advertisement import Advertisement
+from src.db.models.complaint import Complaint
+from src.db.models.review import Review
+
+SOFT_DELETE_MODELS = (Advertisement, Review, Complaint)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def exclude_deleted_rows(execute_state):
+    """Добавляет deleted_at IS NULL ко всем ORM-запросам SELECT, включая
+    подгрузку связей. Удаленные строки можно прочитать с
+    execution_options(include_deleted=True). Core-запросы (UPDATE, DELETE,
+    text) фильтруются явно."""
+    if (
+        execute_state.is_select
+        and not execute_state.is_column_load
+        and not execute_state.is_relationship_load
+        and not execute_state.execution_options.get("include_deleted", False)
+    ):
+        execute_state.statement = execute_state.statement.options(
+            *(
+                with_loader_criteria(
+                    model, lambda cls: cls.deleted_at.is_(None), include_aliases=True
+                )
+                for model in SOFT_DELETE_MODELS
+            )
+        )
+
+
+def mark_deleted(model, *conditions):
+    return (
+        update(model)
+        .where(*conditions, model.deleted_at.is_(None))
+        .values(deleted_at=func.now(), updated_at=model.updated_at)
+    )
+
+
+def mark_restored(model, *conditions):
+    """Снимает пометку об удалении с отзывов или жалоб, пока их объявление не
+    удалено и запись не стерта очисткой."""
+    return (
+        update(model)
+        .where(
+            *conditions,
+            model.deleted_at.is_not(None),
+            model.adv_id.in_(
+                select(Advertisement.id).where(Advertisement.deleted_at.is_(None))
+            ),
+        )
+        .values(deleted_at=None, updated_at=model.updated_at)
+    )
+
+
+async def soft_delete(session: AsyncSession, model, *conditions) -> int:
+    result = await session.execute(mark_deleted(model, *conditions))
+    return result.rowcount
+
+
+async def soft_delete_advertisement(session: AsyncSession, adv_id: int) -> int:
+    """Помечает удаленными объявление вместе с отзывами и жалобами на него,
+    чтобы очистка могла стереть их одной волной."""
+    for model in (Review, Complaint):
+        await soft_delete(session, model, model.adv_id == adv_id)
+    return await soft_delete(session, Advertisement, Advertisement.id == adv_id)
@@ -1,5 +1,5 @@
-from pydantic import BaseModel, ConfigDict, Field, field_validator
-from typing import List, Optional
+from pydantic import BaseModel, ConfigDict, Field, computed_field, model_validator
+from typing import Dict, List, Optional
 from datetime import datetime
 from src.dto.cat_dto import CategoryDTO
 from src.dto.review_dto import ReviewGetDTO
@@ -29,7 +29,44 @@ class AdvertisementCreateDTO(AdvertisementBaseDTO):
     price: Optional[int] = None
 
 
-class AdvertisementGetMinDTO(AdertisementBaseDTO):
+class AdvertisementImportDTO(BaseModel):
+    name: str = Field(max_length=150)
+    descriptions: str = Field(max_length=1000)
+    price: Optional[int] = None
+    category: str = Field(max_length=100)
+    user_id: Optional[int] = None
+    user_email: Optional[str] = Field(default=None, max_length=100)
+
+    @model_validator(mode="after")
+    def check_owner(self):
+        if self.user_id is None and self.user_email is None:
+            raise ValueError("user_id or user_email is required")
+        return self
+
+
+class RatingSummaryDTO(BaseModel):
+    count: int
+    average: Optional[float] = None
+    histogram: Dict[int, int]
+
+
+class AdvertisementRatedDTO(AdertisementBaseDTO):
+    rating_count: int = Field(default=0, exclude=True)
+    rating_avg: Optional[float] = Field(default=None, exclude=True)
+    rating_histogram: Optional[List[int]] = Field(default=None, exclude=True)
+
+    @computed_field
+    @property
+    def rating(self) -> RatingSummaryDTO:
+        histogram = self.rating_histogram or [0] * 5
+        return RatingSummaryDTO(
+            count=self.rating_count,
+            average=None if self.rating_avg is None else round(self.rating_avg, 2),
+            histogram={value: histogram[value - 1] for value in range(1, 6)},
+        )
+
+
+class AdvertisementGetMinDTO(AdvertisementRatedDTO):
     id: int
     name: str
     price: int
@@ -38,7 +75,7 @@ class AdvertisementGetMinDTO(AdertisementBaseDTO):
     updated_at: datetime
 
 
-class AdvertisementGetDTO(AdertisementBaseDTO):
+class AdvertisementGetDTO(AdvertisementRatedDTO):
     id: int
     name: str
     descriptions: str
@@ -48,3 +85,18 @@ class AdvertisementGetDTO(AdertisementBaseDTO):
     user: UserGetDTO
     category: CategoryDTO
     reviews: Optional[List[ReviewGetDTO]] = None
+
+
+class AdvertisementBatchCreatedDTO(BaseModel):
+    index: int
+    id: int
+
+
+class AdvertisementBatchErrorDTO(BaseModel):
+    index: int
+    detail: str
+
+
+class AdvertisementBatchResultDTO(BaseModel):
+    created: List[AdvertisementBatchCreatedDTO]
+    errors: List[AdvertisementBatchErrorDTO]
@@ -4,3 +4,12 @@ from pydantic import BaseModel, EmailStr, SecretStr
 class UserLoginDTO(BaseModel):
     username: EmailStr
     password: SecretStr
+
+
+class RefreshTokenDTO(BaseModel):
+    refresh_token: str
+
+
+class TokenDTO(RefreshTokenDTO):
+    access_token: str
+    token_type: str = "bearer"
@@ -1,5 +1,4 @@
 from pydantic import BaseModel, ConfigDict, Field
-from typing import Optional
 
 
 class CategoryDTO(BaseModel):
@@ -18,3 +17,8 @@ class CategoryGetDTO(CategoryCreateDTO):
 
 class CategoryUpdateDTO(BaseModel):
     name: str
+
+
+class CategoryDeleteDTO(BaseModel):
+    id: int
+    moved: int
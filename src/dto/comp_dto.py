@@ -1,6 +1,6 @@
 from datetime import datetime
+from typing import List, Literal, Optional
 from pydantic import BaseModel, ConfigDict, Field
-from typing import Optional
 
 
 class ComplaintBaseDTO(BaseModel):
@@ -25,3 +25,23 @@ class ComplaintGetDTO(ComplaintBaseDTO):
 
 class ComplaintUpdateDTO(ComplaintBaseDTO):
     description: str
+
+
+class ComplaintQueueItemDTO(ComplaintBaseDTO):
+    adv_id: int
+    adv_name: str
+    complaints: int
+    score: float
+    last_complaint_at: datetime
+
+
+class ComplaintBulkDTO(ComplaintBaseDTO):
+    action: Literal["delete", "restore"]
+    ids: Optional[List[int]] = None
+    adv_id: Optional[int] = None
+    user_id: Optional[int] = None
+
+
+class ComplaintBulkResultDTO(ComplaintBaseDTO):
+    action: str
+    affected: int
@@ -1,5 +1,6 @@
 from datetime import datetime
-from pydantic import BaseModel, ConfigDict, Field
+from typing import List, Literal, Optional
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class ReviewBaseDTO(BaseModel):
@@ -11,11 +12,13 @@ class ReviewBaseDTO(BaseModel):
 
 class ReviewCreateDTO(ReviewBaseDTO):
     description: str = Field(max_length=1000)
+    rating: Optional[int] = Field(default=None, ge=1, le=5)
 
 
 class ReviewGetDTO(ReviewBaseDTO):
     id: int
     description: str = Field(max_length=1000)
+    rating: Optional[int] = None
     adv_id: int
     user_id: int
     created_at: datetime
@@ -23,4 +26,24 @@ class ReviewGetDTO(ReviewBaseDTO):
 
 
 class ReviewUpdateDTO(ReviewBaseDTO):
-    description: str
+    description: Optional[str] = Field(default=None, max_length=1000)
+    rating: Optional[int] = Field(default=None, ge=1, le=5)
+
+    @field_validator("description")
+    @classmethod
+    def description_not_null(cls, value):
+        if value is None:
+            raise ValueError("description cannot be null")
+        return value
+
+
+class ReviewBulkDTO(ReviewBaseDTO):
+    action: Literal["delete", "restore"]
+    ids: Optional[List[int]] = None
+    adv_id: Optional[int] = None
+    user_id: Optional[int] = None
+
+
+class ReviewBulkResultDTO(ReviewBaseDTO):
+    action: str
+    affected: int
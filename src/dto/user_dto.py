@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field, SecretStr, EmailStr
+from pydantic import BaseModel, Field, SecretStr, EmailStr, model_validator
 from typing import Optional
 
 
@@ -22,3 +22,19 @@ class UserUpdateDTO(BaseModel):
     name: Optional[str] = None
     surname: Optional[str] = None
     email: Optional[EmailStr] = None
+
+
+class UserImportDTO(BaseModel):
+    name: str = Field(max_length=100)
+    surname: str = Field(max_length=100)
+    email: EmailStr
+    password: Optional[SecretStr] = None
+    hashed_password: Optional[str] = Field(default=None, max_length=300)
+    is_admin: bool = False
+    is_banned: bool = False
+
+    @model_validator(mode="after")
+    def check_password(self):
+        if self.password is None and self.hashed_password is None:
+            raise ValueError("password or hashed_password is required")
+        return self
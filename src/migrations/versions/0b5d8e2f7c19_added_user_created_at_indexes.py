@@ -0,0 +1,40 @@
+"""added user created_at indexes
+
+Revision ID: 0b5d8e2f7c19
+Revises: f3a86c1d5e72
+Create Date: 2026-10-20 00:41:09.512837
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0b5d8e2f7c19"
+down_revision: Union[str, None] = "f3a86c1d5e72"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ("advertisements", "reviews", "complaints")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in TABLES:
+        op.create_index(
+            f"ix_{table}_user_created_at",
+            table,
+            ["user_id", "created_at", "id"],
+            unique=False,
+        )
+        op.drop_index(op.f(f"ix_{table}_user_id"), table_name=table)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in reversed(TABLES):
+        op.create_index(op.f(f"ix_{table}_user_id"), table, ["user_id"], unique=False)
+        op.drop_index(f"ix_{table}_user_created_at", table_name=table)
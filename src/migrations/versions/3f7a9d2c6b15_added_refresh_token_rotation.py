@@ -0,0 +1,32 @@
+"""added refresh token rotation
+
+Revision ID: 3f7a9d2c6b15
+Revises: 9c4f2b7e1a58
+Create Date: 2026-10-20 06:41:09.218734
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3f7a9d2c6b15"
+down_revision: Union[str, None] = "9c4f2b7e1a58"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "refresh_tokens",
+        sa.Column("rotated_at", sa.DateTime(timezone=True), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("refresh_tokens", "rotated_at")
@@ -0,0 +1,67 @@
+"""added review rating
+
+Revision ID: 6e1c4a9f3b27
+Revises: 0b5d8e2f7c19
+Create Date: 2026-10-20 02:07:33.184520
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "6e1c4a9f3b27"
+down_revision: Union[str, None] = "0b5d8e2f7c19"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("reviews", sa.Column("rating", sa.SmallInteger(), nullable=True))
+    op.create_check_constraint("ck_reviews_rating", "reviews", "rating BETWEEN 1 AND 5")
+    # Оценок до этой миграции не было, поэтому сводки начинаются с нулей
+    op.add_column(
+        "advertisements",
+        sa.Column("rating_count", sa.Integer(), server_default="0", nullable=False),
+    )
+    op.add_column(
+        "advertisements",
+        sa.Column("rating_sum", sa.Integer(), server_default="0", nullable=False),
+    )
+    op.add_column(
+        "advertisements",
+        sa.Column(
+            "rating_histogram",
+            postgresql.ARRAY(sa.Integer()),
+            server_default="{0,0,0,0,0}",
+            nullable=False,
+        ),
+    )
+    op.add_column("advertisements", sa.Column("rating_avg", sa.Float(), nullable=True))
+    op.create_index(
+        "ix_advertisements_visible_rating",
+        "advertisements",
+        [sa.text("rating_avg DESC NULLS LAST"), sa.text("id DESC")],
+        unique=False,
+        postgresql_where=sa.text("deleted_at IS NULL AND NOT hidden"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "ix_advertisements_visible_rating",
+        table_name="advertisements",
+        postgresql_where=sa.text("deleted_at IS NULL AND NOT hidden"),
+    )
+    op.drop_column("advertisements", "rating_avg")
+    op.drop_column("advertisements", "rating_histogram")
+    op.drop_column("advertisements", "rating_sum")
+    op.drop_column("advertisements", "rating_count")
+    op.drop_constraint("ck_reviews_rating", "reviews", type_="check")
+    op.drop_column("reviews", "rating")
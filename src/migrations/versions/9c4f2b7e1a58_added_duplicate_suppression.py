@@ -0,0 +1,104 @@
+"""added duplicate suppression
+
+Revision ID: 9c4f2b7e1a58
+Revises: 6e1c4a9f3b27
+Create Date: 2026-10-20 04:12:51.403917
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9c4f2b7e1a58"
+down_revision: Union[str, None] = "6e1c4a9f3b27"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Из повторных отзывов пользователя на объявление остается самый ранний,
+    # остальные удаляются мягко, а сводка оценок их объявлений пересчитывается
+    # без них (изменения CTE в том же запросе еще не видны)
+    op.execute(
+        """
+        WITH removed AS (
+            UPDATE reviews SET deleted_at = now()
+            FROM (
+                SELECT id, row_number() OVER (
+                    PARTITION BY user_id, adv_id ORDER BY id
+                ) AS position
+                FROM reviews WHERE deleted_at IS NULL
+            ) AS ranked
+            WHERE reviews.id = ranked.id AND ranked.position > 1
+            RETURNING reviews.id, reviews.adv_id
+        ),
+        summary AS (
+            SELECT targets.adv_id,
+                count(r.rating) AS count,
+                coalesce(sum(r.rating), 0) AS total,
+                ARRAY[
+                    count(r.rating) FILTER (WHERE r.rating = 1),
+                    count(r.rating) FILTER (WHERE r.rating = 2),
+                    count(r.rating) FILTER (WHERE r.rating = 3),
+                    count(r.rating) FILTER (WHERE r.rating = 4),
+                    count(r.rating) FILTER (WHERE r.rating = 5)
+                ] AS histogram
+            FROM (SELECT DISTINCT adv_id FROM removed) AS targets
+            LEFT JOIN reviews AS r
+                ON r.adv_id = targets.adv_id
+                AND r.deleted_at IS NULL
+                AND NOT r.hidden
+                AND r.rating IS NOT NULL
+                AND r.id NOT IN (SELECT id FROM removed)
+            GROUP BY targets.adv_id
+        )
+        UPDATE advertisements SET
+            rating_count = summary.count,
+            rating_sum = summary.total,
+            rating_histogram = summary.histogram,
+            rating_avg = CAST(summary.total AS float) / nullif(summary.count, 0)
+        FROM summary
+        WHERE advertisements.id = summary.adv_id
+        """
+    )
+    op.create_index(
+        "ix_reviews_live_user_adv",
+        "reviews",
+        ["user_id", "adv_id"],
+        unique=True,
+        postgresql_where=sa.text("deleted_at IS NULL"),
+    )
+    # Существующие жалобы не хэшируются: с NULL в content_hash они не
+    # участвуют в дедупликации, окно действует для новых жалоб
+    op.add_column(
+        "complaints", sa.Column("content_hash", sa.String(length=64), nullable=True)
+    )
+    op.add_column("complaints", sa.Column("dedup_bucket", sa.Integer(), nullable=True))
+    op.create_index(
+        "ix_complaints_live_dedup",
+        "complaints",
+        ["user_id", "adv_id", "content_hash", "dedup_bucket"],
+        unique=True,
+        postgresql_where=sa.text("deleted_at IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "ix_complaints_live_dedup",
+        table_name="complaints",
+        postgresql_where=sa.text("deleted_at IS NULL"),
+    )
+    op.drop_column("complaints", "dedup_bucket")
+    op.drop_column("complaints", "content_hash")
+    op.drop_index(
+        "ix_reviews_live_user_adv",
+        table_name="reviews",
+        postgresql_where=sa.text("deleted_at IS NULL"),
+    )
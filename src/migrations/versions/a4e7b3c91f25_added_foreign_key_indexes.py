@@ -0,0 +1,43 @@
+"""added foreign key indexes
+
+Revision ID: a4e7b3c91f25
+Revises: 8c2d7f1e4a90
+Create Date: 2026-10-19 21:14:52.318406
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a4e7b3c91f25"
+down_revision: Union[str, None] = "8c2d7f1e4a90"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        op.f("ix_advertisements_user_id"), "advertisements", ["user_id"], unique=False
+    )
+    op.create_index(
+        op.f("ix_complaints_adv_id"), "complaints", ["adv_id"], unique=False
+    )
+    op.create_index(
+        op.f("ix_complaints_user_id"), "complaints", ["user_id"], unique=False
+    )
+    op.create_index(op.f("ix_reviews_adv_id"), "reviews", ["adv_id"], unique=False)
+    op.create_index(op.f("ix_reviews_user_id"), "reviews", ["user_id"], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_reviews_user_id"), table_name="reviews")
+    op.drop_index(op.f("ix_reviews_adv_id"), table_name="reviews")
+    op.drop_index(op.f("ix_complaints_user_id"), table_name="complaints")
+    op.drop_index(op.f("ix_complaints_adv_id"), table_name="complaints")
+    op.drop_index(op.f("ix_advertisements_user_id"), table_name="advertisements")
@@ -0,0 +1,50 @@
+"""added hidden content
+
+Revision ID: c71f4e2a8b03
+Revises: a4e7b3c91f25
+Create Date: 2026-10-19 21:52:06.774120
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c71f4e2a8b03"
+down_revision: Union[str, None] = "a4e7b3c91f25"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ("advertisements", "reviews", "complaints")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in TABLES:
+        op.add_column(
+            table,
+            sa.Column(
+                "hidden", sa.Boolean(), server_default=sa.false(), nullable=False
+            ),
+        )
+        op.create_index(
+            f"ix_{table}_visible_created_at",
+            table,
+            ["created_at"],
+            unique=False,
+            postgresql_where=sa.text("NOT hidden"),
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in TABLES:
+        op.drop_index(
+            f"ix_{table}_visible_created_at",
+            table_name=table,
+            postgresql_where=sa.text("NOT hidden"),
+        )
+        op.drop_column(table, "hidden")
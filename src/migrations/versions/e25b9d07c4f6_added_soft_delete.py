@@ -0,0 +1,59 @@
+"""added soft delete
+
+Revision ID: e25b9d07c4f6
+Revises: c71f4e2a8b03
+Create Date: 2026-10-19 22:31:44.905517
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e25b9d07c4f6"
+down_revision: Union[str, None] = "c71f4e2a8b03"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ("advertisements", "reviews", "complaints")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in TABLES:
+        op.add_column(
+            table, sa.Column("deleted_at", sa.DateTime(timezone=True), nullable=True)
+        )
+        op.drop_index(f"ix_{table}_visible_created_at", table_name=table)
+        op.create_index(
+            f"ix_{table}_visible_created_at",
+            table,
+            ["created_at"],
+            unique=False,
+            postgresql_where=sa.text("deleted_at IS NULL AND NOT hidden"),
+        )
+        op.create_index(
+            f"ix_{table}_deleted_at",
+            table,
+            ["deleted_at"],
+            unique=False,
+            postgresql_where=sa.text("deleted_at IS NOT NULL"),
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in TABLES:
+        op.drop_index(f"ix_{table}_deleted_at", table_name=table)
+        op.drop_index(f"ix_{table}_visible_created_at", table_name=table)
+        op.create_index(
+            f"ix_{table}_visible_created_at",
+            table,
+            ["created_at"],
+            unique=False,
+            postgresql_where=sa.text("NOT hidden"),
+        )
+        op.drop_column(table, "deleted_at")
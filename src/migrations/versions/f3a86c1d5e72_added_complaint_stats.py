@@ -0,0 +1,60 @@
+"""added complaint stats
+
+Revision ID: f3a86c1d5e72
+Revises: e25b9d07c4f6
+Create Date: 2026-10-19 23:18:27.640193
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f3a86c1d5e72"
+down_revision: Union[str, None] = "e25b9d07c4f6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "complaint_stats",
+        sa.Column("adv_id", sa.Integer(), nullable=False),
+        sa.Column("complaints", sa.Integer(), nullable=False),
+        sa.Column("rank", sa.Float(), nullable=False),
+        sa.Column("last_complaint_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["adv_id"], ["advertisements.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("adv_id"),
+    )
+    op.create_index(
+        "ix_complaint_stats_rank", "complaint_stats", ["rank", "adv_id"], unique=False
+    )
+    # Та же формула, что в src.db.complaint_stats.refresh_complaint_stats
+    op.execute(
+        """
+        INSERT INTO complaint_stats (adv_id, complaints, rank, last_complaint_at)
+        SELECT adv_id, count(*), max(high) + ln(sum(power(2.0, rank - high))) / ln(2.0),
+               max(created_at)
+        FROM (
+            SELECT adv_id, created_at, rank, max(rank) OVER (PARTITION BY adv_id) AS high
+            FROM (
+                SELECT adv_id, created_at,
+                       (CAST(extract(epoch FROM created_at) AS double precision)
+                        - 1735689600) / 86400 AS rank
+                FROM complaints
+                WHERE deleted_at IS NULL AND NOT hidden
+            ) AS weights
+        ) AS ranked
+        GROUP BY adv_id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_complaint_stats_rank", table_name="complaint_stats")
+    op.drop_table("complaint_stats")
@@ -1,7 +1,8 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter
 from src.routers.advertisement.adv_post import router as post_router
+from src.routers.advertisement.adv_batch import router as batch_router
 from src.routers.advertisement.adv_delete import router as delete_router
+from src.routers.advertisement.adv_export import router as export_router
 from src.routers.advertisement.adv_get import router as get_router
 from src.routers.advertisement.adv_patch import router as patch_router
 from src.routers.advertisement.adv_get_all import router as get_all_router
@@ -9,7 +10,9 @@ from src.routers.advertisement.adv_get_all import router as get_all_router
 router = APIRouter(prefix="/adv", tags=["Advertisement"])
 
 router.include_router(post_router)
+router.include_router(batch_router)
 router.include_router(delete_router)
+router.include_router(export_router)
 router.include_router(get_router)
 router.include_router(patch_router)
 router.include_router(get_all_router)
@@ -0,0 +1,98 @@
+from typing import Any, Dict, List
+from fastapi import APIRouter, Body, Depends, HTTPException, status
+from pydantic import ValidationError
+from sqlalchemy import insert, select
+from sqlalchemy.exc import IntegrityError
+from src.config import settings
+from src.db.db_func import is_foreign_key_violation
+from src.db.models.category import Category
+from src.db.models.user import User
+from src.dto.adv_dto import AdvertisementBatchResultDTO, AdvertisementCreateDTO
+from src.db.base import AsyncSession, get_async_db
+from src.db.models import Advertisement
+from src.utils.security import check_auth, get_token_identity
+
+router = APIRouter()
+
+
+@router.post(
+    "/batch",
+    dependencies=[Depends(check_auth)],
+    status_code=status.HTTP_201_CREATED,
+    response_model=AdvertisementBatchResultDTO,
+    # Элементы принимаются как словари, чтобы ошибки возвращались по каждому
+    # объявлению, а не 422 на весь пакет; схему элемента описываем явно
+    openapi_extra={
+        "requestBody": {
+            "content": {
+                "application/json": {
+                    "schema": {"items": AdvertisementCreateDTO.model_json_schema()}
+                }
+            }
+        }
+    },
+)
+async def create_advertisement_batch(
+    items: List[Dict[str, Any]] = Body(
+        description="Список объявлений в формате AdvertisementCreateDTO"
+    ),
+    session: AsyncSession = Depends(get_async_db),
+    user: User = Depends(get_token_identity),
+) -> AdvertisementBatchResultDTO:
+    if len(items) > settings.adv_batch_limit:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"No more than {settings.adv_batch_limit} advertisements per batch",
+        )
+
+    errors = []
+    valid = []
+    for index, item in enumerate(items):
+        try:
+            valid.append((index, AdvertisementCreateDTO.model_validate(item)))
+        except ValidationError as exp:
+            detail = "; ".join(
+                f"{'.'.join(map(str, error['loc']))}: {error['msg']}"
+                for error in exp.errors()
+            )
+            errors.append({"index": index, "detail": detail})
+
+    category_ids = {data.category_id for _, data in valid}
+    result = await session.execute(
+        select(Category.id).where(Category.id.in_(category_ids))
+    )
+    existing = set(result.scalars().all())
+
+    rows = []
+    indexes = []
+    for index, data in valid:
+        if data.category_id not in existing:
+            errors.append({"index": index, "detail": "Category not found"})
+            continue
+        rows.append({**data.model_dump(), "user_id": user.id})
+        indexes.append(index)
+
+    created = []
+    if rows:
+        try:
+            result = await session.execute(
+                insert(Advertisement).returning(
+                    Advertisement.id, sort_by_parameter_order=True
+                ),
+                rows,
+            )
+        except IntegrityError as exp:
+            if not is_foreign_key_violation(exp):
+                raise
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Category was removed during import, retry the batch",
+            )
+        created = [
+            {"index": index, "id": adv_id}
+            for index, adv_id in zip(indexes, result.scalars().all())
+        ]
+        await session.commit()
+
+    errors.sort(key=lambda error: error["index"])
+    return AdvertisementBatchResultDTO(created=created, errors=errors)
@@ -3,7 +3,8 @@ from sqlalchemy import select
 from src.db.base import AsyncSession, get_async_db
 from src.db.models import Advertisement
 from src.db.models.user import User
-from src.utils.security import check_admin_or_yours, check_auth, get_current_user
+from src.db.soft_delete import soft_delete_advertisement
+from src.utils.security import check_admin_or_yours, check_auth, get_token_identity
 
 router = APIRouter()
 
@@ -17,7 +18,7 @@ router = APIRouter()
 async def delete_advertisement(
     adv_id: int,
     session: AsyncSession = Depends(get_async_db),
-    user: User = Depends(get_current_user),
+    user: User = Depends(get_token_identity),
 ) -> None:
     try:
         result = await session.execute(
@@ -30,7 +31,7 @@ async def delete_advertisement(
             )
         await check_admin_or_yours(obj.id, user, Advertisement, session)
 
-        await session.delete(obj)
+        await soft_delete_advertisement(session, obj.id)
         await session.commit()
 
     except HTTPException:
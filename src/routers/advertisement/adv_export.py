@@ -0,0 +1,90 @@
+import csv
+import io
+import json
+from typing import Literal
+from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Select, select
+from src.db.base import AsyncSessionLocal, get_engine
+from src.db.models import Advertisement
+from src.db.models.category import Category
+from src.routers.advertisement.adv_filters import (
+    advertisement_filter_params,
+    apply_advertisement_filters,
+)
+from src.utils.security import check_auth
+
+router = APIRouter()
+
+EXPORT_CHUNK_SIZE = 1000
+EXPORT_COLUMNS = (
+    Advertisement.id,
+    Advertisement.name,
+    Advertisement.descriptions,
+    Advertisement.price,
+    Advertisement.category_id,
+    Category.name.label("category_name"),
+    Advertisement.user_id,
+    Advertisement.created_at,
+    Advertisement.updated_at,
+)
+MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+
+def _isoformat(value) -> str:
+    return value.isoformat()
+
+
+def _encode_ndjson(rows) -> str:
+    return "".join(
+        json.dumps(dict(row), ensure_ascii=False, default=_isoformat) + "\n"
+        for row in rows
+    )
+
+
+def _encode_csv(rows, header: bool = False) -> str:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if header:
+        writer.writerow([column.key for column in EXPORT_COLUMNS])
+    writer.writerows(rows)
+    return buffer.getvalue()
+
+
+async def _stream_rows(query: Select, export_format: str):
+    get_engine()
+    async with AsyncSessionLocal() as session:
+        result = await session.stream(
+            query.execution_options(yield_per=EXPORT_CHUNK_SIZE)
+        )
+        if export_format == "csv":
+            yield _encode_csv([], header=True)
+        async for rows in result.mappings().partitions():
+            if export_format == "csv":
+                yield _encode_csv([row.values() for row in rows])
+            else:
+                yield _encode_ndjson(rows)
+
+
+@router.get(
+    "/export",
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(check_auth)],
+    response_class=StreamingResponse,
+)
+async def export_advertisements(
+    export_format: Literal["ndjson", "csv"] = Query(
+        "ndjson", alias="format", description="Формат выгрузки: ndjson или csv"
+    ),
+    filters: dict = Depends(advertisement_filter_params),
+) -> StreamingResponse:
+    query = select(*EXPORT_COLUMNS).join(Advertisement.categories)
+    query = apply_advertisement_filters(query, filters)
+
+    return StreamingResponse(
+        _stream_rows(query, export_format),
+        media_type=MEDIA_TYPES[export_format],
+        headers={
+            "Content-Disposition": f'attachment; filename="advertisements.{export_format}"'
+        },
+    )
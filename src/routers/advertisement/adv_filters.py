@@ -0,0 +1,75 @@
+from typing import Optional
+from fastapi import Query
+from sqlalchemy import Select, desc, false
+from src.db.models import Advertisement
+from src.db.models.category import Category
+
+
+def advertisement_filter_params(
+    max_price: Optional[int] = Query(
+        description="Выводит все объявление цена которых " "меньше указанного значения",
+        default=None,
+    ),
+    min_price: Optional[int] = Query(
+        description="Выводит все объявление цена которых " "больше указанного значения",
+        default=None,
+    ),
+    category: Optional[str] = Query(
+        description="Выводит все объявления название категории"
+        " которых содержит введённую строку",
+        default=None,
+    ),
+    sort_by_create: Optional[bool] = Query(
+        description="Сортирует объявления по дате создания, по возрастанию",
+        default=False,
+    ),
+    sort_by_update: Optional[bool] = Query(
+        description="Сортирует объявления по дате последнего изменения, "
+        "по возрастанию",
+        default=False,
+    ),
+    price_ascending: Optional[bool] = Query(
+        description="Сортирует объявления по цене, " "по возрастанию", default=False
+    ),
+    price_descending: Optional[bool] = Query(
+        description="Сортирует объявления по цене, " "по убыванию", default=False
+    ),
+    sort_by_rating: Optional[bool] = Query(
+        description="Сортирует объявления по средней оценке, по убыванию, "
+        "объявления без оценок в конце",
+        default=False,
+    ),
+):
+    return {
+        "max_price": max_price,
+        "min_price": min_price,
+        "category": category,
+        "sort_by_create": sort_by_create,
+        "sort_by_update": sort_by_update,
+        "price_ascending": price_ascending,
+        "price_descending": price_descending,
+        "sort_by_rating": sort_by_rating,
+    }
+
+
+def apply_advertisement_filters(query: Select, filters: dict) -> Select:
+    query = query.where(Advertisement.hidden == false())
+    if filters["category"]:
+        query = query.where(Category.name.ilike(f"%{filters['category']}%"))
+    if filters["max_price"]:
+        query = query.where(Advertisement.price <= filters["max_price"])
+    if filters["min_price"]:
+        query = query.where(Advertisement.price >= filters["min_price"])
+    if filters["sort_by_create"]:
+        query = query.order_by(desc(Advertisement.created_at))
+    if filters["sort_by_update"]:
+        query = query.order_by(desc(Advertisement.updated_at))
+    if filters["price_descending"]:
+        query = query.order_by(desc(Advertisement.price))
+    if filters["price_ascending"]:
+        query = query.order_by(Advertisement.price)
+    if filters["sort_by_rating"]:
+        query = query.order_by(
+            Advertisement.rating_avg.desc().nullslast(), desc(Advertisement.id)
+        )
+    return query
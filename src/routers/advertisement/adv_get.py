@@ -1,8 +1,8 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from sqlalchemy import false, select
 from src.dto.adv_dto import AdvertisementGetDTO
 from src.db.base import AsyncSession, get_async_db
-from src.db.models import Advertisement
+from src.db.models import Advertisement, Review
 
 from src.dto.cat_dto import CategoryDTO
 from src.dto.review_dto import ReviewGetDTO
@@ -20,16 +20,18 @@ router = APIRouter()
     response_model=AdvertisementGetDTO,
 )
 async def get_advertisement(
-    adv_id: int, session: AsyncSession = Depends(get_async_db)
+    adv_id: int,
+    response: Response,
+    session: AsyncSession = Depends(get_async_db),
 ) -> AdvertisementGetDTO:
     try:
         stmt = (
             select(Advertisement)
-            .where(Advertisement.id == adv_id)
+            .where(Advertisement.id == adv_id, Advertisement.hidden == false())
             .options(
                 joinedload(Advertisement.categories),
                 joinedload(Advertisement.user),
-                selectinload(Advertisement.reviews),
+                selectinload(Advertisement.reviews.and_(Review.hidden == false())),
             )
         )
 
@@ -42,6 +44,7 @@ async def get_advertisement(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Advertisemet not found"
             )
 
+        response.headers["ETag"] = f'"{advertisement.version}"'
         result = AdvertisementGetDTO.model_validate(
             {
                 **advertisement.__dict__,
@@ -1,23 +1,27 @@
-from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from sqlalchemy import select, update
+from sqlalchemy.exc import IntegrityError
+from src.db.db_func import is_foreign_key_violation
 from src.db.models.category import Category
 from src.db.models.user import User
 from src.dto.adv_dto import AdvertisementUpdateDTO, AdvertisementGetDTO
 from src.db.base import AsyncSession, get_async_db
 from src.db.models import Advertisement
-from src.dto.cat_dto import CategoryDTO
-from src.dto.user_dto import UserGetDTO
-from sqlalchemy.orm import selectinload
-from src.utils.security import (
-    check_admin_or_yours,
-    check_admin,
-    check_auth,
-    get_current_user,
-)
+from src.schemas.deps import if_match_versions
+from src.utils.security import check_auth, get_token_identity
 
 router = APIRouter()
 
+OWNER_COLUMNS = (
+    User.id,
+    User.name,
+    User.surname,
+    User.email,
+    User.is_banned,
+    User.is_admin,
+)
+
 
 @router.patch(
     "/{adv_id}",
@@ -28,59 +32,76 @@ router = APIRouter()
 async def patch_advertisement(
     adv_id: int,
     data: AdvertisementUpdateDTO,
+    response: Response,
     cat_id: Optional[int] = None,
-    user: User = Depends(get_current_user),
+    versions: Optional[List[int]] = Depends(if_match_versions),
+    user: User = Depends(get_token_identity),
     session: AsyncSession = Depends(get_async_db),
 ) -> AdvertisementGetDTO:
+    update_data = data.model_dump(exclude_unset=True)
+    if cat_id:
+        update_data["category_id"] = cat_id
+
+    conditions = [Advertisement.id == adv_id, Advertisement.deleted_at.is_(None)]
+    if not user.is_admin:
+        conditions.append(Advertisement.user_id == user.id)
+    if versions is not None:
+        conditions.append(Advertisement.version.in_(versions))
+
+    updated = (
+        update(Advertisement)
+        .where(*conditions)
+        .values(**update_data, version=Advertisement.version + 1)
+        .returning(*Advertisement.__table__.c)
+        .cte("updated")
+    )
+    stmt = (
+        select(
+            updated,
+            Category.name.label("category_name"),
+            *(column.label(f"owner_{column.key}") for column in OWNER_COLUMNS),
+        )
+        .join(Category, Category.id == updated.c.category_id)
+        .join(User, User.id == updated.c.user_id)
+    )
+
     try:
-        result = await session.execute(
-            select(Advertisement).where(Advertisement.id == adv_id)
+        result = await session.execute(stmt)
+        adv = result.mappings().one_or_none()
+        await session.commit()
+    except IntegrityError as exp:
+        if not is_foreign_key_violation(exp):
+            raise
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Category not found"
         )
-        obj = result.scalar_one_or_none()
 
-        if obj == None:
+    if adv is None:
+        result = await session.execute(
+            select(Advertisement.user_id).where(Advertisement.id == adv_id)
+        )
+        owner_id = result.scalar_one_or_none()
+        if owner_id is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Advertisement not found"
             )
-
-        await check_admin_or_yours(obj.id, user, Advertisement, session)
-
-        if cat_id:
-            result_cat = await session.execute(
-                select(Category).where(Category.id == cat_id)
+        if not user.is_admin and owner_id != user.id:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Insufficient privileges",
             )
-            obj_cat = result_cat.scalar_one_or_none()
-            if obj_cat == None:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND, detail="Category not found"
-                )
-            obj.category_id = cat_id
-
-        update_data = data.model_dump(exclude_unset=True)
-
-        for field, value in update_data.items():
-            setattr(obj, field, value)
-
-        session.add(obj)
-        await session.commit()
-        await session.refresh(obj)
-
-        result = await session.execute(
-            select(Advertisement)
-            .where(Advertisement.id == adv_id)
-            .options(selectinload(Advertisement.categories))
+        raise HTTPException(
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            detail="Version mismatch",
         )
-        new_obj = result.scalar_one()
 
-        adv_data = {
-            **new_obj.__dict__,
-            "user": UserGetDTO.model_validate(user, from_attributes=True),
-            "category": CategoryDTO.model_validate(
-                new_obj.categories, from_attributes=True
-            ),
+    response.headers["ETag"] = f'"{adv["version"]}"'
+    return AdvertisementGetDTO.model_validate(
+        {
+            **adv,
+            "user": {
+                column.key: adv[f"owner_{column.key}"] for column in OWNER_COLUMNS
+            },
+            "category": {"id": adv["category_id"], "name": adv["category_name"]},
         }
-
-        return AdvertisementGetDTO.model_validate(adv_data)
-
-    except HTTPException:
-        raise
+    )
@@ -2,8 +2,10 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy import select
 from src.db.base import AsyncSession, get_async_db
+from src.db.db_func import issue_refresh_token
 from src.db.models import User
-from src.utils.security import verify_password, create_access_token
+from src.dto.auth_dto import TokenDTO
+from src.utils.security import verify_and_update_password, create_access_token
 from datetime import timedelta
 from src.config import settings
 
@@ -13,6 +15,7 @@ router = APIRouter()
 @router.post(
     "/login",
     status_code=status.HTTP_200_OK,
+    response_model=TokenDTO,
 )
 async def sign_in(
     data: OAuth2PasswordRequestForm = Depends(),
@@ -28,11 +31,18 @@ async def sign_in(
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Email is not registred"
         )
-    if verify_password(data.password, user.hashed_password):
+    verified, new_hash = await verify_and_update_password(
+        data.password, user.hashed_password
+    )
+    if verified:
+        if new_hash:
+            user.hashed_password = new_hash
+        refresh_token = await issue_refresh_token(session, user.id)
+        await session.commit()
         access_token = create_access_token(
-            user.__dict__, timedelta(minutes=settings.token_expires)
+            user.__dict__, timedelta(minutes=settings.access_token_expires)
         )
-        return {"access_token": access_token, "token_type": "bearer"}
+        return TokenDTO(access_token=access_token, refresh_token=refresh_token)
 
     else:
         raise HTTPException(
@@ -0,0 +1,25 @@
+from fastapi import APIRouter, Depends, status
+from sqlalchemy import func, update
+from src.db.base import AsyncSession, get_async_db
+from src.db.db_func import hash_refresh_token
+from src.db.models import RefreshToken
+from src.dto.auth_dto import RefreshTokenDTO
+
+router = APIRouter()
+
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT, response_model=None)
+async def sign_out(
+    data: RefreshTokenDTO, session: AsyncSession = Depends(get_async_db)
+) -> None:
+    await session.execute(
+        update(RefreshToken)
+        .where(
+            RefreshToken.token_hash == hash_refresh_token(data.refresh_token),
+            RefreshToken.revoked_at.is_(None),
+            RefreshToken.rotated_at.is_(None),
+        )
+        .values(revoked_at=func.now())
+    )
+    await session.commit()
+    return None
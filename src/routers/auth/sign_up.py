@@ -3,7 +3,7 @@ from sqlalchemy import select
 from src.dto.user_dto import UserDTO, UserGetDTO
 from src.db.base import AsyncSession, get_async_db
 from src.db.models import User
-from src.utils.security import get_password_hash
+from src.utils.security import hash_password_async
 
 router = APIRouter()
 
@@ -20,7 +20,7 @@ async def sign_up(data: UserDTO, session: AsyncSession = Depends(get_async_db)):
             status_code=status.HTTP_400_BAD_REQUEST, detail="Email already registered"
         )
 
-    hashed_password = get_password_hash(data.hashed_password.get_secret_value())
+    hashed_password = await hash_password_async(data.hashed_password.get_secret_value())
     data.hashed_password = hashed_password
     new_user = User(**data.model_dump())
 
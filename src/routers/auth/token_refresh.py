@@ -0,0 +1,90 @@
+from datetime import timedelta
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import func, insert, literal, or_, select, update
+from src.config import settings
+from src.db.base import AsyncSession, get_async_db
+from src.db.db_func import (
+    hash_refresh_token,
+    new_refresh_token,
+    refresh_token_expiry,
+    revoke_refresh_tokens,
+)
+from src.db.models import RefreshToken, User
+from src.dto.auth_dto import RefreshTokenDTO, TokenDTO
+from src.utils.revocation import revoke_user
+from src.utils.security import create_access_token
+
+router = APIRouter()
+
+
+@router.post("/refresh", status_code=status.HTTP_200_OK, response_model=TokenDTO)
+async def refresh_access_token(
+    data: RefreshTokenDTO, session: AsyncSession = Depends(get_async_db)
+) -> TokenDTO:
+    token_hash = hash_refresh_token(data.refresh_token)
+    token, new_hash = new_refresh_token()
+
+    # Замененный токен еще refresh_reuse_grace секунд выдает новые пары, чтобы
+    # одновременные обновления из нескольких вкладок не считались кражей
+    rotated = (
+        update(RefreshToken)
+        .where(
+            RefreshToken.token_hash == token_hash,
+            RefreshToken.revoked_at.is_(None),
+            RefreshToken.expires_at > func.now(),
+            or_(
+                RefreshToken.rotated_at.is_(None),
+                RefreshToken.rotated_at
+                > func.now() - timedelta(seconds=settings.refresh_reuse_grace),
+            ),
+        )
+        .values(rotated_at=func.coalesce(RefreshToken.rotated_at, func.now()))
+        .returning(RefreshToken.user_id)
+        .cte("rotated")
+    )
+    issued = (
+        insert(RefreshToken)
+        .from_select(
+            ["user_id", "token_hash", "expires_at"],
+            select(
+                rotated.c.user_id, literal(new_hash), literal(refresh_token_expiry())
+            ),
+        )
+        .returning(RefreshToken.user_id)
+        .cte("issued")
+    )
+    result = await session.execute(
+        select(User.id, User.is_admin, User.is_banned).join(
+            issued, issued.c.user_id == User.id
+        )
+    )
+    user = result.mappings().one_or_none()
+
+    if user is None:
+        result = await session.execute(
+            select(
+                RefreshToken.user_id, RefreshToken.revoked_at, RefreshToken.rotated_at
+            ).where(RefreshToken.token_hash == token_hash)
+        )
+        stored = result.one_or_none()
+        if (
+            stored is not None
+            and stored.rotated_at is not None
+            and stored.revoked_at is None
+        ):
+            # Повторное использование уже замененного токена: скорее всего он
+            # украден, поэтому отзываются все сессии пользователя
+            await revoke_refresh_tokens(session, stored.user_id)
+            await revoke_user(session, stored.user_id)
+            await session.commit()
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid refresh token",
+        )
+
+    await session.commit()
+    access_token = create_access_token(
+        dict(user), timedelta(minutes=settings.access_token_expires)
+    )
+    return TokenDTO(access_token=access_token, refresh_token=token)
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends
 from src.routers.category.cat_post import router as post_router
 from src.routers.category.cat_delete import router as delete_router
 from src.routers.category.cat_get import router as get_router
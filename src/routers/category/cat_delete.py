@@ -1,27 +1,120 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import delete, select, update
+from sqlalchemy.exc import IntegrityError
+from src.config import settings
 from src.db.base import AsyncSession, get_async_db
-from src.db.models import Category
+from src.db.db_func import is_foreign_key_violation
+from src.db.models import Advertisement, Category, Complaint, Review
+from src.dto.cat_dto import CategoryDeleteDTO
 
 router = APIRouter()
 
 
-@router.delete("/{cat_id}", status_code=status.HTTP_204_NO_CONTENT, response_model=None)
+def reassign_not_found() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND, detail="Reassign category not found"
+    )
+
+
+async def lock_categories(session: AsyncSession, cat_id: int, reassign_to: int):
+    """Блокирует удаляемую категорию на запись, а целевую на чтение, чтобы ее
+    не удалили во время переноса. Блокировки берутся в порядке id, поэтому
+    встречные удаления с переносом друг в друга не взаимоблокируются."""
+    for category_id in sorted((cat_id, reassign_to)):
+        locked = await session.scalar(
+            select(Category.id)
+            .where(Category.id == category_id)
+            .with_for_update(read=category_id == reassign_to)
+        )
+        if locked is None and category_id == reassign_to:
+            raise reassign_not_found()
+
+
+async def move_advertisements(
+    session: AsyncSession, cat_id: int, reassign_to: int, batch_size: int
+) -> int:
+    """Переносит объявления, включая удаленные, пачками, каждая пачка в своей
+    транзакции, чтобы не держать блокировки на все объявления категории.
+    Категории блокируются в каждой пачке, поэтому новые объявления в
+    удаляемую не попадут; последняя неполная пачка остается в открытой
+    транзакции вместе с удалением категории."""
+    moved = 0
+    while True:
+        await lock_categories(session, cat_id, reassign_to)
+        batch = (
+            select(Advertisement.id)
+            .where(Advertisement.category_id == cat_id)
+            .limit(batch_size)
+        )
+        result = await session.execute(
+            update(Advertisement)
+            .where(Advertisement.id.in_(batch.scalar_subquery()))
+            .values(category_id=reassign_to, version=Advertisement.version + 1)
+        )
+        moved += result.rowcount
+        if result.rowcount < batch_size:
+            return moved
+        await session.commit()
+
+
+async def delete_tombstones(session: AsyncSession, cat_id: int):
+    """Стирает удаленные объявления категории вместе с их отзывами и
+    жалобами: до очистки они продолжают ссылаться на категорию."""
+    tombstones = select(Advertisement.id).where(
+        Advertisement.category_id == cat_id, Advertisement.deleted_at.is_not(None)
+    )
+    await session.execute(delete(Review).where(Review.adv_id.in_(tombstones)))
+    await session.execute(delete(Complaint).where(Complaint.adv_id.in_(tombstones)))
+    await session.execute(delete(Advertisement).where(Advertisement.id.in_(tombstones)))
+
+
+@router.delete(
+    "/{cat_id}", status_code=status.HTTP_200_OK, response_model=CategoryDeleteDTO
+)
 async def delete_category(
-    cat_id: int, session: AsyncSession = Depends(get_async_db)
-) -> None:
-    try:
-        result = await session.execute(select(Category).where(Category.id == cat_id))
-        obj = result.scalar_one_or_none()
+    cat_id: int,
+    reassign_to: Optional[int] = Query(
+        description="Категория, в которую перенести объявления удаляемой",
+        default=None,
+    ),
+    session: AsyncSession = Depends(get_async_db),
+) -> CategoryDeleteDTO:
+    if reassign_to == cat_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Cannot reassign to the deleted category",
+        )
 
-        if obj == None:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND, detail="Category not found"
+    ids = [cat_id] if reassign_to is None else [cat_id, reassign_to]
+    result = await session.execute(select(Category.id).where(Category.id.in_(ids)))
+    found = set(result.scalars())
+    if cat_id not in found:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Category not found"
+        )
+    if reassign_to is not None and reassign_to not in found:
+        raise reassign_not_found()
+
+    moved = 0
+    try:
+        if reassign_to is not None:
+            moved = await move_advertisements(
+                session, cat_id, reassign_to, settings.category_reassign_batch_size
             )
-        await session.delete(obj)
+        else:
+            await delete_tombstones(session, cat_id)
+        await session.execute(delete(Category).where(Category.id == cat_id))
         await session.commit()
+    except IntegrityError as exp:
+        if not is_foreign_key_violation(exp):
+            raise
+        await session.rollback()
+        if reassign_to is not None:
+            raise reassign_not_found()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Category has advertisements, pass reassign_to",
+        )
 
-    except HTTPException:
-        raise
-
-    return None
+    return CategoryDeleteDTO(id=cat_id, moved=moved)
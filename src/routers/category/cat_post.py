@@ -1,5 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from src.dto.cat_dto import CategoryCreateDTO, CategoryGetDTO
+from src.dto.cat_dto import CategoryCreateDTO
 from src.db.base import AsyncSession, get_async_db
 from src.db.models import Category
 from sqlalchemy.exc import IntegrityError
@@ -1,9 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends
 from src.routers.complaint.comp_post import router as post_router
+from src.routers.complaint.comp_bulk import router as bulk_router
 from src.routers.complaint.comp_get import router as get_router
 from src.routers.complaint.comp_patch import router as patch_router
 from src.routers.complaint.comp_delete import router as deletr_router
 from src.routers.complaint.comp_get_all import router as get_all_router
+from src.routers.complaint.comp_queue import router as queue_router
 
 
 from src.utils.security import check_auth
@@ -12,7 +14,9 @@ router = APIRouter(
     prefix="/complaint", tags=["Complaint"], dependencies=[Depends(check_auth)]
 )
 
+router.include_router(bulk_router)
 router.include_router(post_router)
+router.include_router(queue_router)
 router.include_router(get_router)
 router.include_router(patch_router)
 router.include_router(deletr_router)
@@ -0,0 +1,45 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.exc import IntegrityError
+from src.db.base import AsyncSession, get_async_db
+from src.db.complaint_stats import refresh_complaint_stats
+from src.db.db_func import bulk_conditions, is_unique_violation
+from src.db.models import Complaint
+from src.db.soft_delete import mark_deleted, mark_restored
+from src.dto.comp_dto import ComplaintBulkDTO, ComplaintBulkResultDTO
+from src.utils.security import check_admin
+
+router = APIRouter()
+
+
+@router.post(
+    "/bulk",
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(check_admin)],
+    response_model=ComplaintBulkResultDTO,
+)
+async def bulk_complaints(
+    data: ComplaintBulkDTO,
+    session: AsyncSession = Depends(get_async_db),
+) -> ComplaintBulkResultDTO:
+    try:
+        conditions = bulk_conditions(Complaint, data.ids, data.adv_id, data.user_id)
+    except ValueError as exp:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exp))
+
+    mark = mark_deleted if data.action == "delete" else mark_restored
+    try:
+        result = await session.execute(
+            mark(Complaint, *conditions).returning(Complaint.adv_id)
+        )
+    except IntegrityError as exp:
+        if not is_unique_violation(exp):
+            raise
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Restored complaints duplicate existing ones",
+        )
+    adv_ids = result.scalars().all()
+    await refresh_complaint_stats(session, adv_ids)
+    await session.commit()
+
+    return ComplaintBulkResultDTO(action=data.action, affected=len(adv_ids))
@@ -1,8 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy import select
 from src.db.base import AsyncSession, get_async_db
+from src.db.complaint_stats import refresh_complaint_stats
 from src.db.models import Complaint
-from src.utils.security import check_admin, check_admin_or_yours, get_current_user
+from src.db.soft_delete import soft_delete
+from src.utils.security import check_admin_or_yours, get_token_identity
 
 router = APIRouter()
 
@@ -15,7 +17,7 @@ router = APIRouter()
 async def delete_complaint(
     comp_id: int,
     session: AsyncSession = Depends(get_async_db),
-    user=Depends(get_current_user),
+    user=Depends(get_token_identity),
 ) -> None:
     try:
         result = await session.execute(select(Complaint).where(Complaint.id == comp_id))
@@ -26,7 +28,8 @@ async def delete_complaint(
             )
         await check_admin_or_yours(obj.id, user, Complaint, session)
 
-        session.delete(obj)
+        await soft_delete(session, Complaint, Complaint.id == obj.id)
+        await refresh_complaint_stats(session, [obj.adv_id])
         await session.commit()
 
     except HTTPException:
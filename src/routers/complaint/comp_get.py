@@ -4,7 +4,7 @@ from src.db.models.user import User
 from src.dto.comp_dto import ComplaintGetDTO
 from src.db.base import AsyncSession, get_async_db
 from src.db.models import Complaint
-from src.utils.security import check_admin_or_yours, get_current_user
+from src.utils.security import check_admin_or_yours, get_token_identity
 
 router = APIRouter()
 
@@ -15,7 +15,7 @@ router = APIRouter()
 async def get_complaint(
     comp_id: int,
     session: AsyncSession = Depends(get_async_db),
-    user: User = Depends(get_current_user),
+    user: User = Depends(get_token_identity),
 ) -> ComplaintGetDTO:
     try:
 
@@ -1,6 +1,6 @@
 from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import desc, func, select
+from sqlalchemy import desc, false, func, select
 from src.db.base import AsyncSession, get_async_db
 from src.db.models.complaint import Complaint
 from src.schemas.paginate import PaginatedResponse
@@ -34,7 +34,7 @@ async def get_complaint_all(
 ) -> PaginatedResponse[ComplaintGetDTO]:
     try:
 
-        query = select(Complaint)
+        query = select(Complaint).where(Complaint.hidden == false())
 
         if adv_id:
             query = query.where(Complaint.adv_id == adv_id)
@@ -1,11 +1,13 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 from src.db.models.complaint import Complaint
 
 from src.db.models.user import User
 from src.db.base import AsyncSession, get_async_db
+from src.db.db_func import complaint_content_hash, is_unique_violation
 from src.dto.comp_dto import ComplaintGetDTO, ComplaintUpdateDTO
-from src.utils.security import check_admin_or_yours, get_current_user
+from src.utils.security import check_admin_or_yours, get_token_identity
 
 router = APIRouter()
 
@@ -17,7 +19,7 @@ async def change_complaint(
     comp_id: int,
     data: ComplaintUpdateDTO,
     session: AsyncSession = Depends(get_async_db),
-    user: User = Depends(get_current_user),
+    user: User = Depends(get_token_identity),
 ) -> ComplaintUpdateDTO:
     try:
         result = await session.execute(select(Complaint).where(Complaint.id == comp_id))
@@ -31,9 +33,19 @@ async def change_complaint(
         update_data = data.model_dump(exclude_unset=True)
         for field, value in update_data.items():
             setattr(obj, field, value)
+        if "description" in update_data:
+            obj.content_hash = complaint_content_hash(obj.description)
 
         session.add(obj)
-        await session.commit()
+        try:
+            await session.commit()
+        except IntegrityError as exp:
+            if not is_unique_violation(exp):
+                raise
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Same complaint already exists",
+            )
         await session.refresh(obj)
 
         return obj
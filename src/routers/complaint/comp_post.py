@@ -1,14 +1,15 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
-from src.db.models.advertisement import Advertisement
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from src.db.models.complaint import Complaint
 from src.db.models.user import User
 from src.db.base import AsyncSession, get_async_db
-from src.dto.adv_dto import AdvertisementGetMinDTO
+from src.db.complaint_stats import record_complaint
+from src.db.db_func import (
+    complaint_content_hash,
+    complaint_dedup_bucket,
+    insert_feedback,
+)
 from src.dto.comp_dto import ComplaintCreateDTO, ComplaintGetDTO
-from src.dto.user_dto import UserGetDTO
-from src.utils.security import check_auth, get_current_user
-from sqlalchemy.orm import selectinload
+from src.utils.security import check_auth, get_token_identity
 
 router = APIRouter()
 
@@ -22,33 +23,42 @@ router = APIRouter()
 async def create_complaint(
     adv_id: int,
     data: ComplaintCreateDTO,
+    response: Response,
     session: AsyncSession = Depends(get_async_db),
-    user: User = Depends(get_current_user),
+    user: User = Depends(get_token_identity),
 ) -> ComplaintGetDTO:
     try:
-
-        result = await session.execute(
-            select(Advertisement).where(Advertisement.id == adv_id)
+        # Та же жалоба в пределах окна complaint_dedup_window не создает новую
+        # строку и не увеличивает счетчик очереди модерации
+        owner_id, new_obj, created = await insert_feedback(
+            session,
+            Complaint,
+            {
+                **data.model_dump(),
+                "user_id": user.id,
+                "adv_id": adv_id,
+                "content_hash": complaint_content_hash(data.description),
+                "dedup_bucket": complaint_dedup_bucket(),
+            },
+            ("user_id", "adv_id", "content_hash", "dedup_bucket"),
         )
-        adv = result.scalar_one_or_none()
-
-        if adv == None:
+        if owner_id is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Advertisement not found"
             )
-        if adv.user_id == user.id:
+        if owner_id == user.id:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="You cannot leave complaints about your ads",
             )
-
-        new_obj = Complaint(**data.model_dump(), user_id=user.id, adv_id=adv_id)
-
-        session.add(new_obj)
+        if created:
+            await record_complaint(session, adv_id)
+        else:
+            response.status_code = status.HTTP_200_OK
+        result = ComplaintGetDTO.model_validate(new_obj, from_attributes=True)
         await session.commit()
-        await session.refresh(new_obj)
 
-        return ComplaintGetDTO.model_validate(new_obj, from_attributes=True)
+        return result
 
     except Exception as exp:
         raise
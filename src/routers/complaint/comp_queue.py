@@ -0,0 +1,59 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import false, select, tuple_
+from src.db.base import AsyncSession, get_async_db
+from src.db.complaint_stats import current_score
+from src.db.models import Advertisement, ComplaintStats
+from src.dto.comp_dto import ComplaintQueueItemDTO
+from src.schemas.deps import cursor_params
+from src.schemas.paginate import CursorPage
+from src.utils.security import check_admin
+
+router = APIRouter()
+
+
+@router.get(
+    "/queue",
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(check_admin)],
+    response_model=CursorPage[ComplaintQueueItemDTO],
+)
+async def get_complaint_queue(
+    pagination: dict = Depends(cursor_params),
+    session: AsyncSession = Depends(get_async_db),
+) -> CursorPage[ComplaintQueueItemDTO]:
+    """Объявления по убыванию числа недавних жалоб: каждая жалоба весит
+    вдвое меньше с каждыми сутками. Страница читается по индексу
+    (rank, adv_id) с позиции курсора."""
+    query = (
+        select(
+            ComplaintStats.adv_id,
+            Advertisement.name.label("adv_name"),
+            ComplaintStats.complaints,
+            current_score(ComplaintStats.rank).label("score"),
+            ComplaintStats.last_complaint_at,
+            ComplaintStats.rank,
+        )
+        .join(Advertisement, Advertisement.id == ComplaintStats.adv_id)
+        .where(Advertisement.hidden == false())
+        .order_by(ComplaintStats.rank.desc(), ComplaintStats.adv_id.desc())
+        .limit(pagination["size"] + 1)
+    )
+    after = pagination["after"]
+    if after is not None:
+        try:
+            rank, adv_id = after
+            after = (float(rank), int(adv_id))
+        except (TypeError, ValueError):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+            )
+        query = query.where(
+            tuple_(ComplaintStats.rank, ComplaintStats.adv_id) < tuple_(*after)
+        )
+
+    result = await session.execute(query)
+    return CursorPage.create(
+        items=result.mappings().all(),
+        size=pagination["size"],
+        sort_key=lambda row: (row["rank"], row["adv_id"]),
+    )
@@ -0,0 +1,13 @@
+from fastapi import APIRouter, Depends
+from src.routers.me.me_adv import router as adv_router
+from src.routers.me.me_reviews import router as reviews_router
+from src.routers.me.me_complaints import router as complaints_router
+
+
+from src.utils.security import check_auth
+
+router = APIRouter(prefix="/me", tags=["Me"], dependencies=[Depends(check_auth)])
+
+router.include_router(adv_router)
+router.include_router(reviews_router)
+router.include_router(complaints_router)
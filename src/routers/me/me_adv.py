@@ -0,0 +1,42 @@
+from fastapi import APIRouter, Depends, status
+from sqlalchemy import select
+from src.db.base import AsyncSession, get_async_db
+from src.db.models import Advertisement
+from src.db.models.category import Category
+from src.db.models.user import User
+from src.dto.adv_dto import AdvertisementGetMinDTO
+from src.routers.me.me_paging import created_at_key, newest_first
+from src.schemas.deps import cursor_params
+from src.schemas.paginate import CursorPage
+from src.utils.security import get_token_identity
+
+router = APIRouter()
+
+
+@router.get(
+    "/adv",
+    status_code=status.HTTP_200_OK,
+    response_model=CursorPage[AdvertisementGetMinDTO],
+)
+async def get_my_advertisements(
+    pagination: dict = Depends(cursor_params),
+    user: User = Depends(get_token_identity),
+    session: AsyncSession = Depends(get_async_db),
+) -> CursorPage[AdvertisementGetMinDTO]:
+    query = select(
+        Advertisement.id,
+        Advertisement.name,
+        Advertisement.price,
+        Category.name.label("category_name"),
+        Advertisement.created_at,
+        Advertisement.updated_at,
+        Advertisement.rating_count,
+        Advertisement.rating_avg,
+        Advertisement.rating_histogram,
+    ).join(Category, Category.id == Advertisement.category_id)
+    query = newest_first(query, Advertisement, user.id, pagination)
+
+    result = await session.execute(query)
+    return CursorPage.create(
+        items=result.all(), size=pagination["size"], sort_key=created_at_key
+    )
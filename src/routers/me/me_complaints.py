@@ -0,0 +1,30 @@
+from fastapi import APIRouter, Depends, status
+from sqlalchemy import select
+from src.db.base import AsyncSession, get_async_db
+from src.db.models import Complaint
+from src.db.models.user import User
+from src.dto.comp_dto import ComplaintGetDTO
+from src.routers.me.me_paging import created_at_key, newest_first
+from src.schemas.deps import cursor_params
+from src.schemas.paginate import CursorPage
+from src.utils.security import get_token_identity
+
+router = APIRouter()
+
+
+@router.get(
+    "/complaints",
+    status_code=status.HTTP_200_OK,
+    response_model=CursorPage[ComplaintGetDTO],
+)
+async def get_my_complaints(
+    pagination: dict = Depends(cursor_params),
+    user: User = Depends(get_token_identity),
+    session: AsyncSession = Depends(get_async_db),
+) -> CursorPage[ComplaintGetDTO]:
+    query = newest_first(select(Complaint), Complaint, user.id, pagination)
+
+    result = await session.execute(query)
+    return CursorPage.create(
+        items=result.scalars().all(), size=pagination["size"], sort_key=created_at_key
+    )
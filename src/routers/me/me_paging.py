@@ -0,0 +1,28 @@
+from datetime import datetime
+from fastapi import HTTPException, status
+from sqlalchemy import Select, tuple_
+
+
+def newest_first(query: Select, model, user_id: int, pagination: dict) -> Select:
+    """Записи пользователя от новых к старым с позиции курсора: один проход
+    по индексу (user_id, created_at, id)."""
+    query = (
+        query.where(model.user_id == user_id)
+        .order_by(model.created_at.desc(), model.id.desc())
+        .limit(pagination["size"] + 1)
+    )
+    after = pagination["after"]
+    if after is not None:
+        try:
+            created_at, row_id = after
+            after = (datetime.fromisoformat(created_at), int(row_id))
+        except (TypeError, ValueError):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+            )
+        query = query.where(tuple_(model.created_at, model.id) < tuple_(*after))
+    return query
+
+
+def created_at_key(row) -> tuple:
+    return row.created_at.isoformat(), row.id
@@ -1,5 +1,6 @@
 from fastapi import APIRouter, Depends
 from src.routers.review.review_post import router as post_router
+from src.routers.review.review_bulk import router as bulk_router
 from src.routers.review.review_get import router as get_router
 from src.routers.review.review_patch import router as patch_router
 from src.routers.review.review_delete import router as deletr_router
@@ -12,6 +13,7 @@ router = APIRouter(
     prefix="/review", tags=["Review"], dependencies=[Depends(check_auth)]
 )
 
+router.include_router(bulk_router)
 router.include_router(post_router)
 router.include_router(get_router)
 router.include_router(patch_router)
@@ -0,0 +1,45 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.exc import IntegrityError
+from src.db.base import AsyncSession, get_async_db
+from src.db.db_func import bulk_conditions, is_unique_violation
+from src.db.models import Review
+from src.db.ratings import refresh_ratings
+from src.db.soft_delete import mark_deleted, mark_restored
+from src.dto.review_dto import ReviewBulkDTO, ReviewBulkResultDTO
+from src.utils.security import check_admin
+
+router = APIRouter()
+
+
+@router.post(
+    "/bulk",
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(check_admin)],
+    response_model=ReviewBulkResultDTO,
+)
+async def bulk_reviews(
+    data: ReviewBulkDTO,
+    session: AsyncSession = Depends(get_async_db),
+) -> ReviewBulkResultDTO:
+    try:
+        conditions = bulk_conditions(Review, data.ids, data.adv_id, data.user_id)
+    except ValueError as exp:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exp))
+
+    mark = mark_deleted if data.action == "delete" else mark_restored
+    try:
+        result = await session.execute(
+            mark(Review, *conditions).returning(Review.adv_id)
+        )
+    except IntegrityError as exp:
+        if not is_unique_violation(exp):
+            raise
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Restored reviews duplicate existing ones",
+        )
+    adv_ids = result.scalars().all()
+    await refresh_ratings(session, adv_ids)
+    await session.commit()
+
+    return ReviewBulkResultDTO(action=data.action, affected=len(adv_ids))
@@ -1,8 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy import select
 from src.db.base import AsyncSession, get_async_db
-from src.db.models import Complaint
-from src.utils.security import check_admin_or_yours, get_current_user
+from src.db.models import Review
+from src.db.ratings import record_rating
+from src.db.soft_delete import soft_delete
+from src.utils.security import check_admin_or_yours, get_token_identity
 
 router = APIRouter()
 
@@ -15,21 +17,25 @@ router = APIRouter()
 async def delete_review(
     rev_id: int,
     session: AsyncSession = Depends(get_async_db),
-    user=Depends(get_current_user),
+    user=Depends(get_token_identity),
 ) -> None:
     try:
 
-        result = await session.execute(select(Complaint).where(Complaint.id == rev_id))
+        result = await session.execute(
+            select(Review).where(Review.id == rev_id).with_for_update()
+        )
         obj = result.scalar_one_or_none()
 
-        await check_admin_or_yours(obj.id, user, Complaint, session)
-
         if obj == None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Review not found"
             )
 
-        session.delete(obj)
+        await check_admin_or_yours(obj.id, user, Review, session)
+
+        await soft_delete(session, Review, Review.id == obj.id)
+        if not obj.hidden:
+            await record_rating(session, obj.adv_id, old=obj.rating)
         await session.commit()
 
     except HTTPException:
@@ -1,5 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import false, select
 from src.db.models.review import Review
 from src.dto.review_dto import ReviewGetDTO
 from src.db.base import AsyncSession, get_async_db
@@ -12,7 +12,9 @@ async def get_review(
     rev_id: int, session: AsyncSession = Depends(get_async_db)
 ) -> ReviewGetDTO:
     try:
-        result = await session.execute(select(Review).where(Review.id == rev_id))
+        result = await session.execute(
+            select(Review).where(Review.id == rev_id, Review.hidden == false())
+        )
         obj = result.scalar_one_or_none()
 
         if obj == None:
@@ -1,6 +1,6 @@
 from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import desc, func, select
+from sqlalchemy import desc, false, func, select
 from src.db.base import AsyncSession, get_async_db
 from src.db.models.review import Review
 from src.dto.review_dto import ReviewGetDTO
@@ -34,7 +34,7 @@ async def get_review_all(
 ) -> PaginatedResponse[ReviewGetDTO]:
     try:
 
-        query = select(Review)
+        query = select(Review).where(Review.hidden == false())
 
         if adv_id:
             query = query.where(Review.adv_id == adv_id)
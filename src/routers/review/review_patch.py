@@ -3,8 +3,9 @@ from sqlalchemy import select
 from src.db.models.review import Review
 from src.db.models.user import User
 from src.db.base import AsyncSession, get_async_db
+from src.db.ratings import record_rating
 from src.dto.review_dto import ReviewGetDTO, ReviewUpdateDTO
-from src.utils.security import check_admin_or_yours, get_current_user
+from src.utils.security import check_admin_or_yours, get_token_identity
 
 router = APIRouter()
 
@@ -14,10 +15,12 @@ async def change_review(
     rev_id: int,
     data: ReviewUpdateDTO,
     session: AsyncSession = Depends(get_async_db),
-    user: User = Depends(get_current_user),
+    user: User = Depends(get_token_identity),
 ) -> ReviewUpdateDTO:
     try:
-        result = await session.execute(select(Review).where(Review.id == rev_id))
+        result = await session.execute(
+            select(Review).where(Review.id == rev_id).with_for_update()
+        )
         obj = result.scalar_one_or_none()
 
         if obj == None:
@@ -28,6 +31,8 @@ async def change_review(
         await check_admin_or_yours(obj.id, user, Review, session)
 
         update_data = data.model_dump(exclude_unset=True)
+        if "rating" in update_data and not obj.hidden:
+            await record_rating(session, obj.adv_id, obj.rating, update_data["rating"])
         for field, value in update_data.items():
             setattr(obj, field, value)
 
@@ -1,11 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
-from src.db.models.advertisement import Advertisement
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from src.db.models.review import Review
 from src.db.models.user import User
 from src.db.base import AsyncSession, get_async_db
+from src.db.db_func import insert_feedback
+from src.db.ratings import record_rating
 from src.dto.review_dto import ReviewGetDTO, ReviewCreateDTO
-from src.utils.security import check_auth, get_current_user
+from src.utils.security import check_auth, get_token_identity
 
 router = APIRouter()
 
@@ -19,33 +19,35 @@ router = APIRouter()
 async def create_review(
     adv_id: int,
     data: ReviewCreateDTO,
+    response: Response,
     session: AsyncSession = Depends(get_async_db),
-    user: User = Depends(get_current_user),
+    user: User = Depends(get_token_identity),
 ) -> ReviewGetDTO:
     try:
-
-        result = await session.execute(
-            select(Advertisement).where(Advertisement.id == adv_id)
+        # Повторный отзыв того же пользователя возвращает уже существующий
+        owner_id, new_obj, created = await insert_feedback(
+            session,
+            Review,
+            {**data.model_dump(), "user_id": user.id, "adv_id": adv_id},
+            ("user_id", "adv_id"),
         )
-        adv = result.scalar_one_or_none()
-
-        if adv == None:
+        if owner_id is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Advertisement not found"
             )
-        if adv.user_id == user.id:
+        if owner_id == user.id:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="You cannot leave reviews on your ads",
             )
-
-        new_obj = Review(**data.model_dump(), user_id=user.id, adv_id=adv_id)
-
-        session.add(new_obj)
+        if created:
+            await record_rating(session, adv_id, new=data.rating)
+        else:
+            response.status_code = status.HTTP_200_OK
+        result = ReviewGetDTO.model_validate(new_obj, from_attributes=True)
         await session.commit()
-        await session.refresh(new_obj)
 
-        return ReviewGetDTO.model_validate(new_obj, from_attributes=True)
+        return result
 
     except Exception as exp:
         raise
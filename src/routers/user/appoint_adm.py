@@ -3,6 +3,7 @@ from sqlalchemy import select
 from src.dto.user_dto import UserGetDTO
 from src.db.base import AsyncSession, get_async_db
 from src.db.models import User
+from src.utils.revocation import revoke_user
 
 router = APIRouter()
 
@@ -28,6 +29,7 @@ async def appoint_adm(
         user.is_admin = True
 
         session.add(user)
+        await revoke_user(session, user_id)
         await session.commit()
         await session.refresh(user)
         return UserGetDTO.model_validate(user, from_attributes=True)
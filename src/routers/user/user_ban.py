@@ -1,9 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
 from sqlalchemy import select
 from src.dto.user_dto import UserGetDTO
 from src.db.base import AsyncSession, get_async_db
+from src.db.db_func import revoke_refresh_tokens
 from src.db.models import User
-from src.utils.security import get_current_user
+from src.sevices.moderation import sync_hidden_content
+from src.utils.revocation import revoke_user
+from src.utils.security import get_token_identity
 
 router = APIRouter()
 
@@ -13,8 +16,9 @@ router = APIRouter()
 )
 async def user_ban(
     user_id: int,
+    background_tasks: BackgroundTasks,
     session: AsyncSession = Depends(get_async_db),
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_token_identity),
 ) -> UserGetDTO:
     try:
         result = await session.execute(select(User).where(User.id == user_id))
@@ -31,8 +35,11 @@ async def user_ban(
         user.is_banned = True
 
         session.add(user)
+        await revoke_user(session, user_id)
+        await revoke_refresh_tokens(session, user_id)
         await session.commit()
         await session.refresh(user)
+        background_tasks.add_task(sync_hidden_content, user_id)
 
     except HTTPException:
         raise
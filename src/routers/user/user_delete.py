@@ -1,8 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
-from src.dto.user_dto import UserDTO
 from src.db.base import AsyncSession, get_async_db
-from src.db.models import User
+from src.db.db_func import delete_user_cascade
+from src.utils.revocation import revoke_user
 
 router = APIRouter()
 
@@ -13,18 +12,11 @@ router = APIRouter()
 async def delete_user(
     user_id: int, session: AsyncSession = Depends(get_async_db)
 ) -> None:
-    try:
-        result = await session.execute(select(User).where(User.id == user_id))
-        user = result.scalar_one_or_none()
-
-        if user == None:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
-            )
-        await session.delete(user)
-        await session.commit()
-
-    except HTTPException:
-        raise
+    if not await delete_user_cascade(session, user_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
+        )
+    await revoke_user(session, user_id)
+    await session.commit()
 
     return None
@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy import select
-from src.dto.user_dto import UserDTO, UserGetDTO
+from src.dto.user_dto import UserGetDTO
 from src.db.base import AsyncSession, get_async_db
 from src.db.models import User
 
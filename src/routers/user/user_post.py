@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, status
 from src.dto.user_dto import UserDTO
 from src.db.base import AsyncSession, get_async_db
 from src.db.models import User
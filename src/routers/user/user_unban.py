@@ -1,8 +1,10 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
 from sqlalchemy import select
 from src.dto.user_dto import UserGetDTO
 from src.db.base import AsyncSession, get_async_db
 from src.db.models import User
+from src.sevices.moderation import sync_hidden_content
+from src.utils.revocation import revoke_user
 
 router = APIRouter()
 
@@ -11,7 +13,9 @@ router = APIRouter()
     "/unban/{user_id}", status_code=status.HTTP_200_OK, response_model=UserGetDTO
 )
 async def user_unban(
-    user_id: int, session: AsyncSession = Depends(get_async_db)
+    user_id: int,
+    background_tasks: BackgroundTasks,
+    session: AsyncSession = Depends(get_async_db),
 ) -> UserGetDTO:
     try:
         result = await session.execute(select(User).where(User.id == user_id))
@@ -24,8 +28,10 @@ async def user_unban(
         user.is_banned = False
 
         session.add(user)
+        await revoke_user(session, user_id)
         await session.commit()
         await session.refresh(user)
+        background_tasks.add_task(sync_hidden_content, user_id)
 
         return UserGetDTO.model_validate(user, from_attributes=True)
 
@@ -1,4 +1,6 @@
-from fastapi import Query
+from typing import List, Optional
+from fastapi import Header, HTTPException, Query, status
+from src.schemas.paginate import decode_cursor
 
 
 def pagination_params(
@@ -6,3 +8,39 @@ def pagination_params(
     size: int = Query(20, ge=1, le=100, description="page size"),
 ):
     return {"page": page, "size": size}
+
+
+def cursor_params(
+    cursor: Optional[str] = Query(
+        None, description="next_cursor из предыдущей страницы"
+    ),
+    size: int = Query(20, ge=1, le=100, description="page size"),
+):
+    after = None
+    if cursor is not None:
+        try:
+            after = decode_cursor(cursor)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+            )
+    return {"after": after, "size": size}
+
+
+def if_match_versions(
+    if_match: Optional[str] = Header(
+        None, description="ETag версии объекта, полученный ранее"
+    ),
+) -> Optional[List[int]]:
+    if if_match is None or if_match.strip() == "*":
+        return None
+    versions = []
+    for tag in if_match.split(","):
+        tag = tag.strip().removeprefix("W/").strip('"')
+        if not tag.isdigit():
+            raise HTTPException(
+                status_code=status.HTTP_412_PRECONDITION_FAILED,
+                detail="Version mismatch",
+            )
+        versions.append(int(tag))
+    return versions
@@ -1,5 +1,7 @@
+import base64
+import json
 from pydantic import BaseModel, Field
-from typing import Generic, TypeVar, List
+from typing import Generic, Optional, Sequence, TypeVar, List
 
 T = TypeVar("T")
 
@@ -20,3 +22,35 @@ class PaginatedResponse(BaseModel, Generic[T]):
             size=size,
             pages=(total + size - 1) // size,
         )
+
+
+def encode_cursor(values: Sequence) -> str:
+    """Ключ сортировки последней строки страницы -> непрозрачная строка"""
+    return base64.urlsafe_b64encode(json.dumps(list(values)).encode()).decode()
+
+
+def decode_cursor(cursor: str) -> list:
+    """Обратное к encode_cursor, ValueError для испорченного курсора"""
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (ValueError, UnicodeError) as exp:
+        raise ValueError("Invalid cursor") from exp
+    if not isinstance(values, list):
+        raise ValueError("Invalid cursor")
+    return values
+
+
+class CursorPage(BaseModel, Generic[T]):
+    items: List[T]
+    size: int = Field(ge=1, le=100)
+    next_cursor: Optional[str] = None
+
+    @classmethod
+    def create(cls, items: List[T], size: int, sort_key):
+        """items - до size + 1 строк; лишняя строка означает, что есть
+        следующая страница. sort_key возвращает ключ сортировки строки."""
+        next_cursor = None
+        if len(items) > size:
+            items = items[:size]
+            next_cursor = encode_cursor(sort_key(items[-1]))
+        return cls(items=items, size=size, next_cursor=next_cursor)
@@ -0,0 +1,55 @@
+from sqlalchemy import select, update
+from src.config import settings
+from src.db.base import AsyncSessionLocal, get_engine
+from src.db.complaint_stats import refresh_complaint_stats
+from src.db.models import Advertisement, Complaint, Review, User
+from src.db.ratings import refresh_ratings
+from src.utils.logg import logger
+
+HIDEABLE_MODELS = (Advertisement, Review, Complaint)
+
+
+async def sync_hidden_content(user_id: int, batch_size: int = None) -> int:
+    """Скрывает контент забаненного пользователя или возвращает его после
+    разбана. Обновляет строки пачками, каждая пачка в своей транзакции.
+
+    Каждая пачка сверяется с текущим is_banned, поэтому задача идемпотентна,
+    а устаревшая задача (бан сразу после разбана) ничего не меняет.
+    Возвращает количество измененных строк.
+    """
+    batch_size = batch_size or settings.hide_batch_size
+    get_engine()
+    ban_state = select(User.is_banned).where(User.id == user_id).scalar_subquery()
+    total = 0
+    for model in HIDEABLE_MODELS:
+        while True:
+            batch = (
+                select(model.id)
+                .where(model.user_id == user_id, model.hidden != ban_state)
+                .limit(batch_size)
+            )
+            stmt = (
+                update(model)
+                .where(model.id.in_(batch.scalar_subquery()))
+                .values(hidden=ban_state, updated_at=model.updated_at)
+            )
+            async with AsyncSessionLocal() as session:
+                result = await session.execute(stmt)
+                await session.commit()
+            total += result.rowcount
+            if result.rowcount < batch_size:
+                break
+
+    async with AsyncSessionLocal() as session:
+        complained_ads = await session.scalars(
+            select(Complaint.adv_id).where(Complaint.user_id == user_id).distinct()
+        )
+        await refresh_complaint_stats(session, complained_ads.all())
+        reviewed_ads = await session.scalars(
+            select(Review.adv_id).where(Review.user_id == user_id).distinct()
+        )
+        await refresh_ratings(session, reviewed_ads.all())
+        await session.commit()
+
+    logger.info(f"Synced hidden content of user {user_id}: {total} rows")
+    return total
@@ -0,0 +1,121 @@
+import asyncio
+from datetime import datetime, time, timedelta, timezone
+from typing import Optional, Tuple
+
+from sqlalchemy import delete, exists, func, select
+
+from src.config import settings
+from src.db.base import get_engine
+from src.db.models import Advertisement, Complaint, Review
+from src.utils.logg import logger
+
+PURGE_LOCK_KEY = 7_301_957
+PURGE_ORDER = (Review, Complaint, Advertisement)
+
+
+def parse_window(value: str) -> Tuple[time, time]:
+    """'03:00-05:00' -> (03:00, 05:00)"""
+    start, end = value.split("-")
+    return (
+        datetime.strptime(start.strip(), "%H:%M").time(),
+        datetime.strptime(end.strip(), "%H:%M").time(),
+    )
+
+
+def seconds_until(moment: time, now: datetime) -> float:
+    target = datetime.combine(now.date(), moment)
+    if target <= now:
+        target += timedelta(days=1)
+    return (target - now).total_seconds()
+
+
+def purge_batch(model, cutoff: datetime, batch_size: int):
+    batch = select(model.id).where(model.deleted_at < cutoff)
+    if model is Advertisement:
+        # Отзывы и жалобы, удаленные позже объявления, держат его до
+        # следующего запуска
+        batch = batch.where(
+            ~exists().where(Review.adv_id == Advertisement.id),
+            ~exists().where(Complaint.adv_id == Advertisement.id),
+        )
+    return delete(model).where(model.id.in_(batch.limit(batch_size).scalar_subquery()))
+
+
+async def purge_deleted(
+    retention_days: int = None,
+    batch_size: int = None,
+    deadline: Optional[float] = None,
+) -> Optional[int]:
+    """Стирает строки, помеченные удаленными больше retention_days дней назад,
+    пачками по batch_size, каждая пачка в своей транзакции. deadline - момент
+    по часам event loop, после которого новые пачки не начинаются.
+
+    Запуски в разных воркерах исключают друг друга через advisory lock;
+    если очистка уже идет, возвращает None, иначе количество строк.
+    """
+    retention_days = (
+        settings.purge_retention_days if retention_days is None else retention_days
+    )
+    batch_size = batch_size or settings.purge_batch_size
+    cutoff = datetime.now(timezone.utc) - timedelta(days=retention_days)
+
+    loop = asyncio.get_running_loop()
+    async with get_engine().connect() as conn:
+        locked = await conn.scalar(select(func.pg_try_advisory_lock(PURGE_LOCK_KEY)))
+        await conn.commit()
+        if not locked:
+            return None
+
+        total = 0
+        try:
+            for model in PURGE_ORDER:
+                while deadline is None or loop.time() < deadline:
+                    result = await conn.execute(purge_batch(model, cutoff, batch_size))
+                    await conn.commit()
+                    total += result.rowcount
+                    if result.rowcount < batch_size:
+                        break
+        finally:
+            await conn.rollback()
+            await conn.execute(select(func.pg_advisory_unlock(PURGE_LOCK_KEY)))
+            await conn.commit()
+    return total
+
+
+class PurgeScheduler:
+    """Запускает purge_deleted каждый день в окне purge_window по времени
+    сервера."""
+
+    def __init__(self):
+        self._task: Optional[asyncio.Task] = None
+
+    async def run(self):
+        start, end = parse_window(settings.purge_window)
+        while True:
+            await asyncio.sleep(seconds_until(start, datetime.now()))
+            deadline = asyncio.get_running_loop().time() + seconds_until(
+                end, datetime.now()
+            )
+            try:
+                purged = await purge_deleted(deadline=deadline)
+            except Exception as exp:
+                logger.error(f"Purge of deleted rows failed: {exp}")
+                continue
+            if purged is not None:
+                logger.info(f"Purged {purged} deleted rows")
+
+    def start(self):
+        if settings.purge_window and self._task is None:
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+
+
+purge_scheduler = PurgeScheduler()
@@ -0,0 +1,92 @@
+from pathlib import Path
+from typing import Dict, NamedTuple, Optional
+
+import jwt
+
+from src.config import settings
+
+LEGACY_KID = "default"
+ASYMMETRIC_PREFIXES = ("RS", "PS", "ES", "EdDSA")
+
+
+class JWTKey(NamedTuple):
+    kid: str
+    algorithm: str
+    signing_key: object
+    verification_key: object
+
+
+def load_key(path: Path) -> JWTKey:
+    """Читает ключ из файла <kid>.<алгоритм>.pem или <kid>.<алгоритм>.key.
+
+    Асимметричные ключи разбираются один раз, дальше PyJWT получает готовые
+    объекты вместо PEM-строк.
+    """
+    kid, algorithm = path.stem.rsplit(".", 1)
+    data = path.read_bytes()
+    if not algorithm.startswith(ASYMMETRIC_PREFIXES):
+        secret = data.strip()
+        return JWTKey(kid, algorithm, secret, secret)
+
+    from cryptography.hazmat.primitives.serialization import load_pem_private_key
+
+    private_key = load_pem_private_key(data, password=None)
+    return JWTKey(kid, algorithm, private_key, private_key.public_key())
+
+
+class Keyring:
+    """Ключи подписи токенов по kid.
+
+    Новые токены подписываются активным ключом, проверяются все известные,
+    поэтому при ротации выданные старым ключом токены живут до истечения.
+    Токены без kid проверяются ключом из secret_key_jwt.
+    """
+
+    def __init__(self, keys: Dict[str, JWTKey], active_kid: str):
+        if active_kid not in keys:
+            raise ValueError(f"Unknown active JWT key {active_kid}")
+        self.keys = keys
+        self.active = keys[active_kid]
+
+    @classmethod
+    def from_settings(cls) -> "Keyring":
+        keys = {
+            LEGACY_KID: JWTKey(
+                LEGACY_KID,
+                settings.algorithm_jwt,
+                settings.secret_key_jwt,
+                settings.secret_key_jwt,
+            )
+        }
+        if settings.jwt_keys_dir:
+            for path in sorted(Path(settings.jwt_keys_dir).iterdir()):
+                if path.suffix in (".pem", ".key"):
+                    key = load_key(path)
+                    keys[key.kid] = key
+        return cls(keys, settings.jwt_active_kid or LEGACY_KID)
+
+    def encode(self, payload: dict) -> str:
+        headers = None if self.active.kid == LEGACY_KID else {"kid": self.active.kid}
+        return jwt.encode(
+            payload,
+            self.active.signing_key,
+            algorithm=self.active.algorithm,
+            headers=headers,
+        )
+
+    def decode(self, token: str) -> dict:
+        kid = jwt.get_unverified_header(token).get("kid", LEGACY_KID)
+        key = self.keys.get(kid)
+        if key is None:
+            raise jwt.InvalidKeyError(f"Unknown key id {kid}")
+        return jwt.decode(token, key.verification_key, algorithms=[key.algorithm])
+
+
+_keyring: Optional[Keyring] = None
+
+
+def get_keyring() -> Keyring:
+    global _keyring
+    if _keyring is None:
+        _keyring = Keyring.from_settings()
+    return _keyring
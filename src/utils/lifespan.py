@@ -0,0 +1,104 @@
+import asyncio
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request
+from sqlalchemy import text
+
+from src.config import settings
+from src.db.base import dispose_engine, get_engine
+from src.utils.logg import logger
+from src.sevices.purge import purge_scheduler
+from src.utils.keyring import get_keyring
+from src.utils.rate_limit import rate_limiter
+from src.utils.revocation import revocations
+from src.utils.security import pwd_context
+from src.utils.tg import close_bot
+
+
+class InFlightTracker:
+    def __init__(self):
+        self.count = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
+
+    async def middleware(self, request: Request, call_next):
+        self.count += 1
+        self._idle.clear()
+        try:
+            response = await call_next(request)
+        except BaseException:
+            self._finish()
+            raise
+        # call_next возвращает ответ до того, как отправлено тело: запрос
+        # считается завершенным, когда отдан последний кусок (важно для
+        # потоковых ответов вроде /adv/export)
+        response.body_iterator = self._track(response.body_iterator)
+        return response
+
+    async def _track(self, body_iterator):
+        try:
+            async for chunk in body_iterator:
+                yield chunk
+        finally:
+            self._finish()
+
+    def _finish(self):
+        self.count -= 1
+        if self.count == 0:
+            self._idle.set()
+
+    async def wait_idle(self):
+        await self._idle.wait()
+
+
+in_flight = InFlightTracker()
+
+
+async def warm_pool(size: int):
+    engine = get_engine()
+
+    async def ping():
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    await asyncio.gather(*(ping() for _ in range(min(size, settings.db_pool_size))))
+
+
+async def preload_caches():
+    for scheme in pwd_context.schemes():
+        pwd_context.handler(scheme).get_backend()
+    get_keyring()
+    if settings.stateless_auth:
+        await revocations.start()
+
+
+async def shutdown(timeout: float):
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+
+    try:
+        await asyncio.wait_for(in_flight.wait_idle(), timeout)
+    except asyncio.TimeoutError:
+        logger.warning(f"Shutdown with {in_flight.count} requests still in flight")
+
+    closers = (
+        purge_scheduler.stop,
+        revocations.stop,
+        dispose_engine,
+        close_bot,
+        rate_limiter.close,
+    )
+    for close in closers:
+        try:
+            await asyncio.wait_for(close(), max(deadline - loop.time(), 0))
+        except asyncio.TimeoutError:
+            logger.warning(f"{close.__name__} did not finish before shutdown deadline")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await warm_pool(settings.db_pool_warmup)
+    await preload_caches()
+    purge_scheduler.start()
+    yield
+    await shutdown(settings.shutdown_timeout)
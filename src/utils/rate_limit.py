@@ -0,0 +1,226 @@
+import math
+import re
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import List, NamedTuple, Optional, Tuple
+
+import jwt
+from fastapi import Request, status
+from fastapi.responses import JSONResponse
+
+from src.config import settings
+from src.utils.logg import logger
+from src.utils.security import decode_access_token
+
+
+class RateLimit(NamedTuple):
+    capacity: int
+    period: float
+
+    @property
+    def rate(self) -> float:
+        return self.capacity / self.period
+
+
+@lru_cache(maxsize=None)
+def parse_limit(value: str) -> RateLimit:
+    """Разбирает лимит вида "20/60": 20 запросов, корзина пополняется за 60 секунд"""
+    capacity, period = value.split("/")
+    return RateLimit(int(capacity), float(period))
+
+
+class RateRule(NamedTuple):
+    name: str
+    method: str
+    path: re.Pattern
+    ip_limit: str
+    user_limit: Optional[str] = None
+
+
+RULES = [
+    RateRule("login", "POST", re.compile(r"^/auth/login$"), "rate_limit_login_ip"),
+    RateRule(
+        "write",
+        "POST",
+        re.compile(r"^/adv/(batch)?$|^/complaint/\d+$|^/review/\d+$"),
+        "rate_limit_write_ip",
+        "rate_limit_write_user",
+    ),
+]
+
+
+class MemoryBucketStore:
+    """Корзины в памяти процесса, у каждого воркера свои. Порядок корзин -
+    порядок последнего обращения, поэтому в начале лежат самые старые."""
+
+    def __init__(self, max_keys: int = 100_000):
+        self.max_keys = max_keys
+        self.buckets: "OrderedDict[str, Tuple[float, float, float]]" = OrderedDict()
+
+    async def take(self, key: str, limit: RateLimit) -> float:
+        now = time.monotonic()
+        tokens, updated, _ = self.buckets.pop(key, (limit.capacity, now, 0))
+        tokens = min(limit.capacity, tokens + (now - updated) * limit.rate)
+
+        retry_after = 0.0
+        if tokens >= 1:
+            tokens -= 1
+        else:
+            retry_after = (1 - tokens) / limit.rate
+
+        self.prune(now)
+        self.buckets[key] = (tokens, now, limit.period)
+        return retry_after
+
+    def prune(self, now: float):
+        """Удаляет с начала корзины, которые успели бы пополниться полностью,
+        и самые старые сверх max_keys. Вытесненная корзина при следующем
+        запросе начнется заново полной - это цена ограничения памяти."""
+        while self.buckets:
+            _, updated, period = next(iter(self.buckets.values()))
+            if now - updated < period and len(self.buckets) < self.max_keys:
+                break
+            self.buckets.popitem(last=False)
+
+    async def close(self):
+        pass
+
+
+class RedisBucketStore:
+    """Общие корзины в Redis для нескольких воркеров и серверов. Если Redis
+    недоступен, запросы пропускаются без лимита, а не падают с 500."""
+
+    SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local period = tonumber(ARGV[2])
+local clock = redis.call('TIME')
+local now = clock[1] * 1000 + math.floor(clock[2] / 1000)
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'updated')
+local tokens = tonumber(bucket[1]) or capacity
+local updated = tonumber(bucket[2]) or now
+local rate = capacity / period
+tokens = math.min(capacity, tokens + math.max(now - updated, 0) * rate)
+local retry_after = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    retry_after = math.ceil((1 - tokens) / rate)
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'updated', now)
+redis.call('PEXPIRE', KEYS[1], math.ceil(period))
+return retry_after
+"""
+
+    def __init__(self, client):
+        from redis.exceptions import RedisError
+
+        self.client = client
+        self.script = client.register_script(self.SCRIPT)
+        self.errors = (RedisError, OSError)
+
+    @classmethod
+    def from_url(cls, url: str) -> "RedisBucketStore":
+        from redis.asyncio import Redis
+
+        return cls(Redis.from_url(url))
+
+    async def take(self, key: str, limit: RateLimit) -> float:
+        try:
+            retry_after_ms = await self.script(
+                keys=[key], args=[limit.capacity, int(limit.period * 1000)]
+            )
+        except self.errors as exp:
+            logger.warning(f"Rate limit skipped, Redis is unavailable: {exp!r}")
+            return 0.0
+        return retry_after_ms / 1000
+
+    async def close(self):
+        await self.client.aclose()
+
+
+def create_store():
+    if settings.rate_limit_backend == "redis":
+        return RedisBucketStore.from_url(settings.rate_limit_redis_url)
+    if settings.rate_limit_backend == "memory":
+        return MemoryBucketStore()
+    return None
+
+
+def user_id_from(request: Request) -> Optional[str]:
+    scheme, _, token = request.headers.get("Authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    try:
+        return decode_access_token(token).get("id")
+    except jwt.PyJWTError:
+        return None
+
+
+def client_address(request: Request) -> str:
+    """Адрес клиента для ключа корзины. Если сервер его не передал (например,
+    при запуске через unix-сокет), берется последний адрес X-Forwarded-For:
+    его дописал ближайший прокси, а начало заголовка присылает сам клиент.
+    Без заголовка все такие запросы делят одну корзину."""
+    if request.client is not None:
+        return request.client.host
+    forwarded = request.headers.get("X-Forwarded-For", "").split(",")[-1].strip()
+    return forwarded or "unknown"
+
+
+class RateLimiter:
+    def __init__(self, rules: List[RateRule]):
+        self.rules = rules
+        self.store = None
+        self.configured = False
+
+    def get_store(self):
+        if not self.configured:
+            self.store = create_store()
+            self.configured = True
+        return self.store
+
+    def match(self, request: Request) -> Optional[RateRule]:
+        for rule in self.rules:
+            if request.method == rule.method and rule.path.match(request.url.path):
+                return rule
+        return None
+
+    async def middleware(self, request: Request, call_next):
+        rule = self.match(request)
+        store = self.get_store() if rule else None
+        if store is None:
+            return await call_next(request)
+
+        buckets = [
+            (
+                f"rate:{rule.name}:ip:{client_address(request)}",
+                getattr(settings, rule.ip_limit),
+            )
+        ]
+        user_id = user_id_from(request) if rule.user_limit else None
+        if user_id is not None:
+            buckets.append(
+                (f"rate:{rule.name}:user:{user_id}", getattr(settings, rule.user_limit))
+            )
+
+        retry_after = 0.0
+        for key, limit in buckets:
+            retry_after = max(retry_after, await store.take(key, parse_limit(limit)))
+
+        if retry_after > 0:
+            return JSONResponse(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                content={"detail": "Too many requests"},
+                headers={"Retry-After": str(math.ceil(retry_after))},
+            )
+        return await call_next(request)
+
+    async def close(self):
+        if self.store is not None:
+            await self.store.close()
+        self.store = None
+        self.configured = False
+
+
+rate_limiter = RateLimiter(RULES)
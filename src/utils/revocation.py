@@ -0,0 +1,127 @@
+import asyncio
+import time
+from datetime import timedelta
+from typing import Dict, Optional
+
+from sqlalchemy import extract, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.engine import make_url
+
+from src.config import settings
+from src.db.base import AsyncSession, AsyncSessionLocal, get_engine
+from src.db.models import TokenRevocation
+from src.utils.logg import logger
+
+REVOCATION_CHANNEL = "token_revocations"
+
+
+class RevocationSet:
+    """Отзывы токенов: id пользователя -> время, до которого выданные ему
+    токены недействительны. Синхронизируется между воркерами через
+    LISTEN/NOTIFY, хранит только отзывы моложе срока жизни токена."""
+
+    def __init__(self):
+        self.revoked: Dict[int, float] = {}
+        self.ready = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    def add(self, user_id: int, revoked_after: float):
+        self.revoked[user_id] = max(self.revoked.get(user_id, 0), revoked_after)
+
+    def is_revoked(self, user_id: int, issued_at: float) -> bool:
+        revoked_after = self.revoked.get(user_id)
+        return revoked_after is not None and issued_at <= revoked_after
+
+    def prune(self):
+        horizon = time.time() - settings.access_token_expires * 60
+        self.revoked = {
+            user_id: revoked_after
+            for user_id, revoked_after in self.revoked.items()
+            if revoked_after > horizon
+        }
+
+    async def load(self):
+        get_engine()
+        async with AsyncSessionLocal() as session:
+            result = await session.execute(
+                select(
+                    TokenRevocation.user_id,
+                    extract("epoch", TokenRevocation.revoked_after),
+                ).where(
+                    TokenRevocation.revoked_after
+                    > func.now() - timedelta(minutes=settings.access_token_expires)
+                )
+            )
+            for user_id, revoked_after in result.all():
+                self.add(user_id, float(revoked_after))
+
+    def on_notify(self, connection, pid, channel, payload: str):
+        user_id, revoked_after = payload.split(":")
+        self.add(int(user_id), float(revoked_after))
+        self.prune()
+
+    async def listen(self):
+        import asyncpg
+
+        dsn = make_url(settings.db_url).set(drivername="postgresql")
+        while True:
+            connection = None
+            try:
+                connection = await asyncpg.connect(
+                    dsn.render_as_string(hide_password=False)
+                )
+                closed = asyncio.Event()
+                connection.add_termination_listener(lambda _: closed.set())
+                await connection.add_listener(REVOCATION_CHANNEL, self.on_notify)
+                await self.load()
+                self.ready.set()
+                await closed.wait()
+                logger.warning("Token revocation listener disconnected, reconnecting")
+            except (OSError, asyncpg.PostgresError) as exp:
+                logger.warning(f"Token revocation listener failed: {exp}")
+            finally:
+                if connection is not None and not connection.is_closed():
+                    await connection.close()
+            await asyncio.sleep(1)
+
+    async def start(self, timeout: float = 10):
+        if self._task is None:
+            self._task = asyncio.create_task(self.listen())
+        await asyncio.wait_for(self.ready.wait(), timeout)
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+        self.ready.clear()
+
+
+revocations = RevocationSet()
+
+
+async def revoke_user(session: AsyncSession, user_id: int):
+    """Отзывает все выданные пользователю токены в транзакции session.
+
+    Вызывается перед commit: остальные воркеры получат NOTIFY после фиксации.
+    Время отзыва берется по часам приложения, как и iat выдаваемых токенов,
+    чтобы расхождение часов приложения и БД не влияло на сравнение.
+    """
+    revoked_at = func.to_timestamp(time.time())
+    stmt = (
+        insert(TokenRevocation)
+        .values(user_id=user_id, revoked_after=revoked_at)
+        .on_conflict_do_update(
+            index_elements=[TokenRevocation.user_id],
+            set_={"revoked_after": revoked_at},
+        )
+        .returning(extract("epoch", TokenRevocation.revoked_after))
+    )
+    revoked_after = float(await session.scalar(stmt))
+    await session.execute(
+        select(func.pg_notify(REVOCATION_CHANNEL, f"{user_id}:{revoked_after}"))
+    )
+    revocations.add(user_id, revoked_after)
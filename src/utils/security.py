@@ -1,5 +1,6 @@
-from typing import List, Type
-from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
+import time
+from typing import List, NamedTuple, Optional, Tuple, Type
+from fastapi.security import OAuth2PasswordBearer
 from passlib.context import CryptContext
 import jwt
 from datetime import datetime, timedelta
@@ -7,35 +8,66 @@ from datetime import datetime, timedelta
 from sqlalchemy import select
 from src.config import settings
 from fastapi import Depends, HTTPException, Request, status
+from starlette.concurrency import run_in_threadpool
 from src.db.base import AsyncSession
 from src.db.db_func import get_user_from_db
 from src.db.models.user import User
 from src.db.base import Base
+from src.utils.keyring import get_keyring
+from src.utils.revocation import revocations
+
+
+def build_password_context() -> CryptContext:
+    """Первая схема из password_schemes хеширует новые пароли, остальные
+    только проверяются и при входе заменяются хешем первой схемы."""
+    schemes = [scheme.strip() for scheme in settings.password_schemes.split(",")]
+    if "bcrypt" not in schemes:
+        schemes.append("bcrypt")
+
+    options = {
+        "bcrypt__rounds": settings.bcrypt_rounds,
+        "bcrypt__min_rounds": settings.bcrypt_rounds,
+        "bcrypt__max_rounds": settings.bcrypt_rounds,
+    }
+    if "argon2" in schemes:
+        options.update(
+            argon2__time_cost=settings.argon2_time_cost,
+            argon2__memory_cost=settings.argon2_memory_cost,
+            argon2__parallelism=settings.argon2_parallelism,
+        )
+    return CryptContext(schemes=schemes, deprecated="auto", **options)
+
+
+pwd_context = build_password_context()
+
+
+class TokenUser(NamedTuple):
+    """Пользователь из подписанного токена для режима stateless_auth"""
+
+    id: int
+    is_admin: bool
+    is_banned: bool
+
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 UNPROTECTED_ROUTES: List[str] = ["/login", "/register", "/docs", "/openapi.json"]
 
 
 def create_access_token(data: dict, expires_delta: timedelta = None) -> str:
     try:
-        if data.get("is_admin") == False:
-            is_admin = 0
-        else:
-            is_admin = 1
         payload = {
             "sub": str(data.get("id")),
             "id": data.get("id"),
-            "is_admin": is_admin,
+            "is_admin": 1 if data.get("is_admin") else 0,
+            "is_banned": 1 if data.get("is_banned") else 0,
+            "iat": time.time(),
         }
 
         expire = datetime.utcnow() + (
-            expires_delta or timedelta(minutes=settings.token_expires)
+            expires_delta or timedelta(minutes=settings.access_token_expires)
         )
         payload.update({"exp": expire})
-        return jwt.encode(
-            payload, settings.secret_key_jwt, algorithm=settings.algorithm_jwt
-        )
+        return get_keyring().encode(payload)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -43,6 +75,10 @@ def create_access_token(data: dict, expires_delta: timedelta = None) -> str:
         )
 
 
+def decode_access_token(token: str) -> dict:
+    return get_keyring().decode(token)
+
+
 def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
@@ -51,31 +87,65 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
-async def get_current_user(token: str = Depends(oauth2_scheme)):
-    credentials_exception = HTTPException(
+async def hash_password_async(password: str) -> str:
+    return await run_in_threadpool(get_password_hash, password)
+
+
+async def verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> Tuple[bool, Optional[str]]:
+    """Проверяет пароль вне event loop и возвращает новый хеш, если сохраненный
+    создан устаревшей схемой или с другой стоимостью"""
+    return await run_in_threadpool(
+        pwd_context.verify_and_update, plain_password, hashed_password
+    )
+
+
+def credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
+
+
+async def get_token_identity(token: str = Depends(oauth2_scheme)):
+    """Id и права пользователя для проверок доступа. В режиме stateless_auth
+    берутся из токена без запроса к БД, иначе это строка User."""
     try:
-        payload = jwt.decode(
-            token.encode("utf-8"),
-            settings.secret_key_jwt,
-            algorithms=[settings.algorithm_jwt],
-        )
+        payload = decode_access_token(token)
         user_id: str = payload.get("id")
         if not user_id:
-            raise credentials_exception
-    except jwt.ExpiredSignatureError:
-        raise credentials_exception
+            raise credentials_exception()
+    except jwt.PyJWTError:
+        raise credentials_exception()
+
+    if settings.stateless_auth and "iat" in payload and "is_banned" in payload:
+        if revocations.is_revoked(int(user_id), payload["iat"]):
+            raise credentials_exception()
+        return TokenUser(
+            id=int(user_id),
+            is_admin=bool(payload["is_admin"]),
+            is_banned=bool(payload["is_banned"]),
+        )
 
     user = await get_user_from_db(user_id)
     if not user:
-        raise credentials_exception
+        raise credentials_exception()
+    return user
+
+
+async def get_current_user(identity=Depends(get_token_identity)) -> User:
+    """Строка User текущего пользователя, в том числе в режиме stateless_auth"""
+    if isinstance(identity, User):
+        return identity
+    user = await get_user_from_db(identity.id)
+    if not user:
+        raise credentials_exception()
     return user
 
 
-async def check_auth(request: Request, user: User = Depends(get_current_user)):
+async def check_auth(request: Request, user: User = Depends(get_token_identity)):
     if request.url.path not in UNPROTECTED_ROUTES:
         if user.is_banned:
             raise HTTPException(
@@ -85,7 +155,7 @@ async def check_auth(request: Request, user: User = Depends(get_current_user)):
         return user
 
 
-async def check_admin(user: User = Depends(get_current_user)):
+async def check_admin(user: User = Depends(get_token_identity)):
     if not user.is_admin:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -1,4 +1,19 @@
-from aiogram import Bot
 from src.config import settings
 
-bot = Bot(token=settings.telegram_bot_token)
+_bot = None
+
+
+def get_bot():
+    global _bot
+    if _bot is None:
+        from aiogram import Bot
+
+        _bot = Bot(token=settings.telegram_bot_token)
+    return _bot
+
+
+async def close_bot():
+    global _bot
+    if _bot is not None:
+        await _bot.session.close()
+        _bot = None
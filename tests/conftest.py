@@ -1,14 +1,21 @@
 import asyncio
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Optional
 import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
 from fastapi import FastAPI
 from src.db.base import Base
+from src.db.models import Advertisement, Category, User
 from main import app as fastapi_app
 from src.config import settings
+from src.utils import security
+from src.utils.rate_limit import rate_limiter
+from src.utils.security import create_access_token
+from tests.perf import PerfRecorder
 
 
 @pytest.fixture(scope="session")
@@ -39,6 +46,96 @@ async def db_session(async_engine):
         yield session
 
 
+@pytest_asyncio.fixture
+async def clean_tables(async_engine):
+    """Очищает все таблицы после теста, даже если он упал. Соединение
+    открывается заново: teardown может идти в другом цикле событий, чем тест,
+    и соединения пула async_engine там недоступны."""
+    yield
+    engine = create_async_engine(settings.db_url, poolclass=NullPool)
+    async with engine.begin() as conn:
+        for table in reversed(Base.metadata.sorted_tables):
+            await conn.execute(table.delete())
+    await engine.dispose()
+
+
+class ContentFactory:
+    """Создает тестовые записи, каждый вызов фиксируется отдельной транзакцией"""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def add(self, *rows):
+        async with self.session.begin():
+            self.session.add_all(rows)
+        return rows
+
+    async def user(self, name: str = "Test", is_admin: bool = False, **fields) -> User:
+        fields = {
+            "email": f"{name.lower()}@example.com",
+            "hashed_password": "hashedpass",
+            **fields,
+        }
+        (user,) = await self.add(
+            User(name=name, surname="User", is_admin=is_admin, **fields)
+        )
+        return user
+
+    async def category(self, name: str = "Electronics") -> Category:
+        (category,) = await self.add(Category(name=name))
+        return category
+
+    async def ads(
+        self, owner: User, category: Category, count: int, name="Laptop", **fields
+    ) -> list:
+        fields = {"descriptions": f"Good {name.lower()}", "price": 1000, **fields}
+        return list(
+            await self.add(
+                *(
+                    Advertisement(
+                        name=f"{name} {i}",
+                        user_id=owner.id,
+                        category_id=category.id,
+                        **fields,
+                    )
+                    for i in range(count)
+                )
+            )
+        )
+
+    async def count(self, model, deleted: Optional[bool] = None) -> int:
+        """Число строк model, включая мягко удаленные; deleted оставляет
+        только удаленные (True) или только действующие (False)"""
+        query = (
+            select(func.count())
+            .select_from(model)
+            .execution_options(include_deleted=True)
+        )
+        if deleted is not None:
+            query = query.where(
+                model.deleted_at.is_not(None) if deleted else model.deleted_at.is_(None)
+            )
+        async with self.session.begin():
+            return await self.session.scalar(query)
+
+    @staticmethod
+    def headers(user: User) -> dict:
+        token = create_access_token(data={"sub": user.email, "id": user.id})
+        return {"Authorization": f"Bearer {token}"}
+
+
+@pytest_asyncio.fixture
+async def factory(db_session, clean_tables) -> ContentFactory:
+    return ContentFactory(db_session)
+
+
+@pytest.fixture(autouse=True)
+def disable_rate_limit(monkeypatch):
+    """Лимиты запросов включаются только в тестах test_rate_limit.py"""
+    monkeypatch.setattr(rate_limiter, "store", None)
+    monkeypatch.setattr(rate_limiter, "configured", True)
+
+
 @pytest_asyncio.fixture
 def app() -> FastAPI:
     return fastapi_app
@@ -50,3 +147,49 @@ async def async_client(app: FastAPI) -> AsyncGenerator[AsyncClient, None]:
         transport=ASGITransport(app=app), base_url="http://test"
     ) as client:
         yield client
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--perf-update",
+        action="store_true",
+        help="Перезаписать tests/perf_baseline.json текущими замерами",
+    )
+    parser.addoption(
+        "--perf-time",
+        action="store_true",
+        help="Сравнивать с базой и время ответа (зависит от машины)",
+    )
+    parser.addini(
+        "perf_threshold",
+        "Допустимый рост числа SQL-запросов и памяти относительно базы",
+        default="0.2",
+    )
+    parser.addini(
+        "perf_time_threshold",
+        "Допустимый рост времени ответа относительно базы",
+        default="1.0",
+    )
+
+
+@pytest.fixture(scope="session")
+def perf_recorder(request):
+    recorder = PerfRecorder(
+        threshold=float(request.config.getini("perf_threshold")),
+        time_threshold=float(request.config.getini("perf_time_threshold")),
+        update=request.config.getoption("--perf-update"),
+        check_time=request.config.getoption("--perf-time"),
+    )
+    yield recorder
+    if recorder.update:
+        recorder.save_baseline()
+
+
+@pytest.fixture
+def password_settings(monkeypatch):
+    def configure(**values):
+        for name, value in values.items():
+            monkeypatch.setattr(settings, name, value)
+        monkeypatch.setattr(security, "pwd_context", security.build_password_context())
+
+    return configure
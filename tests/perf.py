@@ -0,0 +1,111 @@
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List
+
+from sqlalchemy import event
+
+from src.db.base import get_engine
+
+BASELINE_PATH = Path(__file__).resolve().parent / "perf_baseline.json"
+# Разница во времени меньше этой величины считается шумом
+TIME_SLACK_MS = 5
+
+
+@contextmanager
+def count_statements():
+    counter = {"statements": 0}
+
+    def before_cursor_execute(*args):
+        counter["statements"] += 1
+
+    engine = get_engine().sync_engine
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield counter
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+class PerfRecorder:
+    """Снимает метрики маршрутов и сравнивает их с tests/perf_baseline.json"""
+
+    def __init__(
+        self,
+        threshold: float,
+        time_threshold: float,
+        update: bool,
+        check_time: bool = False,
+    ):
+        self.threshold = threshold
+        self.time_threshold = time_threshold
+        self.update = update
+        self.check_time = check_time
+        self.baseline = self.load_baseline()
+        self.results: Dict[str, dict] = {}
+
+    @staticmethod
+    def load_baseline() -> Dict[str, dict]:
+        if not BASELINE_PATH.exists():
+            return {}
+        return json.loads(BASELINE_PATH.read_text(encoding="utf-8"))
+
+    def save_baseline(self):
+        BASELINE_PATH.write_text(
+            json.dumps({**self.baseline, **self.results}, indent=2, sort_keys=True)
+            + "\n",
+            encoding="utf-8",
+        )
+
+    async def measure(
+        self, name: str, call: Callable[[], Awaitable], repeat: int = 5
+    ) -> dict:
+        """Время - минимум из repeat вызовов, запросы и память - по отдельному вызову"""
+        await call()
+
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            await call()
+            timings.append(time.perf_counter() - started)
+
+        tracemalloc.start()
+        try:
+            with count_statements() as counter:
+                await call()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        result = {
+            "statements": counter["statements"],
+            "wall_ms": round(min(timings) * 1000, 2),
+            "peak_kb": round(peak / 1024, 1),
+        }
+        self.results[name] = result
+        return result
+
+    def regressions(self, name: str) -> List[str]:
+        result = self.results[name]
+        if self.update:
+            return []
+        if name not in self.baseline:
+            return [f"{name}: no baseline, run pytest with --perf-update"]
+
+        limits = {
+            "statements": (self.threshold, 0),
+            "peak_kb": (self.threshold, 0),
+        }
+        if self.check_time:
+            limits["wall_ms"] = (self.time_threshold, TIME_SLACK_MS)
+        problems = []
+        for metric, (threshold, slack) in limits.items():
+            expected = self.baseline[name][metric]
+            if result[metric] > max(expected * (1 + threshold), expected + slack):
+                problems.append(
+                    f"{name}: {metric} {result[metric]} > baseline {expected} "
+                    f"+{threshold:.0%}"
+                )
+        return problems
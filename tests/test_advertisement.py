@@ -326,3 +326,111 @@ async def test_patch_advertisement_invalid_category(
             await db_session.execute(delete(Advertisement))
             await db_session.execute(delete(Category))
             await db_session.execute(delete(User))
+
+
+@pytest.mark.asyncio
+async def test_patch_advertisement_if_match(
+    async_client: AsyncClient,
+    db_session,
+):
+    """Тест обновления с актуальной и устаревшей версией в If-Match"""
+    try:
+        async with db_session.begin():
+            user = User(
+                name="Test",
+                surname="User",
+                email="test6@example.com",
+                hashed_password="hashedpass",
+            )
+            category = Category(name="Test Category")
+            advertisement = Advertisement(
+                name="Test Ad",
+                descriptions="Test Description",
+                price=1000,
+                user=user,
+                categories=category,
+            )
+            db_session.add_all([user, category, advertisement])
+            await db_session.flush()
+
+        token = create_access_token(data={"sub": user.email, "id": user.id})
+        headers = {"Authorization": f"Bearer {token}"}
+
+        response = await async_client.get(f"/adv/{advertisement.id}", headers=headers)
+        etag = response.headers["ETag"]
+
+        response = await async_client.patch(
+            f"/adv/{advertisement.id}",
+            json={"name": "First"},
+            headers={**headers, "If-Match": etag},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["name"] == "First"
+        assert response.headers["ETag"] != etag
+
+        response = await async_client.patch(
+            f"/adv/{advertisement.id}",
+            json={"name": "Second"},
+            headers={**headers, "If-Match": etag},
+        )
+
+        assert response.status_code == status.HTTP_412_PRECONDITION_FAILED
+
+    finally:
+        async with db_session.begin():
+            await db_session.execute(delete(Advertisement))
+            await db_session.execute(delete(Category))
+            await db_session.execute(delete(User))
+
+
+@pytest.mark.asyncio
+async def test_patch_advertisement_by_admin_returns_owner(
+    async_client: AsyncClient,
+    db_session,
+):
+    """Тест обновления чужого объявления администратором"""
+    try:
+        async with db_session.begin():
+            owner = User(
+                name="Owner",
+                surname="User",
+                email="owner7@example.com",
+                hashed_password="hashedpass",
+            )
+            admin = User(
+                name="Admin",
+                surname="User",
+                email="admin7@example.com",
+                hashed_password="hashedpass",
+                is_admin=True,
+            )
+            category = Category(name="Test Category")
+            advertisement = Advertisement(
+                name="Test Ad",
+                descriptions="Test Description",
+                price=1000,
+                user=owner,
+                categories=category,
+            )
+            db_session.add_all([owner, admin, category, advertisement])
+            await db_session.flush()
+
+        token = create_access_token(data={"sub": admin.email, "id": admin.id})
+        headers = {"Authorization": f"Bearer {token}"}
+
+        response = await async_client.patch(
+            f"/adv/{advertisement.id}", json={"price": 5}, headers=headers
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        response_data = response.json()
+        assert response_data["price"] == 5
+        assert response_data["user"]["email"] == "owner7@example.com"
+        assert response_data["category"]["name"] == "Test Category"
+
+    finally:
+        async with db_session.begin():
+            await db_session.execute(delete(Advertisement))
+            await db_session.execute(delete(Category))
+            await db_session.execute(delete(User))
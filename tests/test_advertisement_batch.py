@@ -0,0 +1,114 @@
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+from sqlalchemy import select, delete
+from src.config import settings
+from src.db.models import Advertisement, Category, User
+from src.utils.security import create_access_token
+
+
+@pytest.mark.asyncio
+async def test_create_advertisement_batch_reports_errors_per_item(
+    async_client: AsyncClient,
+    db_session,
+):
+    """Тест пакетного создания с ошибками в отдельных объявлениях"""
+    try:
+        async with db_session.begin():
+            user = User(
+                name="Test",
+                surname="User",
+                email="batch@example.com",
+                hashed_password="hashedpass",
+            )
+            category = Category(name="Batch Category")
+            db_session.add_all([user, category])
+            await db_session.flush()
+
+        token = create_access_token(data={"sub": user.email, "id": user.id})
+        headers = {"Authorization": f"Bearer {token}"}
+
+        items = [
+            {
+                "name": "First",
+                "descriptions": "d",
+                "price": 1,
+                "category_id": category.id,
+            },
+            {"name": "Bad category", "descriptions": "d", "category_id": 999999},
+            {"descriptions": "no name", "category_id": category.id},
+            {"name": "Second", "descriptions": "d", "category_id": category.id},
+        ]
+
+        response = await async_client.post("/adv/batch", json=items, headers=headers)
+
+        assert response.status_code == status.HTTP_201_CREATED
+        response_data = response.json()
+        assert [item["index"] for item in response_data["created"]] == [0, 3]
+        assert [error["index"] for error in response_data["errors"]] == [1, 2]
+        assert response_data["errors"][0]["detail"] == "Category not found"
+
+        async with db_session.begin():
+            result = await db_session.execute(
+                select(Advertisement.name).where(Advertisement.user_id == user.id)
+            )
+            assert sorted(result.scalars().all()) == ["First", "Second"]
+
+    finally:
+        async with db_session.begin():
+            await db_session.execute(delete(Advertisement))
+            await db_session.execute(delete(Category))
+            await db_session.execute(delete(User))
+
+
+@pytest.mark.asyncio
+async def test_create_advertisement_batch_unauthorized(async_client: AsyncClient):
+    """Тест пакетного создания без авторизации"""
+    response = await async_client.post("/adv/batch", json=[])
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.asyncio
+async def test_create_advertisement_batch_limit(
+    async_client: AsyncClient,
+    db_session,
+    monkeypatch,
+):
+    """Тест превышения размера пакета"""
+    try:
+        async with db_session.begin():
+            user = User(
+                name="Test",
+                surname="User",
+                email="batch2@example.com",
+                hashed_password="hashedpass",
+            )
+            db_session.add(user)
+            await db_session.flush()
+
+        monkeypatch.setattr(settings, "adv_batch_limit", 1)
+        token = create_access_token(data={"sub": user.email, "id": user.id})
+        headers = {"Authorization": f"Bearer {token}"}
+
+        response = await async_client.post("/adv/batch", json=[{}, {}], headers=headers)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    finally:
+        async with db_session.begin():
+            await db_session.execute(delete(User))
+
+
+@pytest.mark.asyncio
+async def test_create_advertisement_batch_openapi_item_schema(
+    async_client: AsyncClient,
+):
+    """Схема элемента пакета видна в OpenAPI"""
+    response = await async_client.get("/openapi.json")
+
+    operation = response.json()["paths"]["/adv/batch"]["post"]
+    schema = operation["requestBody"]["content"]["application/json"]["schema"]
+    assert schema["type"] == "array"
+    assert schema["items"]["title"] == "AdvertisementCreateDTO"
+    assert set(schema["items"]["required"]) == {"name", "category_id", "descriptions"}
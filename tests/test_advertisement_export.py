@@ -0,0 +1,104 @@
+import csv
+import io
+import json
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+from sqlalchemy import delete
+from src.db.models import Advertisement, Category, User
+from src.utils.security import create_access_token
+
+
+async def create_advertisements(db_session):
+    async with db_session.begin():
+        user = User(
+            name="Test",
+            surname="User",
+            email="export@example.com",
+            hashed_password="hashedpass",
+        )
+        cars = Category(name="Cars")
+        books = Category(name="Books")
+        db_session.add_all([user, cars, books])
+        await db_session.flush()
+        db_session.add_all(
+            [
+                Advertisement(
+                    name=f"Ad {price}",
+                    descriptions="Test Description",
+                    price=price,
+                    user=user,
+                    categories=cars if price < 300 else books,
+                )
+                for price in (100, 200, 300, 400)
+            ]
+        )
+    return user
+
+
+async def clean(db_session):
+    async with db_session.begin():
+        await db_session.execute(delete(Advertisement))
+        await db_session.execute(delete(Category))
+        await db_session.execute(delete(User))
+
+
+@pytest.mark.asyncio
+async def test_export_advertisements_ndjson_with_filters(
+    async_client: AsyncClient,
+    db_session,
+):
+    """Тест выгрузки в NDJSON с фильтрами списка объявлений"""
+    try:
+        user = await create_advertisements(db_session)
+        token = create_access_token(data={"sub": user.email, "id": user.id})
+        headers = {"Authorization": f"Bearer {token}"}
+
+        response = await async_client.get(
+            "/adv/export",
+            params={"category": "car", "price_descending": True},
+            headers=headers,
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert [row["price"] for row in rows] == [200, 100]
+        assert {row["category_name"] for row in rows} == {"Cars"}
+
+    finally:
+        await clean(db_session)
+
+
+@pytest.mark.asyncio
+async def test_export_advertisements_csv(
+    async_client: AsyncClient,
+    db_session,
+):
+    """Тест выгрузки в CSV"""
+    try:
+        user = await create_advertisements(db_session)
+        token = create_access_token(data={"sub": user.email, "id": user.id})
+        headers = {"Authorization": f"Bearer {token}"}
+
+        response = await async_client.get(
+            "/adv/export",
+            params={"format": "csv", "min_price": 300},
+            headers=headers,
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        assert sorted(row["name"] for row in rows) == ["Ad 300", "Ad 400"]
+        assert rows[0]["category_name"] == "Books"
+
+    finally:
+        await clean(db_session)
+
+
+@pytest.mark.asyncio
+async def test_export_advertisements_unauthorized(async_client: AsyncClient):
+    """Тест выгрузки без авторизации"""
+    response = await async_client.get("/adv/export")
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
@@ -0,0 +1,75 @@
+from importlib.util import find_spec
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+from passlib.hash import bcrypt
+from sqlalchemy import select, delete
+from src.config import settings
+from src.db.models import User
+from src.utils import security
+
+
+async def login_and_get_hash(async_client, db_session, password: str):
+    response = await async_client.post(
+        "/auth/login", data={"username": "login@example.com", "password": password}
+    )
+    async with db_session.begin():
+        result = await db_session.execute(
+            select(User.hashed_password).where(User.email == "login@example.com")
+        )
+        return response, result.scalar_one()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "configuration, prefix",
+    [
+        ({"bcrypt_rounds": 5}, "$2b$05$"),
+        pytest.param(
+            {
+                "password_schemes": "argon2,bcrypt",
+                "argon2_time_cost": 1,
+                "argon2_memory_cost": 1024,
+                "argon2_parallelism": 1,
+            },
+            "$argon2id$v=19$m=1024,t=1,p=1$",
+            marks=pytest.mark.skipif(
+                find_spec("argon2") is None, reason="argon2-cffi is not installed"
+            ),
+        ),
+    ],
+)
+async def test_login_rehashes_outdated_password(
+    async_client: AsyncClient,
+    db_session,
+    password_settings,
+    configuration: dict,
+    prefix: str,
+):
+    """Хеш с устаревшими параметрами заменяется при успешном входе"""
+    password_settings(**configuration)
+    outdated = bcrypt.using(rounds=4).hash("secret")
+    try:
+        async with db_session.begin():
+            db_session.add(
+                User(
+                    name="Test",
+                    surname="User",
+                    email="login@example.com",
+                    hashed_password=outdated,
+                )
+            )
+
+        response, stored = await login_and_get_hash(async_client, db_session, "wrong")
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+        assert stored == outdated
+
+        response, stored = await login_and_get_hash(async_client, db_session, "secret")
+        assert response.status_code == status.HTTP_200_OK
+        assert "access_token" in response.json()
+        assert stored.startswith(prefix)
+        assert security.verify_password("secret", stored)
+
+    finally:
+        async with db_session.begin():
+            await db_session.execute(delete(User))
@@ -0,0 +1,152 @@
+import asyncio
+
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+from src.config import settings
+from src.utils.security import decode_access_token, get_password_hash
+
+
+async def login(async_client: AsyncClient) -> dict:
+    response = await async_client.post(
+        "/auth/login", data={"username": "refresh@example.com", "password": "secret"}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    return response.json()
+
+
+async def refresh(async_client: AsyncClient, token: str):
+    return await async_client.post("/auth/refresh", json={"refresh_token": token})
+
+
+async def create_account(factory):
+    await factory.user(
+        "Refresh",
+        email="refresh@example.com",
+        hashed_password=get_password_hash("secret"),
+    )
+
+
+@pytest.mark.asyncio
+async def test_refresh_rotates_token(
+    async_client: AsyncClient, password_settings, factory
+):
+    """Refresh-токен выдает новую пару и становится недействительным"""
+    password_settings(bcrypt_rounds=4)
+    await create_account(factory)
+
+    tokens = await login(async_client)
+    assert tokens["token_type"] == "bearer"
+
+    response = await refresh(async_client, tokens["refresh_token"])
+
+    assert response.status_code == status.HTTP_200_OK
+    rotated = response.json()
+    assert rotated["refresh_token"] != tokens["refresh_token"]
+
+    response = await async_client.get(
+        "/adv/999999",
+        headers={"Authorization": f"Bearer {rotated['access_token']}"},
+    )
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    response = await refresh(async_client, rotated["refresh_token"])
+    assert response.status_code == status.HTTP_200_OK
+
+
+@pytest.mark.asyncio
+async def test_reused_refresh_token_revokes_session(
+    async_client: AsyncClient, password_settings, monkeypatch, factory
+):
+    """Повторное использование замененного токена отзывает всю цепочку"""
+    password_settings(bcrypt_rounds=4)
+    monkeypatch.setattr(settings, "refresh_reuse_grace", 0)
+    await create_account(factory)
+
+    tokens = await login(async_client)
+    rotated = (await refresh(async_client, tokens["refresh_token"])).json()
+
+    response = await refresh(async_client, tokens["refresh_token"])
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    response = await refresh(async_client, rotated["refresh_token"])
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.asyncio
+async def test_logout_revokes_refresh_token(
+    async_client: AsyncClient, password_settings, factory
+):
+    """После выхода refresh-токен больше не принимается"""
+    password_settings(bcrypt_rounds=4)
+    await create_account(factory)
+
+    tokens = await login(async_client)
+
+    response = await async_client.post(
+        "/auth/logout", json={"refresh_token": tokens["refresh_token"]}
+    )
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+
+    response = await refresh(async_client, tokens["refresh_token"])
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    response = await refresh(async_client, "unknown")
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.asyncio
+async def test_logged_out_token_does_not_revoke_other_sessions(
+    async_client: AsyncClient, password_settings, factory
+):
+    """Токен после выхода просто отклоняется, другие сессии остаются"""
+    password_settings(bcrypt_rounds=4)
+    await create_account(factory)
+
+    first = await login(async_client)
+    second = await login(async_client)
+    await async_client.post(
+        "/auth/logout", json={"refresh_token": first["refresh_token"]}
+    )
+
+    response = await refresh(async_client, first["refresh_token"])
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    response = await refresh(async_client, second["refresh_token"])
+    assert response.status_code == status.HTTP_200_OK
+
+
+@pytest.mark.asyncio
+async def test_concurrent_refresh_within_grace(
+    async_client: AsyncClient, password_settings, factory
+):
+    """Одновременные обновления одним токеном получают по новой паре"""
+    password_settings(bcrypt_rounds=4)
+    await create_account(factory)
+
+    tokens = await login(async_client)
+    responses = await asyncio.gather(
+        *(refresh(async_client, tokens["refresh_token"]) for _ in range(2))
+    )
+
+    assert [response.status_code for response in responses] == [status.HTTP_200_OK] * 2
+    for response in responses:
+        response = await refresh(async_client, response.json()["refresh_token"])
+        assert response.status_code == status.HTTP_200_OK
+
+
+@pytest.mark.asyncio
+async def test_access_token_lifetime(
+    async_client: AsyncClient, password_settings, monkeypatch, factory
+):
+    """Вход и обновление выдают access-токен на access_token_expires минут"""
+    password_settings(bcrypt_rounds=4)
+    monkeypatch.setattr(settings, "access_token_expires", 5)
+    await create_account(factory)
+
+    tokens = await login(async_client)
+    rotated = (await refresh(async_client, tokens["refresh_token"])).json()
+
+    for access_token in (tokens["access_token"], rotated["access_token"]):
+        payload = decode_access_token(access_token)
+        assert payload["exp"] - payload["iat"] == pytest.approx(300, abs=2)
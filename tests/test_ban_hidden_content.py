@@ -0,0 +1,95 @@
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+from sqlalchemy import select, update
+from src.db.models import Advertisement, Complaint, Review, User
+from src.sevices.moderation import sync_hidden_content
+
+
+async def create_content(factory):
+    admin_user = await factory.user("Admin", is_admin=True)
+    spammer = await factory.user("Spam")
+    category = await factory.category()
+    (other_ad,) = await factory.ads(admin_user, category, 1, name="Phone")
+    spam_ads = await factory.ads(spammer, category, 5, name="Spam")
+    await factory.add(
+        Review(description="Spam", user_id=spammer.id, adv_id=other_ad.id),
+        Complaint(description="Spam", user_id=spammer.id, adv_id=other_ad.id),
+    )
+    return admin_user, spammer, other_ad, spam_ads
+
+
+async def hidden_flags(db_session, user_id: int):
+    async with db_session.begin():
+        flags = set()
+        for model in (Advertisement, Review, Complaint):
+            result = await db_session.scalars(
+                select(model.hidden).where(model.user_id == user_id)
+            )
+            flags.update(result)
+        return flags
+
+
+@pytest.mark.asyncio
+async def test_ban_hides_content_and_unban_restores_it(
+    async_client: AsyncClient,
+    db_session,
+    factory,
+):
+    """После бана контент пользователя пропадает из выдачи, после разбана
+    возвращается"""
+    admin_user, spammer, other_ad, spam_ads = await create_content(factory)
+    headers = factory.headers(admin_user)
+
+    response = await async_client.patch(f"/user/ban/{spammer.id}", headers=headers)
+    assert response.status_code == status.HTTP_200_OK
+    assert await hidden_flags(db_session, spammer.id) == {True}
+
+    response = await async_client.get("/adv/", headers=headers)
+    assert [item["id"] for item in response.json()["items"]] == [other_ad.id]
+
+    response = await async_client.get(f"/adv/{spam_ads[0].id}", headers=headers)
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    for path in ("/review", "/complaint"):
+        response = await async_client.post(
+            f"{path}/{spam_ads[0].id}",
+            json={"description": "Hidden"},
+            headers=headers,
+        )
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    response = await async_client.get(f"/adv/{other_ad.id}", headers=headers)
+    assert response.json()["reviews"] == []
+
+    response = await async_client.get("/complaint/", headers=headers)
+    assert response.json()["total"] == 0
+
+    response = await async_client.patch(f"/user/unban/{spammer.id}", headers=headers)
+    assert response.status_code == status.HTTP_200_OK
+    assert await hidden_flags(db_session, spammer.id) == {False}
+
+    response = await async_client.get("/adv/", headers=headers)
+    assert response.json()["total"] == 6
+
+
+@pytest.mark.asyncio
+async def test_sync_follows_current_ban_state(db_session, factory):
+    """Задача работает пачками и сверяется с текущим is_banned, поэтому
+    повторный или устаревший запуск ничего не портит"""
+    _, spammer, _, _ = await create_content(factory)
+
+    async with db_session.begin():
+        await db_session.execute(
+            update(User).where(User.id == spammer.id).values(is_banned=True)
+        )
+    assert await sync_hidden_content(spammer.id, batch_size=2) == 7
+    assert await sync_hidden_content(spammer.id, batch_size=2) == 0
+    assert await hidden_flags(db_session, spammer.id) == {True}
+
+    async with db_session.begin():
+        await db_session.execute(
+            update(User).where(User.id == spammer.id).values(is_banned=False)
+        )
+    assert await sync_hidden_content(spammer.id, batch_size=2) == 7
+    assert await hidden_flags(db_session, spammer.id) == {False}
@@ -0,0 +1,107 @@
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+from sqlalchemy import select
+from src.db.models import Complaint, Review
+from src.db.complaint_stats import refresh_complaint_stats
+
+
+async def create_content(factory):
+    admin_user = await factory.user("Admin", is_admin=True)
+    spammer = await factory.user("Spammer")
+    ads = await factory.ads(admin_user, await factory.category(), 2)
+    # Отзыв у пользователя на объявление один, жалоб - несколько разных
+    await factory.add(
+        *(Review(description="Spam", user_id=spammer.id, adv_id=adv.id) for adv in ads),
+        *(
+            Complaint(description=f"Spam {i}", user_id=spammer.id, adv_id=adv.id)
+            for adv in ads
+            for i in range(3)
+        ),
+    )
+    async with factory.session.begin():
+        await refresh_complaint_stats(factory.session)
+    return factory.headers(admin_user), factory.headers(spammer), spammer, ads
+
+
+@pytest.mark.asyncio
+async def test_bulk_complaints_delete_and_restore(
+    async_client: AsyncClient,
+    factory,
+):
+    """Жалобы на объявление удаляются и восстанавливаются одним запросом,
+    очередь модерации пересчитывается"""
+    admin_headers, _, _, ads = await create_content(factory)
+
+    response = await async_client.post(
+        "/complaint/bulk",
+        json={"action": "delete", "adv_id": ads[0].id},
+        headers=admin_headers,
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {"action": "delete", "affected": 3}
+    assert await factory.count(Complaint, deleted=False) == 3
+
+    response = await async_client.get("/complaint/queue", headers=admin_headers)
+    assert [item["adv_id"] for item in response.json()["items"]] == [ads[1].id]
+
+    response = await async_client.post(
+        "/complaint/bulk",
+        json={"action": "restore", "adv_id": ads[0].id},
+        headers=admin_headers,
+    )
+    assert response.json() == {"action": "restore", "affected": 3}
+    response = await async_client.get("/complaint/queue", headers=admin_headers)
+    assert {item["complaints"] for item in response.json()["items"]} == {3}
+    assert len(response.json()["items"]) == 2
+
+
+@pytest.mark.asyncio
+async def test_bulk_reviews_by_user_and_ids(
+    async_client: AsyncClient,
+    db_session,
+    factory,
+):
+    """Фильтры объединяются через AND, повторное удаление ничего не задевает"""
+    admin_headers, _, spammer, ads = await create_content(factory)
+    async with db_session.begin():
+        result = await db_session.execute(
+            select(Review.id).where(Review.adv_id == ads[1].id)
+        )
+        ids = result.scalars().all()
+
+    body = {"action": "delete", "ids": ids, "user_id": spammer.id}
+    response = await async_client.post("/review/bulk", json=body, headers=admin_headers)
+    assert response.json() == {"action": "delete", "affected": 1}
+
+    response = await async_client.post("/review/bulk", json=body, headers=admin_headers)
+    assert response.json() == {"action": "delete", "affected": 0}
+
+    response = await async_client.post(
+        "/review/bulk",
+        json={"action": "delete", "user_id": spammer.id},
+        headers=admin_headers,
+    )
+    assert response.json() == {"action": "delete", "affected": 1}
+    assert await factory.count(Review, deleted=False) == 0
+
+
+@pytest.mark.asyncio
+async def test_bulk_requires_admin_and_filter(
+    async_client: AsyncClient,
+    factory,
+):
+    admin_headers, user_headers, spammer, _ = await create_content(factory)
+
+    response = await async_client.post(
+        "/review/bulk",
+        json={"action": "delete", "user_id": spammer.id},
+        headers=user_headers,
+    )
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    response = await async_client.post(
+        "/complaint/bulk", json={"action": "delete"}, headers=admin_headers
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert await factory.count(Complaint, deleted=False) == 6
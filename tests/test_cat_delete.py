@@ -1,8 +1,9 @@
 import pytest
 from fastapi import status
 from httpx import AsyncClient
-from sqlalchemy import select, delete
-from src.db.models import Category, User
+from sqlalchemy import func, select, delete, update
+from src.config import settings
+from src.db.models import Advertisement, Category, Review, User
 from src.utils.security import create_access_token
 
 
@@ -31,7 +32,8 @@ async def test_delete_category_success_as_admin(
             f"/category/{test_category.id}", headers=headers
         )
 
-        assert response.status_code == status.HTTP_204_NO_CONTENT
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {"id": test_category.id, "moved": 0}
 
         async with db_session.begin():
             result = await db_session.execute(
@@ -128,3 +130,118 @@ async def test_delete_category_not_found(
     finally:
         async with db_session.begin():
             await db_session.execute(delete(User))
+
+
+async def create_category_with_ads(factory, count: int):
+    admin_user = await factory.user("Admin", is_admin=True)
+    source = await factory.category("Phones")
+    target = await factory.category("Electronics")
+    await factory.ads(admin_user, source, count, name="Phone", price=100)
+    return factory.headers(admin_user), source, target
+
+
+@pytest.mark.asyncio
+async def test_delete_category_with_ads_conflict(
+    async_client: AsyncClient,
+    db_session,
+    factory,
+):
+    """Категорию с объявлениями без reassign_to удалить нельзя"""
+    headers, source, _ = await create_category_with_ads(factory, 1)
+
+    response = await async_client.delete(f"/category/{source.id}", headers=headers)
+
+    assert response.status_code == status.HTTP_409_CONFLICT
+
+    async with db_session.begin():
+        remaining = await db_session.scalar(
+            select(Category.id).where(Category.id == source.id)
+        )
+        assert remaining is not None
+
+
+@pytest.mark.asyncio
+async def test_delete_category_reassigns_ads_in_batches(
+    async_client: AsyncClient,
+    db_session,
+    monkeypatch,
+    factory,
+):
+    """Объявления переносятся пачками, в ответе число перенесенных"""
+    monkeypatch.setattr(settings, "category_reassign_batch_size", 2)
+    headers, source, target = await create_category_with_ads(factory, 5)
+
+    response = await async_client.delete(
+        f"/category/{source.id}",
+        params={"reassign_to": target.id},
+        headers=headers,
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {"id": source.id, "moved": 5}
+
+    async with db_session.begin():
+        result = await db_session.execute(
+            select(Advertisement.category_id, Advertisement.version)
+        )
+        assert set(result.all()) == {(target.id, 2)}
+        remaining = await db_session.scalar(
+            select(Category.id).where(Category.id == source.id)
+        )
+        assert remaining is None
+
+
+@pytest.mark.asyncio
+async def test_delete_category_reassign_target_validation(
+    async_client: AsyncClient,
+    factory,
+):
+    headers, source, _ = await create_category_with_ads(factory, 1)
+
+    response = await async_client.delete(
+        f"/category/{source.id}", params={"reassign_to": 999999}, headers=headers
+    )
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert response.json()["detail"] == "Reassign category not found"
+
+    response = await async_client.delete(
+        f"/category/{source.id}",
+        params={"reassign_to": source.id},
+        headers=headers,
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.asyncio
+async def test_delete_category_erases_deleted_ads(
+    async_client: AsyncClient,
+    db_session,
+    factory,
+):
+    """Удаленные объявления не мешают удалить категорию и стираются вместе с
+    ней, но только если в ней не осталось действующих"""
+    admin_user = await factory.user("Admin", is_admin=True)
+    source = await factory.category("Phones")
+    ads = await factory.ads(admin_user, source, 2)
+    await factory.add(
+        Review(description="Old review", user_id=admin_user.id, adv_id=ads[0].id)
+    )
+    headers = factory.headers(admin_user)
+    async with db_session.begin():
+        await db_session.execute(
+            update(Advertisement)
+            .where(Advertisement.id == ads[0].id)
+            .values(deleted_at=func.now())
+        )
+
+    response = await async_client.delete(f"/category/{source.id}", headers=headers)
+    assert response.status_code == status.HTTP_409_CONFLICT
+
+    async with db_session.begin():
+        await db_session.execute(update(Advertisement).values(deleted_at=func.now()))
+
+    response = await async_client.delete(f"/category/{source.id}", headers=headers)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {"id": source.id, "moved": 0}
+
+    assert await factory.count(Advertisement) == 0
@@ -0,0 +1,174 @@
+import json
+import pytest
+from sqlalchemy import select, delete
+from src.cli.importer import (
+    ImportFailed,
+    import_advertisements,
+    import_users,
+    read_checkpoint,
+)
+from src.db.models import Advertisement, Category, User
+
+
+def write_ndjson(path, rows):
+    with open(path, "w", encoding="utf-8") as target:
+        for row in rows:
+            target.write((row if isinstance(row, str) else json.dumps(row)) + "\n")
+
+
+def silent(imported, elapsed):
+    pass
+
+
+@pytest.mark.asyncio
+async def test_import_users_and_advertisements(tmp_path, db_session):
+    """Импорт пользователей и объявлений с созданием категорий по имени"""
+    users_file = tmp_path / "users.ndjson"
+    ads_file = tmp_path / "ads.ndjson"
+    write_ndjson(
+        users_file,
+        [
+            {
+                "name": "Import",
+                "surname": "User",
+                "email": "import@example.com",
+                "hashed_password": "hashedpass",
+            },
+            {
+                "name": "Plain",
+                "surname": "Password",
+                "email": "plain@example.com",
+                "password": "secret",
+                "is_admin": True,
+            },
+        ],
+    )
+    write_ndjson(
+        ads_file,
+        [
+            {
+                "name": f"Imported {i}",
+                "descriptions": "d",
+                "price": i,
+                "category": "Import A" if i % 2 else "Import B",
+                "user_email": "import@example.com",
+            }
+            for i in range(5)
+        ],
+    )
+    try:
+        assert await import_users(str(users_file), chunk_size=1, progress=silent) == 2
+        assert (
+            await import_advertisements(str(ads_file), chunk_size=2, progress=silent)
+            == 5
+        )
+
+        async with db_session.begin():
+            result = await db_session.execute(
+                select(User.email, User.is_admin, User.hashed_password).order_by(
+                    User.email
+                )
+            )
+            users = result.all()
+            result = await db_session.execute(
+                select(Advertisement.name, Category.name, User.email)
+                .join(Category)
+                .join(User)
+                .order_by(Advertisement.name)
+            )
+            ads = result.all()
+
+        assert [(email, is_admin) for email, is_admin, _ in users] == [
+            ("import@example.com", False),
+            ("plain@example.com", True),
+        ]
+        assert users[1].hashed_password.startswith("$2b$")
+        assert ads[0] == ("Imported 0", "Import B", "import@example.com")
+        assert ads[1] == ("Imported 1", "Import A", "import@example.com")
+        assert len(ads) == 5
+        assert not (tmp_path / "ads.ndjson.checkpoint").exists()
+
+    finally:
+        async with db_session.begin():
+            await db_session.execute(delete(Advertisement))
+            await db_session.execute(delete(Category))
+            await db_session.execute(delete(User))
+
+
+@pytest.mark.asyncio
+async def test_import_advertisements_resumes_from_checkpoint(tmp_path, db_session):
+    """Повторный запуск продолжает импорт с последнего зафиксированного пакета"""
+    ads_file = tmp_path / "ads.ndjson"
+    rows = [
+        {
+            "name": f"Resume {i}",
+            "descriptions": "d",
+            "category": "Resume",
+            "user_email": "resume@example.com",
+        }
+        for i in range(5)
+    ]
+    try:
+        async with db_session.begin():
+            db_session.add(
+                User(
+                    name="Resume",
+                    surname="User",
+                    email="resume@example.com",
+                    hashed_password="hashedpass",
+                )
+            )
+
+        write_ndjson(ads_file, rows[:3] + ["{broken"] + rows[3:])
+        with pytest.raises(ImportFailed, match="line 4"):
+            await import_advertisements(str(ads_file), chunk_size=2, progress=silent)
+        assert read_checkpoint(str(ads_file)) == 2
+
+        write_ndjson(ads_file, rows[:3] + [""] + rows[3:])
+        assert (
+            await import_advertisements(str(ads_file), chunk_size=2, progress=silent)
+            == 3
+        )
+
+        async with db_session.begin():
+            result = await db_session.execute(
+                select(Advertisement.name).order_by(Advertisement.name)
+            )
+            assert result.scalars().all() == [f"Resume {i}" for i in range(5)]
+
+    finally:
+        if (tmp_path / "ads.ndjson.checkpoint").exists():
+            (tmp_path / "ads.ndjson.checkpoint").unlink()
+        async with db_session.begin():
+            await db_session.execute(delete(Advertisement))
+            await db_session.execute(delete(Category))
+            await db_session.execute(delete(User))
+
+
+@pytest.mark.asyncio
+async def test_import_advertisements_unknown_user(tmp_path, db_session):
+    """Объявление с неизвестным владельцем останавливает импорт"""
+    ads_file = tmp_path / "ads.ndjson"
+    write_ndjson(
+        ads_file,
+        [
+            {
+                "name": "Orphan",
+                "descriptions": "d",
+                "category": "Orphan",
+                "user_email": "missing@example.com",
+            }
+        ],
+    )
+    try:
+        with pytest.raises(ImportFailed, match="User not found"):
+            await import_advertisements(str(ads_file), chunk_size=10, progress=silent)
+        assert not (tmp_path / "ads.ndjson.checkpoint").exists()
+
+        async with db_session.begin():
+            result = await db_session.execute(select(Category.id))
+            assert result.scalars().all() == []
+
+    finally:
+        async with db_session.begin():
+            await db_session.execute(delete(Category))
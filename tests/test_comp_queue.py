@@ -0,0 +1,127 @@
+from datetime import datetime, timedelta, timezone
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+from sqlalchemy import select
+from src.db.complaint_stats import refresh_complaint_stats
+from src.db.models import Complaint
+from src.schemas.paginate import encode_cursor
+
+
+async def create_ads(factory, count: int):
+    admin_user = await factory.user("Admin", is_admin=True)
+    owner = await factory.user("Owner")
+    ads = await factory.ads(owner, await factory.category(), count)
+    return admin_user, owner, ads
+
+
+async def complain(async_client, headers, adv_id: int, times: int):
+    for i in range(times):
+        response = await async_client.post(
+            f"/complaint/{adv_id}", json={"description": f"Fake {i}"}, headers=headers
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+
+
+@pytest.mark.asyncio
+async def test_queue_ranks_ads_by_complaints_with_cursor(
+    async_client: AsyncClient,
+    factory,
+):
+    """Очередь отдает объявления по убыванию числа жалоб страницами по курсору"""
+    admin_user, _, ads = await create_ads(factory, 4)
+    headers = factory.headers(admin_user)
+    for adv, times in zip(ads, (1, 3, 2, 0)):
+        await complain(async_client, headers, adv.id, times)
+
+    pages = []
+    params = {"size": 2}
+    while True:
+        response = await async_client.get(
+            "/complaint/queue", params=params, headers=headers
+        )
+        assert response.status_code == status.HTTP_200_OK
+        page = response.json()
+        pages.append([(item["adv_id"], item["complaints"]) for item in page["items"]])
+        if page["next_cursor"] is None:
+            break
+        params["cursor"] = page["next_cursor"]
+
+    assert pages == [
+        [(ads[1].id, 3), (ads[2].id, 2)],
+        [(ads[0].id, 1)],
+    ]
+    assert page["items"][0]["adv_name"] == "Laptop 0"
+    assert page["items"][0]["score"] == pytest.approx(1, rel=0.01)
+
+
+@pytest.mark.asyncio
+async def test_queue_prefers_recent_complaints(
+    async_client: AsyncClient,
+    db_session,
+    factory,
+):
+    """Три жалобы недельной давности весят меньше одной свежей"""
+    admin_user, _, ads = await create_ads(factory, 2)
+    headers = factory.headers(admin_user)
+    week_ago = datetime.now(timezone.utc) - timedelta(days=7)
+    await factory.add(
+        *(
+            Complaint(
+                description="Old",
+                adv_id=ads[0].id,
+                user_id=admin_user.id,
+                created_at=week_ago,
+            )
+            for _ in range(3)
+        )
+    )
+    async with db_session.begin():
+        await refresh_complaint_stats(db_session, [ads[0].id])
+    await complain(async_client, headers, ads[1].id, 1)
+
+    response = await async_client.get("/complaint/queue", headers=headers)
+    items = response.json()["items"]
+
+    assert [item["adv_id"] for item in items] == [ads[1].id, ads[0].id]
+    assert items[1]["complaints"] == 3
+    assert items[1]["score"] == pytest.approx(3 / 2**7, rel=0.01)
+
+
+@pytest.mark.asyncio
+async def test_queue_recomputes_after_complaint_delete(
+    async_client: AsyncClient,
+    db_session,
+    factory,
+):
+    admin_user, _, ads = await create_ads(factory, 1)
+    headers = factory.headers(admin_user)
+    await complain(async_client, headers, ads[0].id, 2)
+    async with db_session.begin():
+        complaint_id = await db_session.scalar(select(Complaint.id).limit(1))
+
+    response = await async_client.delete(f"/complaint/{complaint_id}", headers=headers)
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+
+    response = await async_client.get("/complaint/queue", headers=headers)
+    assert [item["complaints"] for item in response.json()["items"]] == [1]
+
+
+@pytest.mark.asyncio
+async def test_queue_rejects_bad_cursor_and_non_admin(
+    async_client: AsyncClient,
+    factory,
+):
+    admin_user, owner, _ = await create_ads(factory, 1)
+    headers = factory.headers(admin_user)
+
+    for cursor in ("not-a-cursor", encode_cursor(["x", "y"]), encode_cursor([1])):
+        response = await async_client.get(
+            "/complaint/queue", params={"cursor": cursor}, headers=headers
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    response = await async_client.get(
+        "/complaint/queue", headers=factory.headers(owner)
+    )
+    assert response.status_code == status.HTTP_403_FORBIDDEN
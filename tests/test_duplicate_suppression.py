@@ -0,0 +1,138 @@
+import asyncio
+
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+from src.config import settings
+from src.db.models import Complaint, Review
+
+REQUESTS = 10
+
+
+async def create_content(factory):
+    admin_user = await factory.user("Admin", is_admin=True)
+    author = await factory.user("Author")
+    (adv,) = await factory.ads(admin_user, await factory.category(), 1)
+    return admin_user, author, adv
+
+
+@pytest.mark.asyncio
+async def test_concurrent_reviews_create_one_row(
+    async_client: AsyncClient,
+    factory,
+):
+    """Параллельные отзывы пользователя на объявление создают одну строку,
+    остальные запросы получают ее же"""
+    admin_user, author, adv = await create_content(factory)
+
+    responses = await asyncio.gather(
+        *(
+            async_client.post(
+                f"/review/{adv.id}",
+                json={"description": f"Review {i}", "rating": 4},
+                headers=factory.headers(author),
+            )
+            for i in range(REQUESTS)
+        )
+    )
+
+    codes = sorted(response.status_code for response in responses)
+    assert codes == [status.HTTP_200_OK] * (REQUESTS - 1) + [status.HTTP_201_CREATED]
+    assert len({response.json()["id"] for response in responses}) == 1
+    assert await factory.count(Review) == 1
+
+    response = await async_client.get(f"/adv/{adv.id}", headers=factory.headers(author))
+    assert response.json()["rating"]["count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_complaints_are_deduplicated(
+    async_client: AsyncClient,
+    factory,
+):
+    """Одинаковые с точностью до регистра и пробелов жалобы в пределах окна
+    дают одну строку и один голос в очереди модерации"""
+    admin_user, author, adv = await create_content(factory)
+    texts = ["Fake  ad", "fake ad", " FAKE AD "] * 3 + ["Fake ad"]
+
+    responses = await asyncio.gather(
+        *(
+            async_client.post(
+                f"/complaint/{adv.id}",
+                json={"description": text},
+                headers=factory.headers(author),
+            )
+            for text in texts
+        )
+    )
+
+    codes = [response.status_code for response in responses]
+    assert codes.count(status.HTTP_201_CREATED) == 1
+    assert len({response.json()["id"] for response in responses}) == 1
+    assert await factory.count(Complaint) == 1
+
+    response = await async_client.post(
+        f"/complaint/{adv.id}",
+        json={"description": "Wrong price"},
+        headers=factory.headers(author),
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+
+    response = await async_client.get(
+        "/complaint/queue", headers=factory.headers(admin_user)
+    )
+    assert response.json()["items"][0]["complaints"] == 2
+
+
+@pytest.mark.asyncio
+async def test_complaint_dedup_can_be_disabled(
+    async_client: AsyncClient,
+    monkeypatch,
+    factory,
+):
+    monkeypatch.setattr(settings, "complaint_dedup_window", 0)
+    admin_user, author, adv = await create_content(factory)
+
+    for _ in range(2):
+        response = await async_client.post(
+            f"/complaint/{adv.id}",
+            json={"description": "Fake ad"},
+            headers=factory.headers(author),
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+    assert await factory.count(Complaint) == 2
+
+
+@pytest.mark.asyncio
+async def test_deleted_review_does_not_block_new_one(
+    async_client: AsyncClient,
+    factory,
+):
+    """После удаления можно оставить новый отзыв, а восстановить старый
+    поверх него нельзя"""
+    admin_user, author, adv = await create_content(factory)
+    response = await async_client.post(
+        f"/review/{adv.id}",
+        json={"description": "First"},
+        headers=factory.headers(author),
+    )
+    first = response.json()["id"]
+    response = await async_client.delete(
+        f"/review/{first}", headers=factory.headers(author)
+    )
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+
+    response = await async_client.post(
+        f"/review/{adv.id}",
+        json={"description": "Second"},
+        headers=factory.headers(author),
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+    assert response.json()["id"] != first
+
+    response = await async_client.post(
+        "/review/bulk",
+        json={"action": "restore", "ids": [first]},
+        headers=factory.headers(admin_user),
+    )
+    assert response.status_code == status.HTTP_409_CONFLICT
@@ -0,0 +1,42 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+IMPORT_TIME_BUDGET_US = 3_000_000
+LAZY_MODULES = ("aiogram", "asyncpg")
+
+
+def import_profile(module: str) -> dict:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        cwd=ROOT,
+        env=os.environ.copy(),
+        check=True,
+    )
+    profile = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        if cumulative.strip().isdigit():
+            profile[name.strip()] = int(cumulative)
+    return profile
+
+
+def test_main_import_time_within_budget():
+    """Импорт приложения укладывается в бюджет холодного старта"""
+    profile = import_profile("main")
+
+    assert profile["main"] <= IMPORT_TIME_BUDGET_US
+
+
+def test_heavy_modules_are_not_imported_eagerly():
+    """Telegram-клиент и драйвер БД не импортируются вместе с приложением"""
+    profile = import_profile("main")
+
+    assert not [name for name in profile if name.split(".")[0] in LAZY_MODULES]
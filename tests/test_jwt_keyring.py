@@ -0,0 +1,76 @@
+from pathlib import Path
+import jwt
+import pytest
+from fastapi import HTTPException
+from src.config import settings
+from src.utils import keyring
+from src.utils.security import (
+    create_access_token,
+    decode_access_token,
+    get_token_identity,
+)
+
+pytest.importorskip("cryptography")
+
+
+@pytest.fixture
+def rotate(monkeypatch, tmp_path):
+    """Кладет ES256-ключ в каталог ключей и делает его активным"""
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import ec
+
+    private_key = ec.generate_private_key(ec.SECP256R1())
+    (tmp_path / "2025-01.ES256.pem").write_bytes(
+        private_key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+    )
+
+    def configure(active_kid: str):
+        monkeypatch.setattr(settings, "jwt_keys_dir", str(tmp_path))
+        monkeypatch.setattr(settings, "jwt_active_kid", active_kid)
+        monkeypatch.setattr(keyring, "_keyring", None)
+
+    monkeypatch.setattr(keyring, "_keyring", None)
+    return configure
+
+
+def test_rotation_keeps_legacy_tokens_valid(rotate):
+    """Токен, выданный до ротации, проверяется старым ключом"""
+    legacy_token = create_access_token({"id": 1})
+    assert "kid" not in jwt.get_unverified_header(legacy_token)
+
+    rotate("2025-01")
+    token = create_access_token({"id": 2})
+
+    assert jwt.get_unverified_header(token) == {
+        "alg": "ES256",
+        "kid": "2025-01",
+        "typ": "JWT",
+    }
+    assert decode_access_token(token)["id"] == 2
+    assert decode_access_token(legacy_token)["id"] == 1
+
+
+@pytest.mark.asyncio
+async def test_unknown_kid_is_rejected(rotate):
+    """Токен с kid удаленного ключа не принимается"""
+    rotate("2025-01")
+    token = create_access_token({"id": 2})
+
+    for path in Path(settings.jwt_keys_dir).iterdir():
+        path.unlink()
+    rotate("")
+
+    with pytest.raises(HTTPException) as exc:
+        await get_token_identity(token)
+    assert exc.value.status_code == 401
+
+
+def test_unknown_active_kid_fails_at_startup(rotate):
+    rotate("missing")
+
+    with pytest.raises(ValueError):
+        keyring.get_keyring()
@@ -0,0 +1,91 @@
+import asyncio
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+
+import src.db.base as db_base
+from src.config import settings
+from src.utils.lifespan import InFlightTracker, lifespan, warm_pool
+
+
+@pytest.mark.asyncio
+async def test_lifespan_warms_pool_and_disposes_engine():
+    """Пул прогревается при старте, движок закрывается при остановке"""
+    async with lifespan(FastAPI()):
+        pool = db_base.engine.pool
+        assert pool.checkedin() >= min(settings.db_pool_warmup, settings.db_pool_size)
+
+    assert db_base.engine is None
+
+
+@pytest.mark.asyncio
+async def test_warm_pool_is_capped_by_pool_size():
+    await warm_pool(settings.db_pool_size + 5)
+
+    assert db_base.get_engine().pool.checkedin() <= settings.db_pool_size
+
+
+async def consume(response):
+    return [chunk async for chunk in response.body_iterator]
+
+
+@pytest.mark.asyncio
+async def test_tracker_waits_for_in_flight_requests():
+    tracker = InFlightTracker()
+    release = asyncio.Event()
+
+    async def slow_endpoint(request):
+        await release.wait()
+        return StreamingResponse(iter(["ok"]))
+
+    request_task = asyncio.create_task(tracker.middleware(None, slow_endpoint))
+    await asyncio.sleep(0)
+    assert tracker.count == 1
+
+    drain_task = asyncio.create_task(tracker.wait_idle())
+    await asyncio.sleep(0)
+    assert not drain_task.done()
+
+    release.set()
+    assert await consume(await request_task) == ["ok"]
+    await asyncio.wait_for(drain_task, 1)
+    assert tracker.count == 0
+
+
+@pytest.mark.asyncio
+async def test_tracker_waits_for_streaming_body():
+    """Потоковый ответ считается активным, пока не отдано все тело"""
+    tracker = InFlightTracker()
+    release = asyncio.Event()
+
+    async def body():
+        yield "first"
+        await release.wait()
+        yield "last"
+
+    async def streaming_endpoint(request):
+        return StreamingResponse(body())
+
+    response = await tracker.middleware(None, streaming_endpoint)
+    assert tracker.count == 1
+
+    consume_task = asyncio.create_task(consume(response))
+    await asyncio.sleep(0)
+    assert tracker.count == 1
+
+    release.set()
+    assert await consume_task == ["first", "last"]
+    assert tracker.count == 0
+    await asyncio.wait_for(tracker.wait_idle(), 1)
+
+
+@pytest.mark.asyncio
+async def test_tracker_releases_failed_request():
+    tracker = InFlightTracker()
+
+    async def failing_endpoint(request):
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        await tracker.middleware(None, failing_endpoint)
+    assert tracker.count == 0
@@ -0,0 +1,85 @@
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+from src.db.models import Complaint, Review
+
+
+async def create_content(factory):
+    me = await factory.user("Me")
+    other = await factory.user("Other")
+    category = await factory.category()
+    ads = await factory.ads(me, category, 5) + await factory.ads(other, category, 3)
+    await factory.add(
+        *(
+            model(description="Text", user_id=author.id, adv_id=adv.id)
+            for model in (Review, Complaint)
+            for author, adv in zip((me, me, me, other), ads[5:] + ads[-1:])
+        )
+    )
+    return factory.headers(me), me, ads
+
+
+async def fetch_all(async_client, path: str, headers: dict, size: int) -> list:
+    pages = []
+    params = {"size": size}
+    while True:
+        response = await async_client.get(path, params=params, headers=headers)
+        assert response.status_code == status.HTTP_200_OK
+        page = response.json()
+        pages.append(page["items"])
+        if page["next_cursor"] is None:
+            return pages
+        params["cursor"] = page["next_cursor"]
+
+
+@pytest.mark.asyncio
+async def test_me_adv_pages_own_ads_newest_first(
+    async_client: AsyncClient,
+    factory,
+):
+    """Только свои объявления, без удаленных, от новых к старым по курсору"""
+    headers, me, ads = await create_content(factory)
+    response = await async_client.delete(f"/adv/{ads[1].id}", headers=headers)
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+
+    pages = await fetch_all(async_client, "/me/adv", headers, size=2)
+
+    assert [len(page) for page in pages] == [2, 2]
+    items = [item for page in pages for item in page]
+    assert [item["id"] for item in items] == [ads[i].id for i in (4, 3, 2, 0)]
+    assert items[0]["category_name"] == "Electronics"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("path", ["/me/reviews", "/me/complaints"])
+async def test_me_feedback_lists_only_own_rows(
+    async_client: AsyncClient,
+    path,
+    factory,
+):
+    headers, me, _ = await create_content(factory)
+
+    pages = await fetch_all(async_client, path, headers, size=2)
+
+    items = [item for page in pages for item in page]
+    assert len(items) == 3
+    assert {item["user_id"] for item in items} == {me.id}
+    ids = [item["id"] for item in items]
+    assert ids == sorted(ids, reverse=True)
+
+
+@pytest.mark.asyncio
+async def test_me_rejects_invalid_cursor(
+    async_client: AsyncClient,
+    factory,
+):
+    headers, _, _ = await create_content(factory)
+
+    for cursor in ("not-a-cursor", "WzFd"):
+        response = await async_client.get(
+            "/me/adv", params={"cursor": cursor}, headers=headers
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    response = await async_client.get("/me/adv")
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
@@ -0,0 +1,137 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import delete, insert
+from src.db.models import Advertisement, Category, Complaint, Review, User
+from src.utils.security import create_access_token
+
+ADVERTISEMENTS = 200
+REVIEWS = 20
+
+ROUTES = {
+    "GET /adv/": lambda client, data: client.get(
+        "/adv/", params={"size": 20, "sort_by_create": True}, headers=data["owner"]
+    ),
+    "GET /adv/{id}": lambda client, data: client.get(
+        f"/adv/{data['adv_id']}", headers=data["owner"]
+    ),
+    "POST /adv/": lambda client, data: client.post(
+        "/adv/",
+        json={
+            "name": "Perf",
+            "descriptions": "d",
+            "price": 1,
+            "category_id": data["category_id"],
+        },
+        headers=data["owner"],
+    ),
+    "PATCH /adv/{id}": lambda client, data: client.patch(
+        f"/adv/{data['adv_id']}", json={"price": 2}, headers=data["owner"]
+    ),
+    "GET /adv/export": lambda client, data: client.get(
+        "/adv/export", headers=data["owner"]
+    ),
+    "GET /review/": lambda client, data: client.get(
+        "/review/", params={"adv_id": data["adv_id"]}, headers=data["admin"]
+    ),
+    "GET /complaint/": lambda client, data: client.get(
+        "/complaint/", headers=data["admin"]
+    ),
+}
+
+
+async def seed(db_session) -> dict:
+    async with db_session.begin():
+        admin = User(
+            name="Perf",
+            surname="Admin",
+            email="perf-admin@example.com",
+            hashed_password="hashedpass",
+            is_admin=True,
+        )
+        owner = User(
+            name="Perf",
+            surname="Owner",
+            email="perf-owner@example.com",
+            hashed_password="hashedpass",
+        )
+        category = Category(name="Perf Category")
+        db_session.add_all([admin, owner, category])
+        await db_session.flush()
+
+        result = await db_session.execute(
+            insert(Advertisement).returning(Advertisement.id),
+            [
+                {
+                    "user_id": owner.id,
+                    "category_id": category.id,
+                    "name": f"Perf {i}",
+                    "descriptions": "d",
+                    "price": i,
+                }
+                for i in range(ADVERTISEMENTS)
+            ],
+        )
+        adv_id = result.scalars().all()[0]
+        # Отзыв у пользователя на объявление один, поэтому авторы разные
+        result = await db_session.execute(
+            insert(User).returning(User.id),
+            [
+                {
+                    "name": "Perf",
+                    "surname": f"Reviewer {i}",
+                    "email": f"perf-reviewer{i}@example.com",
+                    "hashed_password": "hashedpass",
+                }
+                for i in range(REVIEWS)
+            ],
+        )
+        reviewers = result.scalars().all()
+        for model in (Review, Complaint):
+            await db_session.execute(
+                insert(model),
+                [
+                    {"description": "d", "adv_id": adv_id, "user_id": user_id}
+                    for user_id in reviewers
+                ],
+            )
+
+    return {
+        "adv_id": adv_id,
+        "category_id": category.id,
+        "owner": {
+            "Authorization": "Bearer "
+            + create_access_token(data={"sub": owner.email, "id": owner.id})
+        },
+        "admin": {
+            "Authorization": "Bearer "
+            + create_access_token(data={"sub": admin.email, "id": admin.id})
+        },
+    }
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("route", ROUTES)
+async def test_route_performance_within_baseline(
+    route: str,
+    async_client: AsyncClient,
+    db_session,
+    perf_recorder,
+):
+    """Число SQL-запросов, время и память маршрута не хуже сохраненной базы"""
+    try:
+        data = await seed(db_session)
+
+        async def call():
+            response = await ROUTES[route](async_client, data)
+            assert response.status_code < 400, response.text
+
+        await perf_recorder.measure(route, call)
+
+        assert not perf_recorder.regressions(route), "\n".join(
+            perf_recorder.regressions(route)
+        )
+
+    finally:
+        async with db_session.begin():
+            for model in (Complaint, Review, Advertisement, Category, User):
+                await db_session.execute(delete(model))
@@ -0,0 +1,182 @@
+import time
+
+import fakeredis
+import pytest
+from fastapi import Request, status
+from httpx import AsyncClient
+from sqlalchemy import delete
+from src.config import settings
+from src.db.models import Advertisement, Category, User
+from src.utils.rate_limit import (
+    MemoryBucketStore,
+    RedisBucketStore,
+    client_address,
+    parse_limit,
+    rate_limiter,
+)
+from src.utils.security import create_access_token
+
+
+@pytest.fixture
+def fresh_store(monkeypatch):
+    monkeypatch.setattr(rate_limiter, "store", MemoryBucketStore())
+    monkeypatch.setattr(rate_limiter, "configured", True)
+
+
+@pytest.mark.asyncio
+async def test_login_is_limited_per_ip(
+    async_client: AsyncClient, db_session, fresh_store, monkeypatch
+):
+    """Перебор паролей с одного адреса получает 429 с Retry-After"""
+    monkeypatch.setattr(settings, "rate_limit_login_ip", "2/60")
+    form = {"username": "nobody@example.com", "password": "wrong"}
+
+    for _ in range(2):
+        response = await async_client.post("/auth/login", data=form)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    response = await async_client.post("/auth/login", data=form)
+
+    assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+    assert 0 < int(response.headers["Retry-After"]) <= 30
+
+
+@pytest.mark.asyncio
+async def test_writes_are_limited_per_user(
+    async_client: AsyncClient, db_session, fresh_store, monkeypatch
+):
+    """Лимит на запись считается для каждого пользователя отдельно"""
+    monkeypatch.setattr(settings, "rate_limit_write_user", "1/60")
+    try:
+        async with db_session.begin():
+            first = User(
+                name="Test",
+                surname="User",
+                email="rate1@example.com",
+                hashed_password="hashedpass",
+            )
+            second = User(
+                name="Test",
+                surname="User",
+                email="rate2@example.com",
+                hashed_password="hashedpass",
+            )
+            category = Category(name="Rate Category")
+            db_session.add_all([first, second, category])
+            await db_session.flush()
+
+        payload = {
+            "name": "Rate limited",
+            "descriptions": "d",
+            "price": 1,
+            "category_id": category.id,
+        }
+        headers = {
+            user.id: {
+                "Authorization": "Bearer "
+                + create_access_token(data={"sub": user.email, "id": user.id})
+            }
+            for user in (first, second)
+        }
+
+        response = await async_client.post(
+            "/adv/", json=payload, headers=headers[first.id]
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+
+        response = await async_client.post(
+            "/adv/", json=payload, headers=headers[first.id]
+        )
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        assert "Retry-After" in response.headers
+
+        response = await async_client.post(
+            "/adv/", json=payload, headers=headers[second.id]
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+
+        response = await async_client.get("/adv/", headers=headers[first.id])
+        assert response.status_code == status.HTTP_200_OK
+
+    finally:
+        async with db_session.begin():
+            await db_session.execute(delete(Advertisement))
+            await db_session.execute(delete(Category))
+            await db_session.execute(delete(User))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("backend", ["memory", "redis"])
+async def test_bucket_store_refuses_when_empty(backend: str):
+    """Оба хранилища выдают capacity запросов и затем время ожидания"""
+    if backend == "redis":
+        store = RedisBucketStore(fakeredis.FakeAsyncRedis())
+    else:
+        store = MemoryBucketStore()
+    limit = parse_limit("3/30")
+
+    try:
+        assert [await store.take("bucket", limit) for _ in range(3)] == [0, 0, 0]
+        retry_after = await store.take("bucket", limit)
+        assert 0 < retry_after <= 10
+        assert await store.take("other", limit) == 0
+    finally:
+        await store.close()
+
+
+@pytest.mark.asyncio
+async def test_redis_store_fails_open():
+    """Недоступный Redis не блокирует запросы"""
+    server = fakeredis.FakeServer()
+    server.connected = False
+    store = RedisBucketStore(fakeredis.FakeAsyncRedis(server=server))
+    limit = parse_limit("1/30")
+
+    try:
+        assert [await store.take("bucket", limit) for _ in range(3)] == [0, 0, 0]
+    finally:
+        await store.close()
+
+
+@pytest.mark.asyncio
+async def test_memory_store_stays_bounded():
+    """Заполненное хранилище вытесняет самые старые корзины за O(1)"""
+    store = MemoryBucketStore(max_keys=10_000)
+    limit = parse_limit("5/3600")
+    for i in range(store.max_keys):
+        await store.take(f"old:{i}", limit)
+    await store.take("old:0", limit)
+
+    started = time.perf_counter()
+    for i in range(store.max_keys - 1):
+        await store.take(f"new:{i}", limit)
+    elapsed = time.perf_counter() - started
+
+    assert len(store.buckets) == store.max_keys
+    assert "old:1" not in store.buckets
+    assert "old:0" in store.buckets
+    assert elapsed < 1
+
+
+@pytest.mark.asyncio
+async def test_memory_store_drops_refilled_buckets():
+    store = MemoryBucketStore()
+    await store.take("expired", parse_limit("5/0.001"))
+    time.sleep(0.002)
+    await store.take("fresh", parse_limit("5/60"))
+
+    assert list(store.buckets) == ["fresh"]
+
+
+def test_client_address_without_client():
+    """Без адреса клиента ключом служит адрес, дописанный в X-Forwarded-For
+    прокси, или общая корзина"""
+
+    def request(client=None, headers=()):
+        return Request({"type": "http", "client": client, "headers": list(headers)})
+
+    assert client_address(request(("10.0.0.1", 5000))) == "10.0.0.1"
+    for spoofed in (b"10.0.0.2", b"10.0.0.4, 10.0.0.5"):
+        headers = [(b"x-forwarded-for", spoofed + b", 10.0.0.3")]
+        assert client_address(request(headers=headers)) == "10.0.0.3"
+    assert client_address(request()) == "unknown"
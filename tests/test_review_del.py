@@ -43,7 +43,7 @@ async def test_get_reviews_basic(
             )
             review2 = Review(
                 description="Test review 2",
-                user=regular_user,
+                user=admin_user,
                 advertisement=advertisement,
             )
             db_session.add_all(
@@ -106,9 +106,15 @@ async def test_get_reviews_pagination(
 
             reviews = []
             for i in range(15):
+                reviewer = User(
+                    name=f"Reviewer {i}",
+                    surname="User",
+                    email=f"reviewer{i}@example.com",
+                    hashed_password="hashedpass",
+                )
                 review = Review(
                     description=f"Test review {i}",
-                    user=regular_user,
+                    user=reviewer,
                     advertisement=advertisement,
                     created_at=datetime.now() - timedelta(days=15 - i),
                 )
@@ -254,7 +260,7 @@ async def test_get_reviews_sorting(
             )
             review2 = Review(
                 description="New review",
-                user=regular_user,
+                user=admin_user,
                 advertisement=advertisement,
                 created_at=now - timedelta(days=1),
                 updated_at=now,
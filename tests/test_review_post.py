@@ -113,3 +113,65 @@ async def test_create_review_relationships(
             await db_session.execute(delete(Advertisement))
             await db_session.execute(delete(Category))
             await db_session.execute(delete(User))
+
+
+@pytest.mark.asyncio
+async def test_create_review_rejected_without_insert(
+    async_client: AsyncClient,
+    db_session,
+):
+    """Отзыв на свое, несуществующее или удаленное объявление не создается"""
+    try:
+        async with db_session.begin():
+            owner = User(
+                name="Owner",
+                surname="User",
+                email="owner@example.com",
+                hashed_password="hashedpass",
+            )
+            category = Category(name="Electronics")
+            advertisement = Advertisement(
+                name="Laptop",
+                descriptions="Good laptop",
+                price=1000,
+                user=owner,
+                categories=category,
+            )
+            deleted = Advertisement(
+                name="Phone",
+                descriptions="Sold",
+                price=500,
+                user=owner,
+                categories=category,
+                deleted_at=datetime.now(),
+            )
+            db_session.add_all([owner, category, advertisement, deleted])
+            await db_session.commit()
+
+        token = create_access_token(data={"sub": owner.email, "id": owner.id})
+        headers = {"Authorization": f"Bearer {token}"}
+        review_data = {"description": "Great product!"}
+
+        response = await async_client.post(
+            f"/review/{advertisement.id}", json=review_data, headers=headers
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+        for adv_id in (deleted.id, advertisement.id + 1000):
+            response = await async_client.post(
+                f"/review/{adv_id}", json=review_data, headers=headers
+            )
+            assert response.status_code == status.HTTP_404_NOT_FOUND
+
+        async with db_session.begin():
+            result = await db_session.execute(
+                select(Review.id).execution_options(include_deleted=True)
+            )
+            assert result.scalars().all() == []
+
+    finally:
+        async with db_session.begin():
+            await db_session.execute(delete(Review))
+            await db_session.execute(delete(Advertisement))
+            await db_session.execute(delete(Category))
+            await db_session.execute(delete(User))
@@ -0,0 +1,132 @@
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+from sqlalchemy import select
+from src.db.models import Advertisement
+from src.db.ratings import refresh_ratings
+
+
+async def create_ads(factory, count: int, reviewers: int):
+    admin_user = await factory.user("Admin", is_admin=True)
+    users = [await factory.user(f"Reviewer{i}") for i in range(reviewers)]
+    ads = await factory.ads(admin_user, await factory.category(), count)
+    return admin_user, users, ads
+
+
+async def post_review(async_client, headers: dict, adv_id: int, rating=None) -> int:
+    body = {"description": "Review"}
+    if rating is not None:
+        body["rating"] = rating
+    response = await async_client.post(f"/review/{adv_id}", json=body, headers=headers)
+    assert response.status_code == status.HTTP_201_CREATED
+    return response.json()["id"]
+
+
+async def rating_columns(db_session, adv_id: int):
+    async with db_session.begin():
+        result = await db_session.execute(
+            select(
+                Advertisement.rating_count,
+                Advertisement.rating_sum,
+                Advertisement.rating_histogram,
+                Advertisement.rating_avg,
+            ).where(Advertisement.id == adv_id)
+        )
+        return tuple(result.one())
+
+
+@pytest.mark.asyncio
+async def test_rating_summary_follows_review_changes(
+    async_client: AsyncClient,
+    db_session,
+    factory,
+):
+    """Сводка оценок обновляется при создании, изменении и удалении отзыва и
+    совпадает с полным пересчетом"""
+    admin_user, users, ads = await create_ads(factory, 1, 3)
+    adv_id = ads[0].id
+    first = await post_review(async_client, factory.headers(users[0]), adv_id, 5)
+    second = await post_review(async_client, factory.headers(users[1]), adv_id, 4)
+    await post_review(async_client, factory.headers(users[2]), adv_id)
+
+    response = await async_client.get(
+        f"/adv/{adv_id}", headers=factory.headers(users[0])
+    )
+    assert response.json()["rating"] == {
+        "count": 2,
+        "average": 4.5,
+        "histogram": {"1": 0, "2": 0, "3": 0, "4": 1, "5": 1},
+    }
+
+    response = await async_client.patch(
+        f"/review/{second}", json={"rating": 2}, headers=factory.headers(users[1])
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["rating"] == 2
+    response = await async_client.delete(
+        f"/review/{first}", headers=factory.headers(users[0])
+    )
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+
+    response = await async_client.get("/adv/", headers=factory.headers(users[0]))
+    assert response.json()["items"][0]["rating"] == {
+        "count": 1,
+        "average": 2.0,
+        "histogram": {"1": 0, "2": 1, "3": 0, "4": 0, "5": 0},
+    }
+
+    incremental = await rating_columns(db_session, adv_id)
+    async with db_session.begin():
+        await refresh_ratings(db_session, [adv_id])
+    assert await rating_columns(db_session, adv_id) == incremental
+
+
+@pytest.mark.asyncio
+async def test_sort_by_rating_puts_unrated_last(
+    async_client: AsyncClient,
+    factory,
+):
+    admin_user, users, ads = await create_ads(factory, 3, 2)
+    for user, rating in zip(users, (3, 4)):
+        await post_review(async_client, factory.headers(user), ads[0].id, rating)
+    await post_review(async_client, factory.headers(users[0]), ads[2].id, 5)
+
+    response = await async_client.get(
+        "/adv/", params={"sort_by_rating": True}, headers=factory.headers(users[0])
+    )
+
+    items = response.json()["items"]
+    assert [item["id"] for item in items] == [ads[i].id for i in (2, 0, 1)]
+    assert [item["rating"]["average"] for item in items] == [5.0, 3.5, None]
+
+
+@pytest.mark.asyncio
+async def test_bulk_review_delete_refreshes_rating(
+    async_client: AsyncClient,
+    db_session,
+    factory,
+):
+    admin_user, users, ads = await create_ads(factory, 1, 2)
+    for user, rating in zip(users, (1, 5)):
+        await post_review(async_client, factory.headers(user), ads[0].id, rating)
+
+    response = await async_client.post(
+        "/review/bulk",
+        json={"action": "delete", "user_id": users[1].id},
+        headers=factory.headers(admin_user),
+    )
+    assert response.json()["affected"] == 1
+
+    assert await rating_columns(db_session, ads[0].id) == (
+        1,
+        1,
+        [1, 0, 0, 0, 0],
+        1.0,
+    )
+
+    response = await async_client.post(
+        f"/review/{ads[0].id}",
+        json={"description": "Review", "rating": 6},
+        headers=factory.headers(users[1]),
+    )
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
@@ -0,0 +1,108 @@
+import json
+from datetime import datetime, timedelta, timezone
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+from sqlalchemy import func, select, update
+from src.db.base import get_engine
+from src.db.models import Advertisement, Complaint, Review
+from src.sevices.purge import PURGE_LOCK_KEY, purge_deleted
+
+
+async def create_content(factory):
+    owner = await factory.user("Owner")
+    author = await factory.user("Author")
+    ads = await factory.ads(owner, await factory.category(), 2)
+    review, _ = await factory.add(
+        Review(description="Nice", user_id=author.id, adv_id=ads[0].id),
+        Complaint(description="Fake", user_id=author.id, adv_id=ads[0].id),
+    )
+    return owner, author, ads, review
+
+
+@pytest.mark.asyncio
+async def test_deleted_advertisement_is_excluded_from_reads(
+    async_client: AsyncClient,
+    factory,
+):
+    """Удаленное объявление остается в таблице, но пропадает из всех чтений
+    вместе с отзывами и жалобами на него"""
+    owner, author, ads, review = await create_content(factory)
+    headers = factory.headers(owner)
+
+    response = await async_client.delete(f"/adv/{ads[0].id}", headers=headers)
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+
+    response = await async_client.get(f"/adv/{ads[0].id}", headers=headers)
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    response = await async_client.patch(
+        f"/adv/{ads[0].id}", json={"name": "Back"}, headers=headers
+    )
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    response = await async_client.get("/adv/", headers=headers)
+    assert [item["id"] for item in response.json()["items"]] == [ads[1].id]
+
+    response = await async_client.get("/adv/export", headers=headers)
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [row["id"] for row in rows] == [ads[1].id]
+
+    response = await async_client.get(f"/review/{review.id}", headers=headers)
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    for model in (Advertisement, Review, Complaint):
+        assert await factory.count(model, deleted=True) == 1
+
+
+@pytest.mark.asyncio
+async def test_review_owner_can_delete_review(
+    async_client: AsyncClient,
+    factory,
+):
+    _, author, _, review = await create_content(factory)
+    headers = factory.headers(author)
+
+    response = await async_client.delete(f"/review/{review.id}", headers=headers)
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+
+    response = await async_client.delete(f"/review/{review.id}", headers=headers)
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.asyncio
+async def test_purge_removes_only_old_tombstones(db_session, factory):
+    """Очистка стирает пачками записи старше срока хранения, начиная с
+    отзывов и жалоб, и не трогает недавно удаленные"""
+    _, _, ads, _ = await create_content(factory)
+    old = datetime.now(timezone.utc) - timedelta(days=40)
+    async with db_session.begin():
+        for model, condition in (
+            (Advertisement, Advertisement.id == ads[0].id),
+            (Review, Review.adv_id == ads[0].id),
+            (Complaint, Complaint.adv_id == ads[0].id),
+        ):
+            await db_session.execute(
+                update(model).where(condition).values(deleted_at=old)
+            )
+        await db_session.execute(
+            update(Advertisement)
+            .where(Advertisement.id == ads[1].id)
+            .values(deleted_at=func.now())
+        )
+
+    assert await purge_deleted(retention_days=30, batch_size=1) == 3
+
+    assert await factory.count(Advertisement, deleted=True) == 1
+    assert await factory.count(Review, deleted=True) == 0
+    assert await factory.count(Complaint, deleted=True) == 0
+
+
+@pytest.mark.asyncio
+async def test_purge_skips_when_another_worker_holds_lock(db_session):
+    async with get_engine().connect() as conn:
+        await conn.scalar(select(func.pg_advisory_lock(PURGE_LOCK_KEY)))
+        try:
+            assert await purge_deleted() is None
+        finally:
+            await conn.scalar(select(func.pg_advisory_unlock(PURGE_LOCK_KEY)))
@@ -0,0 +1,155 @@
+import asyncio
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+from sqlalchemy import delete
+from src.config import settings
+from src.db.models import Advertisement, Category, TokenRevocation, User
+from src.utils.revocation import RevocationSet, revocations, revoke_user
+from src.utils.security import TokenUser, create_access_token, get_token_identity
+from tests.perf import count_statements
+
+
+@pytest.fixture
+def stateless(monkeypatch):
+    monkeypatch.setattr(settings, "stateless_auth", True)
+    monkeypatch.setattr(revocations, "revoked", {})
+
+
+@pytest.mark.asyncio
+async def test_stateless_auth_does_not_query_users(db_session, stateless):
+    """Пользователь берется из подписанных claims без запроса к базе"""
+    token = create_access_token({"id": 987654, "is_admin": True})
+
+    with count_statements() as counter:
+        user = await get_token_identity(token)
+
+    assert user == TokenUser(id=987654, is_admin=True, is_banned=False)
+    assert counter["statements"] == 0
+
+
+@pytest.mark.asyncio
+async def test_ban_revokes_issued_tokens(
+    async_client: AsyncClient, db_session, stateless
+):
+    """После бана старый токен отклоняется, а новый несет признак бана"""
+    try:
+        async with db_session.begin():
+            admin = User(
+                name="Admin",
+                surname="User",
+                email="stateless-admin@example.com",
+                hashed_password="hashedpass",
+                is_admin=True,
+            )
+            target = User(
+                name="Target",
+                surname="User",
+                email="stateless-target@example.com",
+                hashed_password="hashedpass",
+            )
+            db_session.add_all([admin, target])
+            await db_session.flush()
+
+        admin_headers = {
+            "Authorization": "Bearer "
+            + create_access_token({"id": admin.id, "is_admin": True})
+        }
+        old_headers = {
+            "Authorization": "Bearer "
+            + create_access_token({"id": target.id, "is_admin": False})
+        }
+
+        response = await async_client.get("/adv/999999", headers=old_headers)
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+        response = await async_client.patch(
+            f"/user/ban/{target.id}", headers=admin_headers
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+        response = await async_client.get("/adv/999999", headers=old_headers)
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+        new_headers = {
+            "Authorization": "Bearer "
+            + create_access_token(
+                {"id": target.id, "is_admin": False, "is_banned": True}
+            )
+        }
+        response = await async_client.get("/adv/999999", headers=new_headers)
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    finally:
+        async with db_session.begin():
+            await db_session.execute(delete(TokenRevocation))
+            await db_session.execute(delete(User))
+
+
+@pytest.mark.asyncio
+async def test_create_advertisement_returns_owner(
+    async_client: AsyncClient, db_session, stateless
+):
+    """Маршруты, которым нужен профиль, получают строку User и в режиме
+    stateless_auth"""
+    try:
+        async with db_session.begin():
+            user = User(
+                name="Stateless",
+                surname="User",
+                email="stateless-owner@example.com",
+                hashed_password="hashedpass",
+            )
+            category = Category(name="Stateless Category")
+            db_session.add_all([user, category])
+            await db_session.flush()
+
+        headers = {"Authorization": "Bearer " + create_access_token({"id": user.id})}
+        response = await async_client.post(
+            "/adv/",
+            json={
+                "name": "New Advertisement",
+                "descriptions": "Test description",
+                "price": 1000,
+                "category_id": category.id,
+            },
+            headers=headers,
+        )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.json()["user"]["email"] == "stateless-owner@example.com"
+
+    finally:
+        async with db_session.begin():
+            await db_session.execute(delete(Advertisement))
+            await db_session.execute(delete(Category))
+            await db_session.execute(delete(User))
+
+
+@pytest.mark.asyncio
+async def test_revocations_reach_other_workers(db_session, stateless):
+    """Отзыв, зафиксированный одним воркером, приходит другим через NOTIFY"""
+    worker = RevocationSet()
+    try:
+        await worker.start()
+
+        async with db_session.begin():
+            await revoke_user(db_session, 4242)
+
+        for _ in range(100):
+            if 4242 in worker.revoked:
+                break
+            await asyncio.sleep(0.02)
+
+        assert worker.is_revoked(4242, worker.revoked[4242])
+        assert not worker.is_revoked(4242, worker.revoked[4242] + 1)
+
+        token = create_access_token({"id": 4242})
+        assert await get_token_identity(token) == TokenUser(
+            id=4242, is_admin=False, is_banned=False
+        )
+
+    finally:
+        await worker.stop()
+        async with db_session.begin():
+            await db_session.execute(delete(TokenRevocation))
@@ -2,8 +2,9 @@ import pytest
 from fastapi import status
 from httpx import AsyncClient
 from sqlalchemy import select, delete
-from src.db.models import User
+from src.db.models import Advertisement, Category, Complaint, Review, User
 from src.utils.security import create_access_token
+from tests.perf import count_statements
 
 
 @pytest.mark.asyncio
@@ -138,3 +139,100 @@ async def test_delete_user_not_found(
     finally:
         async with db_session.begin():
             await db_session.execute(delete(User))
+
+
+@pytest.mark.asyncio
+async def test_delete_user_removes_dependent_rows(
+    async_client: AsyncClient,
+    db_session,
+):
+    """Вместе с пользователем удаляются его объявления, его отзывы и жалобы,
+    а также чужие отзывы и жалобы на его объявления"""
+    try:
+        async with db_session.begin():
+            admin_user = User(
+                name="Admin",
+                surname="User",
+                email="admin@example.com",
+                hashed_password="hashedpass",
+                is_admin=True,
+            )
+            test_user = User(
+                name="Test",
+                surname="User",
+                email="test@example.com",
+                hashed_password="hashedpass",
+            )
+            category = Category(name="Electronics")
+            own_ads = [
+                Advertisement(
+                    name=f"Laptop {i}",
+                    descriptions="Good laptop",
+                    price=1000,
+                    user=test_user,
+                    categories=category,
+                )
+                for i in range(20)
+            ]
+            other_ad = Advertisement(
+                name="Phone",
+                descriptions="Good phone",
+                price=500,
+                user=admin_user,
+                categories=category,
+            )
+            db_session.add_all(
+                [
+                    admin_user,
+                    test_user,
+                    category,
+                    other_ad,
+                    *own_ads,
+                    Review(
+                        description="On test ad",
+                        user=admin_user,
+                        advertisement=own_ads[0],
+                    ),
+                    Complaint(
+                        description="On test ad",
+                        user=admin_user,
+                        advertisement=own_ads[1],
+                    ),
+                    Review(
+                        description="By test user",
+                        user=test_user,
+                        advertisement=other_ad,
+                    ),
+                    Complaint(
+                        description="By test user",
+                        user=test_user,
+                        advertisement=other_ad,
+                    ),
+                ]
+            )
+            await db_session.commit()
+
+        token = create_access_token(data={"sub": admin_user.email, "id": admin_user.id})
+        headers = {"Authorization": f"Bearer {token}"}
+
+        with count_statements() as counter:
+            response = await async_client.delete(
+                f"/user/{test_user.id}", headers=headers
+            )
+
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        assert counter["statements"] < 12
+
+        async with db_session.begin():
+            ads = await db_session.scalars(select(Advertisement.id))
+            assert list(ads) == [other_ad.id]
+            assert list(await db_session.scalars(select(Review.id))) == []
+            assert list(await db_session.scalars(select(Complaint.id))) == []
+
+    finally:
+        async with db_session.begin():
+            await db_session.execute(delete(Review))
+            await db_session.execute(delete(Complaint))
+            await db_session.execute(delete(Advertisement))
+            await db_session.execute(delete(Category))
+            await db_session.execute(delete(User))